@@ -0,0 +1,3 @@
+"""
+오프라인 벤치마크 모음 (네트워크 불필요)
+"""
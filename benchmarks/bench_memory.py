@@ -0,0 +1,111 @@
+"""
+공공데이터 스냅샷 메모리 벤치마크
+response.json() 그대로의 행 dict 목록과 압축 레코드(src.records)의
+메모리 사용량, 전체 훑기 시간, 매칭 색인 구성 시간을 비교
+
+실행:
+    python -m benchmarks.bench_memory --seoul-rows 20000 --gyeonggi-rows 20000
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from src.master_db import split_volatile
+from src.matching import LotMatcher
+from src.records import GyeonggiLot, SeoulLot, SeoulOccupancy
+
+
+def measure(build: Callable[[], Any]) -> Tuple[Any, int]:
+    """
+    build()가 만든 객체가 차지하는 메모리
+
+    Returns:
+        (객체, 바이트 수) - build 중간에 생겼다가 해제된 메모리는 제외
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, current
+
+
+def timed(fn: Callable[[], Any], repeat: int = 5) -> float:
+    """최솟값 기준 실행 시간 (초)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def scan_raw(rows: List[Dict[str, Any]], field: str) -> int:
+    return sum(1 for row in rows if float(row.get(field) or 0) >= 100)
+
+
+def scan_records(rows: List[Any]) -> int:
+    return sum(1 for row in rows if (row.total or 0) >= 100)
+
+
+def report(title: str, rows: int, raw: int, compact: int) -> None:
+    print(f"{title:<22} {rows:>7}행  {raw / 1e6:>8.1f}MB → {compact / 1e6:>7.1f}MB  "
+          f"({compact / raw:.0%}, 행당 {raw / rows:,.0f}B → {compact / rows:,.0f}B)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="공공데이터 스냅샷 메모리 벤치마크")
+    parser.add_argument("--seoul-rows", type=int, default=20000)
+    parser.add_argument("--gyeonggi-rows", type=int, default=20000)
+    args = parser.parse_args()
+
+    from benchmarks.stub_server import ReplayDataset
+
+    dataset = ReplayDataset(seoul_rows=args.seoul_rows, gyeonggi_rows=args.gyeonggi_rows, private_density=0)
+    # 실제 API 응답처럼 행마다 따로 만들어진 문자열을 갖도록 JSON 텍스트에서 다시 파싱
+    seoul_text = json.dumps({"GetParkingInfo": {"row": dataset.seoul_rows}}, ensure_ascii=False)
+    gyeonggi_text = json.dumps({"ParkingPlace": [{}, {"row": dataset.gyeonggi_rows}]}, ensure_ascii=False)
+    del dataset
+
+    def seoul_raw() -> List[Dict[str, Any]]:
+        return json.loads(seoul_text)["GetParkingInfo"]["row"]
+
+    def gyeonggi_raw() -> List[Dict[str, Any]]:
+        return json.loads(gyeonggi_text)["ParkingPlace"][1]["row"]
+
+    print("=" * 78)
+    print("공공데이터 스냅샷 메모리: response.json() 행 dict → 압축 레코드")
+    print("=" * 78)
+
+    seoul_rows, seoul_bytes = measure(seoul_raw)
+    seoul_lots, lots_bytes = measure(lambda: SeoulLot.from_rows(seoul_raw()))
+    occupancy, occupancy_bytes = measure(lambda: SeoulOccupancy.from_rows(split_volatile(seoul_raw())))
+    gyeonggi_rows, gyeonggi_bytes = measure(gyeonggi_raw)
+    gyeonggi_lots, gyeonggi_lots_bytes = measure(lambda: GyeonggiLot.from_rows(gyeonggi_raw()))
+
+    report("서울 기본 정보", len(seoul_rows), seoul_bytes, lots_bytes)
+    report("서울 기본+변동 정보", len(seoul_rows), seoul_bytes, lots_bytes + occupancy_bytes)
+    report("경기 주차장", len(gyeonggi_rows), gyeonggi_bytes, gyeonggi_lots_bytes)
+    total_raw = seoul_bytes + gyeonggi_bytes
+    total_compact = lots_bytes + occupancy_bytes + gyeonggi_lots_bytes
+    print(f"{'합계':<22} {'':>8}  {total_raw / 1e6:>8.1f}MB → {total_compact / 1e6:>7.1f}MB  "
+          f"({total_compact / total_raw:.0%})")
+
+    print("-" * 78)
+    raw_scan = timed(lambda: scan_raw(seoul_rows, "TPKCT"))
+    compact_scan = timed(lambda: scan_records(seoul_lots))
+    print(f"서울 전체 훑기 (주차면 100 이상)   dict {raw_scan * 1000:>7.2f}ms → 레코드 {compact_scan * 1000:>7.2f}ms")
+    raw_index = timed(lambda: LotMatcher(seoul_rows, "PKLT_NM", ("ADDR",), "LAT", "LOT"), repeat=2)
+    compact_index = timed(lambda: LotMatcher(seoul_lots, "PKLT_NM", ("ADDR",), "LAT", "LOT"), repeat=2)
+    print(f"서울 매칭 색인 구성             dict {raw_index * 1000:>7.1f}ms → 레코드 {compact_index * 1000:>7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
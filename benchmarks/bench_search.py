@@ -0,0 +1,155 @@
+"""
+search_nearby_parking 오프라인 재생 벤치마크
+스텁 서버를 띄우고 API 클라이언트를 스텁으로 돌린 뒤, 동시 실행 수별
+지연 시간 분포(p50/p95/p99)와 API별 요청 수를 측정
+
+실행:
+    python -m benchmarks.bench_search --requests 200 --concurrency 1,4,16 \\
+        --latency-ms 30 --jitter-ms 20
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """선형 보간 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+@contextmanager
+def configure_environment(stub_url: str) -> Iterator[None]:
+    """
+    서버 모듈을 import하기 전에 들어가 모든 클라이언트가 스텁을 바라보도록 설정
+
+    벤치마크가 끝나면 환경변수와 클라이언트 BASE_URL을 원래대로 되돌립니다.
+
+    Args:
+        stub_url: 스텁 서버 URL
+    """
+    from src.api_clients import GyeonggiDataClient, KakaoLocalClient, SeoulDataClient
+
+    # 실행 간 결과가 섞이지 않도록 주소 캐시와 기본 정보 DB는 메모리만 사용
+    overrides = {"GEOCODE_CACHE_PATH": "", "MASTER_DB_PATH": ""}
+    for name in ("KAKAO_REST_API_KEY", "SEOUL_DATA_API_KEY", "GYEONGGI_DATA_API_KEY"):
+        overrides[name] = os.environ.get(name, "bench")
+    saved_env = {name: os.environ.get(name) for name in overrides}
+    clients = (KakaoLocalClient, SeoulDataClient, GyeonggiDataClient)
+    saved_urls = [client.BASE_URL for client in clients]
+
+    os.environ.update(overrides)
+    for client in clients:
+        client.BASE_URL = stub_url
+    try:
+        yield
+    finally:
+        for client, url in zip(clients, saved_urls):
+            client.BASE_URL = url
+        for name, value in saved_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+async def run_level(
+    tool,
+    addresses: List[str],
+    requests: int,
+    concurrency: int
+) -> Dict[str, Any]:
+    """
+    동시 실행 수 하나에 대한 측정
+
+    Returns:
+        지연 시간 목록(초), 전체 소요 시간, 결과 주차장 수
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    parkings = 0
+
+    async def one(i: int) -> None:
+        nonlocal parkings
+        async with semaphore:
+            start = time.perf_counter()
+            result = await tool(addresses[i % len(addresses)])
+            latencies.append(time.perf_counter() - start)
+            parkings += result.get("count", 0)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    return {
+        "latencies": latencies,
+        "elapsed": time.perf_counter() - started,
+        "parkings": parkings,
+    }
+
+
+def format_counts(counts) -> str:
+    return ", ".join(f"{route}={count}" for route, count in sorted(counts.items())) or "-"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="search_nearby_parking 오프라인 벤치마크")
+    parser.add_argument("--requests", type=int, default=200, help="동시 실행 수별 요청 수")
+    parser.add_argument("--concurrency", default="1,4,16", help="쉼표로 구분한 동시 실행 수 목록")
+    parser.add_argument("--addresses", type=int, default=50, help="서로 다른 주소 수")
+    parser.add_argument("--latency-ms", type=float, default=30.0, help="스텁 기본 지연 (ms)")
+    parser.add_argument("--jitter-ms", type=float, default=20.0, help="스텁 지연 흔들림 (ms)")
+    parser.add_argument("--seoul-rows", type=int, default=2500)
+    parser.add_argument("--gyeonggi-rows", type=int, default=1500)
+    args = parser.parse_args()
+
+    from benchmarks.stub_server import ReplayDataset, StubServer
+
+    dataset = ReplayDataset(seoul_rows=args.seoul_rows, gyeonggi_rows=args.gyeonggi_rows)
+    stub = StubServer(dataset, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms).start()
+    with configure_environment(stub.url):
+        import src.server as server
+
+        addresses = [f"서울 벤치구 벤치로 {i}" for i in range(args.addresses)]
+        levels = [int(level) for level in args.concurrency.split(",") if level.strip()]
+
+        print("=" * 78)
+        print("search_nearby_parking 오프라인 벤치마크")
+        print(f"스텁 지연 {args.latency_ms:.0f}ms + 0~{args.jitter_ms:.0f}ms, "
+              f"서울 {args.seoul_rows}건 / 경기 {args.gyeonggi_rows}건, 주소 {args.addresses}개")
+        print("=" * 78)
+
+        try:
+            before = stub.snapshot_counts()
+            start = time.perf_counter()
+            asyncio.run(server.search_nearby_parking(addresses[0]))
+            cold = time.perf_counter() - start
+            print(f"[콜드 스타트] {cold * 1000:.1f}ms, 요청: {format_counts(stub.snapshot_counts() - before)}")
+            print("-" * 78)
+            print(f"{'동시':>4} {'요청':>6} {'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9} {'req/s':>8}  upstream 요청 수")
+
+            for concurrency in levels:
+                before = stub.snapshot_counts()
+                result = asyncio.run(run_level(server.search_nearby_parking, addresses, args.requests, concurrency))
+                counts = stub.snapshot_counts() - before
+                latencies = result["latencies"]
+                print(
+                    f"{concurrency:>4} {len(latencies):>6} "
+                    f"{percentile(latencies, 50) * 1000:>9.1f} "
+                    f"{percentile(latencies, 95) * 1000:>9.1f} "
+                    f"{percentile(latencies, 99) * 1000:>9.1f} "
+                    f"{len(latencies) / result['elapsed']:>8.1f}  {format_counts(counts)}"
+                )
+        finally:
+            stub.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,356 @@
+"""
+카카오 / 서울 열린데이터 / 경기데이터드림 응답 재생 스텁 서버
+fixtures/ 의 응답 형식을 바탕으로 결정적인(seed 고정) 데이터셋을 만들어
+실제 API와 같은 경로/페이지 규칙으로 응답하고, 지연/흔들림을 흉내 냄
+
+단독 실행:
+    python -m benchmarks.stub_server --port 8765 --latency-ms 30 --jitter-ms 20
+"""
+
+import argparse
+import copy
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from src.matching import GridIndex, haversine
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# 서울 / 경기 남부 대략적인 범위 (위도, 경도)
+SEOUL_BBOX = (37.48, 126.90, 37.60, 127.10)
+GYEONGGI_BBOX = (37.25, 126.95, 37.45, 127.20)
+
+_GU = ("종로구", "중구", "용산구", "성동구", "마포구", "강남구", "서초구", "송파구")
+
+
+def _load_fixture(name: str) -> Dict[str, Any]:
+    with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+        return json.load(f)
+
+
+class ReplayDataset:
+    """
+    스텁 서버가 응답할 결정적 데이터셋
+
+    fixtures의 행을 템플릿으로 복제해 서울 공영주차장, 경기 주차장, 카카오 민영 주차장을
+    범위 안에 고르게 배치합니다. 카카오 PK6 검색은 공영 + 민영 주차장에서 반경 검색으로 만듭니다.
+    """
+
+    def __init__(
+        self,
+        seoul_rows: int = 2500,
+        gyeonggi_rows: int = 1500,
+        private_density: float = 60.0,
+        seed: int = 42,
+    ):
+        """
+        Args:
+            seoul_rows: 서울 GetParkingInfo 전체 행 수
+            gyeonggi_rows: 경기 ParkingPlace 전체 행 수
+            private_density: km²당 카카오에만 있는 민영 주차장 수
+            seed: 난수 시드
+        """
+        rng = random.Random(seed)
+        self.address_template = _load_fixture("kakao_address.json")
+        self.keyword_template = _load_fixture("kakao_keyword_pk6.json")
+        seoul_template = _load_fixture("seoul_get_parking_info.json")["GetParkingInfo"]["row"][0]
+        gyeonggi_template = _load_fixture("gyeonggi_parking_place.json")["ParkingPlace"][1]["row"][0]
+
+        self.seoul_rows: List[Dict[str, Any]] = []
+        for i in range(seoul_rows):
+            lat, lng = self._random_point(rng, SEOUL_BBOX)
+            gu = _GU[i % len(_GU)]
+            row = dict(seoul_template)
+            row.update({
+                "PKLT_CD": str(1000000 + i),
+                "PKLT_NM": f"{gu[:-1]}{i}번 공영주차장(구)",
+                "ADDR": f"{gu} 벤치동 {i}-0",
+                "TPKCT": float(rng.randint(20, 600)),
+                "NOW_PRK_VHCL_CNT": 0.0,
+                "LAT": round(lat, 6),
+                "LOT": round(lng, 6),
+            })
+            row["NOW_PRK_VHCL_CNT"] = float(rng.randint(0, int(row["TPKCT"])))
+            self.seoul_rows.append(row)
+
+        self.gyeonggi_rows: List[Dict[str, Any]] = []
+        for i in range(gyeonggi_rows):
+            lat, lng = self._random_point(rng, GYEONGGI_BBOX)
+            row = dict(gyeonggi_template)
+            row.update({
+                "PARKPLC_MANAGE_NO": f"135-2-{i:06d}",
+                "PARKPLC_NM": f"경기{i}번 공영주차장",
+                "LOCPLC_ROADNM_ADDR": f"경기도 성남시 분당구 벤치로 {i}",
+                "LOCPLC_LOTNO_ADDR": f"경기도 성남시 분당구 벤치동 {i}",
+                "PARKNG_COMPRT_PLANE_CNT": str(rng.randint(20, 600)),
+                "REFINE_WGS84_LAT": f"{lat:.6f}",
+                "REFINE_WGS84_LOGT": f"{lng:.6f}",
+            })
+            self.gyeonggi_rows.append(row)
+
+        # 카카오 PK6 문서: 공영주차장(이름 표기만 다름) + 민영 주차장
+        document_template = self.keyword_template["documents"][0]
+        self.kakao_documents: List[Dict[str, Any]] = []
+        for row in self.seoul_rows:
+            self.kakao_documents.append(self._kakao_document(
+                document_template, row["PKLT_CD"], row["PKLT_NM"].replace(" ", ""),
+                f"서울 {row['ADDR']}", row["LAT"], row["LOT"],
+            ))
+        for row in self.gyeonggi_rows:
+            self.kakao_documents.append(self._kakao_document(
+                document_template, row["PARKPLC_MANAGE_NO"], row["PARKPLC_NM"],
+                row["LOCPLC_LOTNO_ADDR"].replace("경기도", "경기"),
+                float(row["REFINE_WGS84_LAT"]), float(row["REFINE_WGS84_LOGT"]),
+            ))
+        for bbox, region in ((SEOUL_BBOX, "서울 강남구"), (GYEONGGI_BBOX, "경기 성남시 분당구")):
+            count = int(private_density * self._area_km2(bbox))
+            for i in range(count):
+                lat, lng = self._random_point(rng, bbox)
+                self.kakao_documents.append(self._kakao_document(
+                    document_template, f"p{len(self.kakao_documents)}", f"민영{i}빌딩 주차장",
+                    f"{region} 벤치동 {i}", lat, lng,
+                ))
+        self.kakao_index = GridIndex(self.kakao_documents, "y", "x", cell_size_m=500)
+
+    @staticmethod
+    def _random_point(rng: random.Random, bbox: Tuple[float, float, float, float]) -> Tuple[float, float]:
+        return rng.uniform(bbox[0], bbox[2]), rng.uniform(bbox[1], bbox[3])
+
+    @staticmethod
+    def _area_km2(bbox: Tuple[float, float, float, float]) -> float:
+        height = haversine(bbox[0], bbox[1], bbox[2], bbox[1]) / 1000
+        width = haversine(bbox[0], bbox[1], bbox[0], bbox[3]) / 1000
+        return height * width
+
+    @staticmethod
+    def _kakao_document(template, place_id, name, address, lat, lng) -> Dict[str, Any]:
+        document = dict(template)
+        document.update({
+            "id": str(place_id),
+            "place_name": name,
+            "address_name": address,
+            "road_address_name": "",
+            "place_url": f"http://place.map.kakao.com/{place_id}",
+            "x": f"{lng:.6f}",
+            "y": f"{lat:.6f}",
+        })
+        return document
+
+    def geocode(self, query: str) -> Dict[str, Any]:
+        """주소 문자열 해시로 서울 범위 안의 고정 좌표를 만들어 응답"""
+        digest = hashlib.md5(query.encode("utf-8")).digest()
+        lat = SEOUL_BBOX[0] + (SEOUL_BBOX[2] - SEOUL_BBOX[0]) * digest[0] / 255
+        lng = SEOUL_BBOX[1] + (SEOUL_BBOX[3] - SEOUL_BBOX[1]) * digest[1] / 255
+        response = copy.deepcopy(self.address_template)
+        document = response["documents"][0]
+        document["address_name"] = query
+        document["x"], document["y"] = f"{lng:.9f}", f"{lat:.9f}"
+        return response
+
+    def keyword(self, params: Dict[str, str]) -> Dict[str, Any]:
+        """카카오 키워드 검색 (PK6, 반경, 페이지 규칙 재현)"""
+        page = int(params.get("page", 1))
+        size = int(params.get("size", 15))
+        x, y = float(params.get("x", 0)), float(params.get("y", 0))
+        radius = float(params.get("radius", 20000))
+        return self._kakao_page(self.kakao_index.within(y, x, radius), page, size)
+
+    def category(self, params: Dict[str, str]) -> Dict[str, Any]:
+        """카카오 카테고리 검색 (rect 또는 중심 좌표 + 반경)"""
+        page = int(params.get("page", 1))
+        size = int(params.get("size", 15))
+        if params.get("rect"):
+            west, south, east, north = (float(v) for v in params["rect"].split(","))
+            center_lat, center_lng = (south + north) / 2, (west + east) / 2
+            found = [
+                (distance, document)
+                for distance, document in self.kakao_index.within(
+                    center_lat, center_lng, haversine(south, west, north, east) / 2 + 1
+                )
+                if south <= float(document["y"]) <= north and west <= float(document["x"]) <= east
+            ]
+            # 중심 좌표 없이 rect만 주면 카카오는 distance를 빈 값으로 응답
+            return self._kakao_page(found, page, size, with_distance=False)
+
+        found = self.kakao_index.within(
+            float(params.get("y", 0)), float(params.get("x", 0)), float(params.get("radius", 20000))
+        )
+        return self._kakao_page(found, page, size)
+
+    def _kakao_page(
+        self,
+        found: List[Tuple[float, Dict[str, Any]]],
+        page: int,
+        size: int,
+        with_distance: bool = True
+    ) -> Dict[str, Any]:
+        """거리순 결과에 카카오 페이지 규칙 (최대 45페이지) 적용"""
+        pageable = min(len(found), 45 * size)
+        start = (page - 1) * size
+        documents = []
+        for distance, document in found[start:min(start + size, pageable)]:
+            document = dict(document)
+            document["distance"] = str(int(distance)) if with_distance else ""
+            documents.append(document)
+
+        response = copy.deepcopy(self.keyword_template)
+        response["documents"] = documents
+        response["meta"].update({
+            "total_count": len(found),
+            "pageable_count": pageable,
+            "is_end": start + size >= pageable,
+        })
+        return response
+
+    def seoul_page(self, start: int, end: int) -> Dict[str, Any]:
+        """서울 GetParkingInfo /{시작}/{종료} 구간 응답"""
+        return {
+            "GetParkingInfo": {
+                "list_total_count": len(self.seoul_rows),
+                "RESULT": {"CODE": "INFO-000", "MESSAGE": "정상 처리되었습니다"},
+                "row": self.seoul_rows[start - 1:end],
+            }
+        }
+
+    def gyeonggi_page(self, page: int, size: int) -> Dict[str, Any]:
+        """경기 ParkingPlace pIndex/pSize 페이지 응답"""
+        start = (page - 1) * size
+        return {
+            "ParkingPlace": [
+                {"head": [
+                    {"list_total_count": len(self.gyeonggi_rows)},
+                    {"RESULT": {"CODE": "INFO-000", "MESSAGE": "정상 처리되었습니다."}},
+                    {"api_version": "1.0"},
+                ]},
+                {"row": self.gyeonggi_rows[start:start + size]},
+            ]
+        }
+
+
+class StubServer:
+    """
+    ReplayDataset을 실제 API 경로로 응답하는 HTTP 서버
+
+    요청마다 latency_ms + [0, jitter_ms) 만큼 지연시키고, 경로별 요청 수를 셉니다.
+    """
+
+    def __init__(
+        self,
+        dataset: ReplayDataset,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        seed: int = 7,
+    ):
+        self.dataset = dataset
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.counts: Counter = Counter()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def snapshot_counts(self) -> Counter:
+        with self._lock:
+            return Counter(self.counts)
+
+    def _delay(self) -> float:
+        with self._lock:
+            jitter = self._rng.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0
+        return max(0.0, self.latency_ms + jitter) / 1000
+
+    def _route(self, path: str, params: Dict[str, str]) -> Tuple[str, Optional[Dict[str, Any]]]:
+        if path == "/v2/local/search/address.json":
+            return "kakao.address", self.dataset.geocode(params.get("query", ""))
+        if path == "/v2/local/search/keyword.json":
+            return "kakao.keyword", self.dataset.keyword(params)
+        if path == "/v2/local/search/category.json":
+            return "kakao.category", self.dataset.category(params)
+        if path == "/ParkingPlace":
+            return "gyeonggi.parking_place", self.dataset.gyeonggi_page(
+                int(params.get("pIndex", 1)), int(params.get("pSize", 100))
+            )
+        parts = path.strip("/").split("/")
+        # /{인증키}/json/GetParkingInfo/{시작}/{종료}
+        if len(parts) == 5 and parts[2] == "GetParkingInfo":
+            return "seoul.get_parking_info", self.dataset.seoul_page(int(parts[3]), int(parts[4]))
+        return "unknown", None
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                params = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+                route, body = server._route(parsed.path, params)
+                with server._lock:
+                    server.counts[route] += 1
+                time.sleep(server._delay())
+
+                if body is None:
+                    payload = b'{"message": "not found"}'
+                    self.send_response(404)
+                else:
+                    payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+                    self.send_response(200)
+                self.send_header("Content-Type", "application/json;charset=UTF-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="주차장 API 재생 스텁 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=30.0)
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--seoul-rows", type=int, default=2500)
+    parser.add_argument("--gyeonggi-rows", type=int, default=1500)
+    args = parser.parse_args()
+
+    dataset = ReplayDataset(seoul_rows=args.seoul_rows, gyeonggi_rows=args.gyeonggi_rows)
+    server = StubServer(dataset, args.host, args.port, args.latency_ms, args.jitter_ms).start()
+    print(f"스텁 서버 실행 중: {server.url} (Ctrl+C로 종료)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+"""
+pytest 공통 설정
+- 캐시/DB 파일 경로를 테스트 세션 임시 디렉터리로 돌려 ~/.cache/parking-mcp에 쓰지 않음
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_cache_paths(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("parking-mcp")
+    patch = pytest.MonkeyPatch()
+    patch.setenv("MASTER_DB_PATH", str(directory / "master.sqlite3"))
+    patch.setenv("GEOCODE_CACHE_PATH", str(directory / "geocode.sqlite3"))
+    patch.setenv("RATE_LIMIT_QUOTA_PATH", str(directory / "quota.sqlite3"))
+    patch.setenv("CATALOG_PATH", str(directory / "catalog.sqlite3"))
+    patch.setenv("SHARED_SNAPSHOT_DIR", str(directory / "shared"))
+    yield directory
+    patch.undo()
@@ -13,7 +13,12 @@ setup(
         "fastmcp>=0.1.0",
         "requests>=2.31.0",
         "python-dotenv>=1.0.0",
+        "uvicorn>=0.30.0",
     ],
+    extras_require={
+        # 후보 거리/점수 벡터화 계산 (없으면 순수 Python으로 동작)
+        "fast": ["numpy>=1.21"],
+    },
     entry_points={
         "console_scripts": [
             "parking-mcp=src.server:main",
@@ -5,11 +5,37 @@ API 클라이언트 모듈
 from src.api_clients.seoul_data import SeoulDataClient
 from src.api_clients.gyeonggi_data import GyeonggiDataClient
 from src.api_clients.kakao_local import KakaoLocalClient
+from src.api_clients.circuit_breaker import CircuitOpenError, get_breaker
+from src.api_clients.hedging import HedgePolicy
+from src.api_clients.http import create_session, get_shared_session
+from src.api_clients.rate_limit import (
+    RateLimitError,
+    background_priority,
+    get_limiter,
+    set_default_priority,
+)
+from src.api_clients.async_clients import (
+    AsyncKakaoLocalClient,
+    AsyncRateLimiter,
+    run_blocking,
+)
 
 __all__ = [
     "SeoulDataClient",
     "GyeonggiDataClient",
     "KakaoLocalClient",
+    "create_session",
+    "get_shared_session",
+    "CircuitOpenError",
+    "get_breaker",
+    "HedgePolicy",
+    "RateLimitError",
+    "background_priority",
+    "get_limiter",
+    "set_default_priority",
+    "AsyncKakaoLocalClient",
+    "AsyncRateLimiter",
+    "run_blocking",
 ]
 
 
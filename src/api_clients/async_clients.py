@@ -0,0 +1,118 @@
+"""
+비동기 API 클라이언트
+동기 클라이언트를 전용 스레드 풀에서 실행해 이벤트 루프를 막지 않도록 감싼 버전
+"""
+
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from dotenv import load_dotenv
+
+from src.api_clients.kakao_local import KakaoLocalClient
+
+load_dotenv()
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=int(os.getenv("ASYNC_MAX_WORKERS", "16")),
+                thread_name_prefix="parking-io",
+            )
+        return _executor
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    블로킹 함수를 I/O 전용 스레드 풀에서 실행
+
+    Args:
+        func: 실행할 함수
+        *args, **kwargs: 함수 인자
+
+    Returns:
+        함수 반환값
+    """
+    loop = asyncio.get_running_loop()
+    # run_in_executor는 contextvars를 넘기지 않으므로 호출한 쪽 컨텍스트(외부 API 우선순위 등)를 복사해 실행
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(_get_executor(), functools.partial(context.run, func, *args, **kwargs))
+
+
+class AsyncRateLimiter:
+    """
+    초당 요청 수 제한기 (이벤트 루프 내 코루틴 간 공유)
+
+    acquire() 호출 간격이 1/qps 초 이상이 되도록 대기시킵니다.
+    """
+
+    def __init__(self, qps: float):
+        """
+        Args:
+            qps: 초당 최대 요청 수 (0 이하이면 제한 없음)
+        """
+        self.interval = 1.0 / qps if qps > 0 else 0.0
+        self._next_at = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self) -> None:
+        """다음 요청 가능 시점까지 대기"""
+        if self.interval <= 0:
+            return
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class AsyncKakaoLocalClient:
+    """카카오 로컬 API 비동기 클라이언트"""
+
+    def __init__(self, client: Optional[KakaoLocalClient] = None):
+        """
+        Args:
+            client: 감쌀 동기 클라이언트 (없으면 새로 생성)
+        """
+        self.client = client or KakaoLocalClient()
+
+    async def address_to_coordinates(self, address: str) -> Dict:
+        """주소를 좌표로 변환 (KakaoLocalClient.address_to_coordinates 참고)"""
+        return await run_blocking(self.client.address_to_coordinates, address)
+
+    async def search_place(self, query: str, **kwargs: Any) -> Dict:
+        """장소 검색 (KakaoLocalClient.search_place 참고)"""
+        return await run_blocking(self.client.search_place, query, **kwargs)
+
+    async def search_category(self, category_group_code: str, **kwargs: Any) -> Dict:
+        """카테고리로 장소 검색 (KakaoLocalClient.search_category 참고)"""
+        return await run_blocking(self.client.search_category, category_group_code, **kwargs)
+
+    async def search_parking_nearby(
+        self,
+        latitude: float,
+        longitude: float,
+        radius: int = 2000,
+        page: int = 1,
+        size: int = 15
+    ) -> Dict:
+        """주변 주차장 검색 (KakaoLocalClient.search_parking_nearby 참고)"""
+        return await run_blocking(
+            self.client.search_parking_nearby, latitude, longitude, radius, page, size
+        )
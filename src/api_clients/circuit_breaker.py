@@ -0,0 +1,220 @@
+"""
+외부 API별 회로 차단기 (circuit breaker)
+연속 실패(타임아웃, 연결 실패, 5xx)가 쌓이면 회로를 열어 일정 시간 호출 없이 바로 실패시키고,
+그 뒤 시험 요청(half-open) 하나가 성공하면 다시 닫음. 원천 API가 죽어 있는 동안
+조회마다 타임아웃을 기다리지 않고 마지막 스냅샷/캐시로 응답하기 위함
+"""
+
+import functools
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from src import metrics
+from src.api_clients.rate_limit import RateLimitError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+CIRCUIT_REJECTED = "parking_circuit_rejected_total"
+CIRCUIT_TRANSITIONS = "parking_circuit_transitions_total"
+
+# 지표용 상태 값
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(ConnectionError):
+    """회로가 열려 있어 원천 API를 호출하지 않고 실패"""
+
+    def __init__(self, upstream: str, retry_after: float):
+        super().__init__(f"{upstream} API가 응답하지 않아 {retry_after:.0f}초 동안 호출을 멈췄습니다.")
+        self.upstream = upstream
+        self.retry_after = retry_after
+
+
+def _is_upstream_failure(error: BaseException) -> bool:
+    # 타임아웃/연결 실패/5xx(ConnectionError)만 원천 API 장애로 봄
+    # (4xx, 응답 형식 오류, 호출 한도 초과는 원천 API가 살아 있다는 뜻)
+    return isinstance(error, (TimeoutError, ConnectionError))
+
+
+class CircuitBreaker:
+    """
+    외부 API 하나의 회로 차단기
+
+    닫힘: 모든 호출 통과, 연속 실패가 failure_threshold에 닿으면 열림
+    열림: reset_timeout초 동안 호출하지 않고 CircuitOpenError
+    반열림: 시험 요청 half_open_max건만 통과, 성공하면 닫힘, 실패하면 다시 열림
+    """
+
+    def __init__(
+        self,
+        upstream: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_max: int = 1,
+    ):
+        """
+        Args:
+            upstream: 외부 API 이름 (예: "gyeonggi")
+            failure_threshold: 회로를 여는 연속 실패 수
+            reset_timeout: 열린 뒤 시험 요청까지 기다리는 시간 (초)
+            half_open_max: 반열림 상태에서 동시에 보낼 시험 요청 수
+        """
+        self.upstream = upstream
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.half_open_max = max(1, half_open_max)
+
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """현재 상태 (열린 지 reset_timeout이 지났으면 반열림으로 보고)"""
+        with self._lock:
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                return HALF_OPEN
+            return self._state
+
+    def before_call(self) -> None:
+        """
+        호출 허용 확인
+
+        Raises:
+            CircuitOpenError: 회로가 열려 있거나 시험 요청이 이미 진행 중
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return
+            now = time.monotonic()
+            if self._state == OPEN:
+                remaining = self.reset_timeout - (now - self._opened_at)
+                if remaining > 0:
+                    self._reject(remaining)
+                self._transition(HALF_OPEN)
+            if self._probes >= self.half_open_max:
+                self._reject(self.reset_timeout)
+            self._probes += 1
+
+    def on_success(self) -> None:
+        """원천 API가 응답함 (반열림이면 닫음)"""
+        with self._lock:
+            self._failures = 0
+            if self._state == HALF_OPEN:
+                self._probes = max(0, self._probes - 1)
+                self._transition(CLOSED)
+
+    def on_failure(self, error: BaseException) -> None:
+        """
+        호출 실패 기록
+
+        Args:
+            error: 발생한 예외 (원천 API 장애가 아닌 예외는 성공과 같이 처리)
+        """
+        if not _is_upstream_failure(error):
+            self.on_success()
+            return
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._probes = max(0, self._probes - 1)
+                self._open()
+                return
+            self._failures += 1
+            if self._state == CLOSED and self._failures >= self.failure_threshold:
+                self._open()
+
+    def release(self) -> None:
+        """결과 판정 없이 끝난 호출 (예: 속도 제한으로 보내지 못함) - 시험 요청 자리만 반납"""
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._probes = max(0, self._probes - 1)
+
+    def _open(self) -> None:
+        self._opened_at = time.monotonic()
+        self._failures = 0
+        self._transition(OPEN)
+
+    def _transition(self, state: str) -> None:
+        if state != self._state:
+            self._state = state
+            if state != HALF_OPEN:
+                self._probes = 0
+            metrics.registry.counter(CIRCUIT_TRANSITIONS, "회로 차단기 상태 전환 수").inc(
+                upstream=self.upstream, state=state
+            )
+
+    def _reject(self, retry_after: float) -> None:
+        metrics.registry.counter(CIRCUIT_REJECTED, "회로가 열려 호출 없이 실패시킨 요청 수").inc(
+            upstream=self.upstream
+        )
+        raise CircuitOpenError(self.upstream, retry_after)
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(upstream: str) -> CircuitBreaker:
+    """
+    외부 API별 프로세스 전역 회로 차단기 (환경변수 설정으로 최초 1회 생성)
+
+    CIRCUIT_FAILURE_THRESHOLD: 회로를 여는 연속 실패 수
+    CIRCUIT_RESET_TIMEOUT: 열린 뒤 시험 요청까지 기다리는 시간 (초)
+    """
+    with _breakers_lock:
+        if upstream not in _breakers:
+            _breakers[upstream] = CircuitBreaker(
+                upstream,
+                failure_threshold=int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5")),
+                reset_timeout=float(os.getenv("CIRCUIT_RESET_TIMEOUT", "30")),
+            )
+        return _breakers[upstream]
+
+
+def breaker_states() -> Dict[str, float]:
+    """외부 API별 회로 상태 (0 닫힘, 1 반열림, 2 열림, 지표 수집용)"""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.upstream: _STATE_VALUES[breaker.state] for breaker in breakers}
+
+
+def circuit_breaker(upstream: str) -> Callable:
+    """
+    API 클라이언트 _make_request 회로 차단 데코레이터
+
+    속도 제한보다 바깥에 두어 회로가 열려 있는 동안은 호출 예산도 쓰지 않습니다.
+    CIRCUIT_BREAKER=0이면 사용하지 않습니다.
+
+    Args:
+        upstream: 외부 API 이름 (예: "kakao", "seoul", "gyeonggi")
+    """
+    def decorator(func: Callable) -> Callable:
+        if os.getenv("CIRCUIT_BREAKER", "1") == "0":
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            breaker = get_breaker(upstream)
+            breaker.before_call()
+            try:
+                result = func(*args, **kwargs)
+            except RateLimitError:
+                # 호출 한도 초과(보내지 못했거나 429)는 원천 API 장애가 아님
+                breaker.release()
+                raise
+            except Exception as e:
+                breaker.on_failure(e)
+                raise
+            except BaseException:
+                breaker.release()
+                raise
+            breaker.on_success()
+            return result
+        return wrapper
+    return decorator
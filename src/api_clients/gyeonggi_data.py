@@ -3,11 +3,21 @@
 경기도 실시간 주차 정보
 """
 
+import contextvars
+import functools
 import os
+import math
 import requests
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from dotenv import load_dotenv
 
+from src.api_clients.circuit_breaker import circuit_breaker
+from src.api_clients.http import get_shared_session
+from src.api_clients.rate_limit import RateLimitError, parse_retry_after, rate_limited
+from src.api_clients.singleflight import coalesce_requests
+from src.metrics import instrument_upstream
+
 load_dotenv()
 
 
@@ -16,10 +26,18 @@ class GyeonggiDataClient:
     
     BASE_URL = "https://openapi.gg.go.kr"
     
-    def __init__(self, api_key: Optional[str] = None):
+    # 경기데이터드림 API는 한 번에 최대 1000건까지 조회 가능
+    MAX_PAGE_SIZE = 1000
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        session: Optional[requests.Session] = None
+    ):
         """
         Args:
             api_key: 경기데이터드림 API 키 (없으면 환경변수에서 로드)
+            session: HTTP 세션 (없으면 프로세스 전역 커넥션 풀 사용)
         """
         self.api_key = api_key or os.getenv("GYEONGGI_DATA_API_KEY")
         if not self.api_key:
@@ -27,7 +45,12 @@ class GyeonggiDataClient:
                 "GYEONGGI_DATA_API_KEY가 설정되지 않았습니다. "
                 ".env 파일에 GYEONGGI_DATA_API_KEY를 추가하세요."
             )
+        self.session = session or get_shared_session()
     
+    @coalesce_requests("gyeonggi")
+    @circuit_breaker("gyeonggi")
+    @rate_limited("gyeonggi")
+    @instrument_upstream("gyeonggi")
     def _make_request(
         self,
         endpoint: str,
@@ -47,6 +70,8 @@ class GyeonggiDataClient:
         
         Raises:
             ValueError: API 키가 없거나 잘못된 경우
+            RateLimitError: 호출 한도 초과 (속도 제한, 일일 할당량, 429 응답)
+            CircuitOpenError: 연속 실패로 회로가 열려 호출하지 않음
             requests.exceptions.RequestException: HTTP 에러
             TimeoutError: 타임아웃 발생
         """
@@ -54,7 +79,7 @@ class GyeonggiDataClient:
         params["KEY"] = self.api_key
         
         try:
-            response = requests.get(url, params=params, timeout=timeout)
+            response = self.session.get(url, params=params, timeout=timeout)
             response.raise_for_status()
             
             # 빈 응답 체크
@@ -84,6 +109,11 @@ class GyeonggiDataClient:
                 raise ValueError("API 접근이 거부되었습니다.")
             elif e.response.status_code == 404:
                 raise ValueError("요청한 API 엔드포인트를 찾을 수 없습니다.")
+            elif e.response.status_code == 429:
+                raise RateLimitError(
+                    "API 호출 한도를 초과했습니다. 잠시 후 다시 시도하세요.",
+                    retry_after=parse_retry_after(e.response.headers.get("Retry-After")),
+                )
             elif 400 <= e.response.status_code < 500:
                 raise ValueError(f"클라이언트 에러 ({e.response.status_code}): {e.response.text}")
             elif 500 <= e.response.status_code < 600:
@@ -122,6 +152,80 @@ class GyeonggiDataClient:
         
         return self._make_request(endpoint, params)
     
+    @staticmethod
+    def _parse_parking_place(data: Dict) -> Tuple[int, List[Dict]]:
+        """
+        ParkingPlace 응답에서 전체 건수와 행 목록 추출
+        
+        응답 형식: {"ParkingPlace": [{"head": [{"list_total_count": N}, ...]}, {"row": [...]}]}
+        
+        Args:
+            data: ParkingPlace 응답 데이터
+        
+        Returns:
+            (전체 건수, 행 목록)
+        """
+        places = data.get("ParkingPlace", [])
+        if not isinstance(places, list) or not places:
+            return 0, []
+        
+        total = 0
+        for item in places[0].get("head", []):
+            if "list_total_count" in item:
+                total = int(item["list_total_count"] or 0)
+                break
+        
+        rows = places[1].get("row", []) if len(places) > 1 else []
+        return total, rows
+    
+    def get_all_parking_places(
+        self,
+        page_size: int = MAX_PAGE_SIZE,
+        max_workers: int = 4
+    ) -> Dict:
+        """
+        경기도 주차장 정보 전체 조회 (병렬 페이지 조회)
+        
+        첫 페이지의 head.list_total_count로 전체 페이지 수를 계산한 뒤,
+        나머지 pIndex 페이지를 제한된 워커 풀로 동시에 받아 하나의 목록으로 합칩니다.
+        
+        Args:
+            page_size: 페이지당 결과 수 (최대 1000)
+            max_workers: 동시 요청 수
+        
+        Returns:
+            주차장 정보 (get_realtime_parking_info와 같은 형식, row에 전체 행 포함)
+        """
+        page_size = max(1, min(page_size, self.MAX_PAGE_SIZE))
+        
+        first = self.get_realtime_parking_info(page=1, size=page_size)
+        total, rows = self._parse_parking_place(first.get("data", {}))
+        rows = list(rows)
+        
+        pages = range(2, math.ceil(total / page_size) + 1)
+        if pages:
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                # 작업 스레드도 호출한 쪽의 우선순위(백그라운드 갱신 등)로 속도 제한을 받도록 컨텍스트를 복사해 실행
+                futures = [
+                    executor.submit(
+                        contextvars.copy_context().run,
+                        functools.partial(self.get_realtime_parking_info, page=page, size=page_size),
+                    )
+                    for page in pages
+                ]
+                for future in futures:
+                    rows.extend(self._parse_parking_place(future.result().get("data", {}))[1])
+        
+        return {
+            "status": "success",
+            "data": {
+                "ParkingPlace": [
+                    {"head": [{"list_total_count": total}]},
+                    {"row": rows},
+                ]
+            }
+        }
+    
     def get_parking_availability(
         self,
         parking_id: Optional[str] = None,
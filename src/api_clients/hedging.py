@@ -0,0 +1,193 @@
+"""
+헤지 요청 (hedged request)
+첫 요청이 최근 응답 시간의 p95 안에 끝나지 않으면 같은 요청을 한 번 더 보내고
+먼저 성공한 응답을 사용. 헤지 비율은 요청 수 대비 max_rate로 제한
+"""
+
+import math
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Optional, TypeVar
+
+from src import metrics
+
+T = TypeVar("T")
+
+HEDGED_REQUESTS = "parking_hedged_requests_total"
+
+
+class HedgePolicy:
+    """
+    헤지 시점과 헤지 예산
+
+    최근 window개 요청의 소요 시간에서 percentile 분위수를 헤지 시점으로 씁니다.
+    표본이 min_samples보다 적으면 initial_delay를 씁니다. 요청마다 max_rate만큼
+    예산이 쌓이고(최대 burst) 헤지 1건에 1씩 쓰므로, 헤지는 장기적으로 요청의 max_rate
+    비율을 넘지 않습니다.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        window: int = 200,
+        min_samples: int = 20,
+        initial_delay: float = 1.0,
+        min_delay: float = 0.05,
+        max_rate: float = 0.05,
+        burst: float = 5.0,
+    ):
+        """
+        Args:
+            percentile: 헤지 시점으로 쓸 응답 시간 분위수 (0~1)
+            window: 분위수를 계산할 최근 요청 수
+            min_samples: 분위수를 쓰기 위한 최소 표본 수
+            initial_delay: 표본이 부족할 때의 헤지 시점 (초)
+            min_delay: 헤지 시점 하한 (초, 빠른 응답이 조금 흔들려도 헤지하지 않도록)
+            max_rate: 요청 대비 최대 헤지 비율
+            burst: 한 번에 몰아 쓸 수 있는 최대 헤지 예산
+        """
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_rate = max_rate
+        self.burst = burst
+
+        self._latencies: deque = deque(maxlen=window)
+        self._budget = burst
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        """요청 1건의 소요 시간 기록"""
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def delay(self) -> float:
+        """지금 시작하는 요청의 헤지 시점 (초)"""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return self.initial_delay
+            latencies = sorted(self._latencies)
+        index = min(len(latencies) - 1, max(0, math.ceil(len(latencies) * self.percentile) - 1))
+        return max(self.min_delay, latencies[index])
+
+    def on_request(self) -> None:
+        """요청 1건 시작 (헤지 예산 적립)"""
+        with self._lock:
+            self._budget = min(self.burst, self._budget + self.max_rate)
+
+    def try_spend(self) -> bool:
+        """헤지 예산 1 사용 (부족하면 False)"""
+        with self._lock:
+            if self._budget < 1.0:
+                return False
+            self._budget -= 1.0
+            return True
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=int(os.getenv("HEDGE_MAX_WORKERS", "32")),
+                thread_name_prefix="parking-hedge",
+            )
+        return _executor
+
+
+def hedged_call(
+    fn: Callable[[], T],
+    policy: HedgePolicy,
+    upstream: str,
+    allow_hedge: Optional[Callable[[], bool]] = None,
+) -> T:
+    """
+    fn을 실행하고, 헤지 시점까지 끝나지 않으면 한 번 더 실행해 먼저 성공한 결과 반환
+
+    둘 다 실패하면 첫 요청의 예외를 올립니다. 늦게 끝난 쪽은 버려지며
+    (HTTP 요청은 중간에 취소할 수 없으므로 끝까지 실행된 뒤 연결이 풀로 돌아감),
+    양쪽 모두 소요 시간은 policy에 기록됩니다.
+
+    Args:
+        fn: 실행할 요청 (몇 번 실행해도 같은 결과인 GET 요청)
+        policy: 헤지 시점/예산
+        upstream: 외부 API 이름 (지표 레이블)
+        allow_hedge: 헤지 직전에 부르는 추가 확인 (예: 속도 제한 예산, False면 헤지 생략)
+
+    Returns:
+        fn의 결과
+    """
+    policy.on_request()
+    executor = _get_executor()
+
+    def timed() -> T:
+        start = time.perf_counter()
+        try:
+            return fn()
+        finally:
+            policy.observe(time.perf_counter() - start)
+
+    primary = executor.submit(timed)
+    done, _ = wait([primary], timeout=policy.delay())
+    if done or not policy.try_spend() or (allow_hedge is not None and not allow_hedge()):
+        return primary.result()
+
+    counter = metrics.registry.counter(HEDGED_REQUESTS, "헤지 요청 수 (sent: 보냄, won: 헤지가 먼저 성공)")
+    counter.inc(upstream=upstream, outcome="sent")
+    hedge = executor.submit(timed)
+
+    pending = {primary, hedge}
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        winner = _first_success(done, prefer=primary)
+        if winner is not None:
+            if winner is hedge:
+                counter.inc(upstream=upstream, outcome="won")
+            return winner.result()
+    return primary.result()
+
+
+def _first_success(done, prefer: Future) -> Optional[Future]:
+    # 같은 시점에 둘 다 끝났으면 첫 요청을 우선
+    for future in sorted(done, key=lambda f: f is not prefer):
+        if future.exception() is None:
+            return future
+    return None
+
+
+_policies: Dict[str, Optional[HedgePolicy]] = {}
+_policies_lock = threading.Lock()
+
+
+def get_hedge_policy(upstream: str) -> Optional[HedgePolicy]:
+    """
+    외부 API별 프로세스 전역 헤지 정책 (환경변수 설정으로 최초 1회 생성)
+
+    {UPSTREAM}_HEDGE: 1이면 헤지 사용 (기본값 0)
+    {UPSTREAM}_HEDGE_PERCENTILE: 헤지 시점 분위수
+    {UPSTREAM}_HEDGE_MAX_RATE: 요청 대비 최대 헤지 비율
+    {UPSTREAM}_HEDGE_MIN_DELAY: 헤지 시점 하한 (초)
+
+    Returns:
+        헤지 정책 (사용하지 않으면 None)
+    """
+    with _policies_lock:
+        if upstream not in _policies:
+            prefix = upstream.upper()
+            policy = None
+            if os.getenv(f"{prefix}_HEDGE", "0") == "1":
+                policy = HedgePolicy(
+                    percentile=float(os.getenv(f"{prefix}_HEDGE_PERCENTILE", "0.95")),
+                    max_rate=float(os.getenv(f"{prefix}_HEDGE_MAX_RATE", "0.05")),
+                    min_delay=float(os.getenv(f"{prefix}_HEDGE_MIN_DELAY", "0.05")),
+                )
+            _policies[upstream] = policy
+        return _policies[upstream]
@@ -0,0 +1,78 @@
+"""
+공용 HTTP 세션 (커넥션 풀)
+모든 API 클라이언트가 keep-alive 연결을 재사용하도록 하나의 세션을 공유
+"""
+
+import os
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def create_session(
+    pool_connections: int = 10,
+    pool_maxsize: int = 20,
+    max_retries: int = 2,
+    backoff_factor: float = 0.3
+) -> requests.Session:
+    """
+    커넥션 풀이 설정된 HTTP 세션 생성
+
+    Args:
+        pool_connections: 호스트별 커넥션 풀을 유지할 호스트 수
+        pool_maxsize: 호스트당 최대 유지 연결 수
+        max_retries: 연결 실패/일시적 서버 오류(502, 503, 504) 재시도 횟수
+        backoff_factor: 재시도 간격 계수 (초)
+
+    Returns:
+        requests 세션
+    """
+    retry = Retry(
+        total=max_retries,
+        connect=max_retries,
+        read=0,
+        status=max_retries,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(["GET"]),
+        backoff_factor=backoff_factor,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def get_shared_session() -> requests.Session:
+    """
+    프로세스 전역 HTTP 세션 반환 (환경변수 설정으로 최초 1회 생성)
+
+    HTTP_POOL_CONNECTIONS: 커넥션 풀을 유지할 호스트 수
+    HTTP_POOL_MAXSIZE: 호스트당 최대 유지 연결 수
+    HTTP_MAX_RETRIES: 연결 실패/일시적 서버 오류 재시도 횟수
+    """
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = create_session(
+                pool_connections=int(os.getenv("HTTP_POOL_CONNECTIONS", "10")),
+                pool_maxsize=int(os.getenv("HTTP_POOL_MAXSIZE", "20")),
+                max_retries=int(os.getenv("HTTP_MAX_RETRIES", "2")),
+            )
+        return _shared_session
@@ -8,6 +8,15 @@ import requests
 from typing import Dict, Optional
 from dotenv import load_dotenv
 
+from src.api_clients.circuit_breaker import circuit_breaker
+from src.api_clients.hedging import HedgePolicy, get_hedge_policy, hedged_call
+from src.api_clients.http import get_shared_session
+from src.api_clients.rate_limit import RateLimitError, get_limiter, parse_retry_after, rate_limited
+from src.api_clients.singleflight import coalesce_requests
+from src.metrics import instrument_upstream
+
+from src.cache import GeocodeCache, get_geocode_cache
+
 load_dotenv()
 
 
@@ -16,10 +25,19 @@ class KakaoLocalClient:
     
     BASE_URL = "https://dapi.kakao.com"
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        geocode_cache: Optional[GeocodeCache] = None,
+        session: Optional[requests.Session] = None,
+        hedge: Optional[HedgePolicy] = None
+    ):
         """
         Args:
             api_key: 카카오 REST API 키 (없으면 환경변수에서 로드)
+            geocode_cache: 주소 → 좌표 변환 캐시 (없으면 프로세스 전역 캐시 사용)
+            session: HTTP 세션 (없으면 프로세스 전역 커넥션 풀 사용)
+            hedge: 느린 요청 헤지 정책 (없으면 KAKAO_HEDGE 설정, 기본값 사용 안 함)
         """
         self.api_key = api_key or os.getenv("KAKAO_REST_API_KEY")
         if not self.api_key:
@@ -30,7 +48,24 @@ class KakaoLocalClient:
         self.headers = {
             "Authorization": f"KakaoAK {self.api_key}"
         }
+        self.geocode_cache = geocode_cache or get_geocode_cache()
+        self.session = session or get_shared_session()
+        self.hedge = hedge or get_hedge_policy("kakao")
     
+    def _get(self, url: str, params: Dict, timeout: int) -> requests.Response:
+        """GET 요청 (헤지 정책이 있으면 p95 안에 끝나지 않은 요청을 한 번 더 보냄)"""
+        def send() -> requests.Response:
+            return self.session.get(url, headers=self.headers, params=params, timeout=timeout)
+        
+        if self.hedge is None:
+            return send()
+        # 헤지 요청도 속도 제한/일일 할당량 예산을 쓰며, 예산이 없으면 첫 요청만 기다림
+        return hedged_call(send, self.hedge, "kakao", allow_hedge=get_limiter("kakao").try_acquire)
+    
+    @coalesce_requests("kakao")
+    @circuit_breaker("kakao")
+    @rate_limited("kakao")
+    @instrument_upstream("kakao")
     def _make_request(
         self,
         endpoint: str,
@@ -50,18 +85,15 @@ class KakaoLocalClient:
         
         Raises:
             ValueError: API 키가 없거나 잘못된 경우
+            RateLimitError: 호출 한도 초과 (속도 제한, 일일 할당량, 429 응답)
+            CircuitOpenError: 연속 실패로 회로가 열려 호출하지 않음
             requests.exceptions.RequestException: HTTP 에러
             TimeoutError: 타임아웃 발생
         """
         url = f"{self.BASE_URL}{endpoint}"
         
         try:
-            response = requests.get(
-                url,
-                headers=self.headers,
-                params=params,
-                timeout=timeout
-            )
+            response = self._get(url, params, timeout)
             response.raise_for_status()
             
             # 빈 응답 체크
@@ -90,7 +122,10 @@ class KakaoLocalClient:
             elif e.response.status_code == 404:
                 raise ValueError("요청한 API 엔드포인트를 찾을 수 없습니다.")
             elif e.response.status_code == 429:
-                raise ValueError("API 호출 한도를 초과했습니다. 잠시 후 다시 시도하세요.")
+                raise RateLimitError(
+                    "API 호출 한도를 초과했습니다. 잠시 후 다시 시도하세요.",
+                    retry_after=parse_retry_after(e.response.headers.get("Retry-After")),
+                )
             elif 400 <= e.response.status_code < 500:
                 raise ValueError(f"클라이언트 에러 ({e.response.status_code}): {e.response.text}")
             elif 500 <= e.response.status_code < 600:
@@ -112,18 +147,26 @@ class KakaoLocalClient:
         """
         주소를 좌표로 변환
         
+        같은 주소의 이전 변환 결과가 캐시에 있으면 API를 호출하지 않습니다.
+        
         Args:
             address: 검색할 주소
         
         Returns:
             좌표 정보 (위도, 경도)
         """
+        cached = self.geocode_cache.get(address)
+        if cached is not None:
+            return cached
+        
         endpoint = "/v2/local/search/address.json"
         params = {
             "query": address,
         }
         
-        return self._make_request(endpoint, params)
+        response = self._make_request(endpoint, params)
+        self.geocode_cache.set(address, response)
+        return response
     
     def search_place(
         self,
@@ -133,7 +176,8 @@ class KakaoLocalClient:
         y: Optional[float] = None,
         radius: Optional[int] = None,
         page: int = 1,
-        size: int = 15
+        size: int = 15,
+        sort: Optional[str] = None
     ) -> Dict:
         """
         장소 검색
@@ -146,6 +190,7 @@ class KakaoLocalClient:
             radius: 반경 (미터 단위, 0~20000)
             page: 페이지 번호
             size: 페이지당 결과 수 (1~15)
+            sort: 정렬 기준 ("accuracy" 또는 "distance", 없으면 API 기본값)
         
         Returns:
             장소 검색 결과
@@ -167,6 +212,58 @@ class KakaoLocalClient:
         if radius is not None:
             params["radius"] = radius
         
+        if sort:
+            params["sort"] = sort
+        
+        return self._make_request(endpoint, params)
+    
+    def search_category(
+        self,
+        category_group_code: str,
+        x: Optional[float] = None,
+        y: Optional[float] = None,
+        radius: Optional[int] = None,
+        rect: Optional[str] = None,
+        page: int = 1,
+        size: int = 15,
+        sort: Optional[str] = None
+    ) -> Dict:
+        """
+        카테고리로 장소 검색
+        
+        Args:
+            category_group_code: 카테고리 그룹 코드 (예: "PK6" - 주차장)
+            x: 경도 (중심 좌표)
+            y: 위도 (중심 좌표)
+            radius: 반경 (미터 단위, 0~20000, x/y와 함께 사용)
+            rect: 사각형 범위 ("서 경도,남 위도,동 경도,북 위도")
+            page: 페이지 번호 (1~45)
+            size: 페이지당 결과 수 (1~15)
+            sort: 정렬 기준 ("accuracy" 또는 "distance")
+        
+        Returns:
+            장소 검색 결과
+        """
+        endpoint = "/v2/local/search/category.json"
+        params = {
+            "category_group_code": category_group_code,
+            "page": page,
+            "size": size,
+        }
+        
+        if x is not None and y is not None:
+            params["x"] = x
+            params["y"] = y
+        
+        if radius is not None:
+            params["radius"] = radius
+        
+        if rect:
+            params["rect"] = rect
+        
+        if sort:
+            params["sort"] = sort
+        
         return self._make_request(endpoint, params)
     
     def search_parking_nearby(
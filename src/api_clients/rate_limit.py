@@ -0,0 +1,472 @@
+"""
+외부 API별 요청 속도 제한 및 일일 할당량 집계
+- 토큰 버킷: 초당 요청 수(QPS)와 순간 허용량(burst)을 외부 API별로 제한
+- 일일 할당량: 날짜(한국 표준시)별 호출 수를 SQLite 파일에 누적해 재시작/워커 간에도 유지
+- 우선순위: 도구 호출(interactive)이 백그라운드 갱신(background)보다 먼저 예산을 씀
+  백그라운드 호출은 토큰/할당량의 예비분을 남겨 두고, 대기 중인 도구 호출이 있으면 양보함
+"""
+
+import atexit
+import contextvars
+import functools
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from src import metrics
+
+INTERACTIVE = "interactive"
+BACKGROUND = "background"
+
+# 공공데이터/카카오 일일 할당량은 한국 표준시 자정에 초기화
+KST = timezone(timedelta(hours=9))
+
+RATE_LIMITED = "parking_rate_limited_total"
+
+
+class RateLimitError(ValueError):
+    """호출 한도 초과 (속도 제한 대기 시간 초과, 일일 할당량 소진, 원천 API 429 응답)"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+_priority: contextvars.ContextVar = contextvars.ContextVar("upstream_priority", default=None)
+_default_priority = INTERACTIVE
+
+
+def current_priority() -> str:
+    """현재 실행 흐름의 외부 API 호출 우선순위"""
+    return _priority.get() or _default_priority
+
+
+def set_default_priority(priority: str) -> None:
+    """
+    프로세스 기본 우선순위 설정 (수집/갱신 전용 프로세스는 BACKGROUND)
+
+    Args:
+        priority: INTERACTIVE 또는 BACKGROUND
+    """
+    global _default_priority
+    _default_priority = priority
+
+
+@contextmanager
+def background_priority() -> Iterator[None]:
+    """이 블록 안의 외부 API 호출을 백그라운드 우선순위로 실행"""
+    token = _priority.set(BACKGROUND)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더 (초 단위만 지원, 없거나 형식 오류는 None)"""
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+class DailyQuota:
+    """
+    외부 API별 일일 호출 수 집계
+
+    path가 있으면 SQLite 파일에 누적하므로 재시작 후에도, 같은 파일을 쓰는 워커끼리도
+    하루 사용량을 함께 셉니다. 오래된 날짜는 keep_days만큼만 남깁니다.
+    요청마다 파일 쓰기 잠금을 잡지 않도록 프로세스마다 block건씩 미리 예약해 두고
+    메모리에서 차감하며, 다 쓰면 다음 블록을 예약합니다. 쓰지 않은 예약분은 close()에서 돌려줍니다.
+    """
+
+    def __init__(self, path: Optional[str] = None, keep_days: int = 7, block: int = 20):
+        """
+        Args:
+            path: SQLite 파일 경로 (None이면 메모리에서만 집계)
+            keep_days: 보관할 날짜 수
+            block: 파일에서 한 번에 예약할 호출 수 (1이면 요청마다 기록)
+        """
+        self.path = path
+        self.keep_days = keep_days
+        self.block = max(1, block)
+        self._memory: Dict[tuple, int] = {}
+        # (외부 API, 날짜) -> [예약한 블록 끝의 파일 사용량, 남은 예약 수]
+        self._blocks: Dict[tuple, List[int]] = {}
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pruned_day: Optional[str] = None
+
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # 여러 워커가 같은 파일에 쓰므로 잠금을 잠시 기다림
+            self._conn = sqlite3.connect(path, timeout=5.0, check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS quota ("
+                " upstream TEXT NOT NULL,"
+                " day TEXT NOT NULL,"
+                " used INTEGER NOT NULL,"
+                " PRIMARY KEY (upstream, day))"
+            )
+
+    @staticmethod
+    def today(now: Optional[float] = None) -> str:
+        """할당량 날짜 (한국 표준시 YYYY-MM-DD)"""
+        return datetime.fromtimestamp(time.time() if now is None else now, KST).strftime("%Y-%m-%d")
+
+    def used(self, upstream: str, day: Optional[str] = None) -> int:
+        """
+        하루 사용량 조회
+
+        Args:
+            upstream: 외부 API 이름
+            day: 날짜 (없으면 오늘)
+        """
+        day = day or self.today()
+        with self._lock:
+            if self._conn is None:
+                return self._memory.get((upstream, day), 0)
+            row = self._conn.execute(
+                "SELECT used FROM quota WHERE upstream = ? AND day = ?", (upstream, day)
+            ).fetchone()
+            # 이 프로세스가 예약만 하고 아직 쓰지 않은 호출은 빼고 셈
+            reserved = self._blocks.get((upstream, day), (0, 0))[1]
+            return max(0, (row[0] if row else 0) - reserved)
+
+    def consume(self, upstream: str, limit: int = 0, keep: int = 0) -> int:
+        """
+        하루 사용량 1 증가 (한도를 넘으면 증가하지 않고 예외)
+
+        Args:
+            upstream: 외부 API 이름
+            limit: 일일 한도 (0 이하이면 집계만 하고 제한 없음)
+            keep: 남겨 둘 예비분 (사용량이 limit - keep에 닿으면 거부)
+
+        Returns:
+            증가 후 사용량
+
+        Raises:
+            RateLimitError: 한도 소진
+        """
+        day = self.today()
+        with self._lock:
+            if self._conn is None:
+                used = self._memory.get((upstream, day), 0)
+                self._check(upstream, used, limit, keep)
+                self._memory[(upstream, day)] = used + 1
+                return used + 1
+
+            key = (upstream, day)
+            block = self._blocks.get(key)
+            if block is None or block[1] <= 0:
+                block = self._blocks[key] = self._reserve(upstream, day, limit, keep)
+            # 예약한 블록 안에서 이 호출의 순번으로 한도 확인 (예비분 안쪽 예약은 도구 호출만 씀)
+            used = block[0] - block[1]
+            self._check(upstream, used, limit, keep)
+            block[1] -= 1
+            return used + 1
+
+    def _reserve(self, upstream: str, day: str, limit: int, keep: int) -> List[int]:
+        """파일 사용량에 최대 block건을 더해 예약 (잠금을 잡은 상태에서 호출, 남은 한도가 없으면 예외)"""
+        for stale in [key for key in self._blocks if key[0] == upstream and key[1] != day]:
+            del self._blocks[stale]
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = self._conn.execute(
+                "SELECT used FROM quota WHERE upstream = ? AND day = ?", (upstream, day)
+            ).fetchone()
+            used = row[0] if row else 0
+            self._check(upstream, used, limit, keep)
+            grant = self.block if limit <= 0 else min(self.block, limit - used)
+            self._conn.execute(
+                "INSERT INTO quota (upstream, day, used) VALUES (?, ?, ?)"
+                " ON CONFLICT (upstream, day) DO UPDATE SET used = used + excluded.used",
+                (upstream, day, grant),
+            )
+            if self._pruned_day != day:
+                cutoff = self.today(time.time() - self.keep_days * 86400)
+                self._conn.execute("DELETE FROM quota WHERE day < ?", (cutoff,))
+                self._pruned_day = day
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        return [used + grant, grant]
+
+    @staticmethod
+    def _check(upstream: str, used: int, limit: int, keep: int) -> None:
+        if limit > 0 and used >= limit - keep:
+            raise RateLimitError(f"{upstream} API 일일 호출 한도({limit}회)에 도달했습니다.")
+
+    def close(self) -> None:
+        """쓰지 않은 예약분을 파일에 돌려주고 닫음"""
+        with self._lock:
+            if self._conn is not None:
+                for (upstream, day), (_, reserved) in self._blocks.items():
+                    if reserved > 0:
+                        self._conn.execute(
+                            "UPDATE quota SET used = MAX(0, used - ?) WHERE upstream = ? AND day = ?",
+                            (reserved, upstream, day),
+                        )
+                self._blocks.clear()
+                self._conn.close()
+                self._conn = None
+
+
+class UpstreamLimiter:
+    """
+    외부 API 하나의 속도 제한기 (토큰 버킷 + 일일 할당량 + 우선순위)
+
+    acquire()는 토큰이 생길 때까지 최대 max_wait초 기다린 뒤 일일 할당량을 1 차감합니다.
+    백그라운드 호출은 버킷의 reserve 비율만큼 토큰을 남겨 두고, 도구 호출이 기다리는 중이면
+    양보하며, 일일 할당량도 같은 비율만큼 남으면 더 이상 쓰지 않습니다.
+    """
+
+    def __init__(
+        self,
+        upstream: str,
+        qps: float = 0.0,
+        burst: Optional[float] = None,
+        daily_limit: int = 0,
+        reserve: float = 0.2,
+        max_wait: float = 2.0,
+        background_max_wait: float = 30.0,
+        quota: Optional[DailyQuota] = None,
+    ):
+        """
+        Args:
+            upstream: 외부 API 이름 (예: "kakao")
+            qps: 초당 허용 요청 수 (0 이하이면 속도 제한 없음)
+            burst: 순간 허용량 (버킷 크기, 없으면 qps와 같음, 최소 1)
+            daily_limit: 일일 호출 한도 (0 이하이면 집계만)
+            reserve: 도구 호출용으로 남겨 둘 버킷/일일 할당량 비율 (0~1)
+            max_wait: 도구 호출의 최대 대기 시간 (초)
+            background_max_wait: 백그라운드 호출의 최대 대기 시간 (초)
+            quota: 일일 할당량 집계기 (없으면 메모리 집계)
+        """
+        self.upstream = upstream
+        self.qps = qps
+        self.burst = max(1.0, burst if burst is not None else qps)
+        self.daily_limit = daily_limit
+        self.reserve = min(max(reserve, 0.0), 1.0)
+        self.max_wait = max_wait
+        self.background_max_wait = background_max_wait
+        self.quota = quota or DailyQuota()
+
+        self._tokens = self.burst
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._interactive_waiting = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, priority: Optional[str] = None) -> None:
+        """
+        요청 1건의 예산 확보 (토큰 대기 후 일일 할당량 차감)
+
+        Args:
+            priority: INTERACTIVE 또는 BACKGROUND (없으면 현재 실행 흐름의 우선순위)
+
+        Raises:
+            RateLimitError: 대기 시간 초과 또는 일일 할당량 소진
+        """
+        priority = priority or current_priority()
+        background = priority == BACKGROUND
+        try:
+            self._take_token(background)
+            keep = int(self.daily_limit * self.reserve) if background else 0
+            self.quota.consume(self.upstream, self.daily_limit, keep)
+        except RateLimitError:
+            metrics.registry.counter(RATE_LIMITED, "속도 제한/할당량으로 거부된 외부 API 요청 수").inc(
+                upstream=self.upstream, priority=priority
+            )
+            raise
+
+    def try_acquire(self) -> bool:
+        """
+        기다리지 않고 요청 1건의 예산 확보 (헤지 요청처럼 생략해도 되는 추가 요청용)
+
+        백그라운드 호출과 같은 예비분을 남기고, 도구 호출이 기다리는 중이면 양보합니다.
+
+        Returns:
+            확보 여부
+        """
+        with self._cond:
+            now = time.monotonic()
+            self._refill(now)
+            if now < self._blocked_until or self._interactive_waiting:
+                return False
+            if self.qps > 0:
+                if self._tokens < 1.0 + self.burst * self.reserve:
+                    return False
+                self._tokens -= 1.0
+        try:
+            self.quota.consume(self.upstream, self.daily_limit, int(self.daily_limit * self.reserve))
+        except RateLimitError:
+            return False
+        return True
+
+    def penalize(self, retry_after: Optional[float] = None) -> None:
+        """
+        원천 API가 429로 거부했을 때 호출 (버킷을 비우고 retry_after초 동안 요청 중단)
+
+        Args:
+            retry_after: 원천 API가 알려 준 재시도 대기 시간 (없으면 1/qps, 최소 1초)
+        """
+        pause = retry_after if retry_after is not None else max(1.0, 1.0 / self.qps if self.qps > 0 else 1.0)
+        with self._cond:
+            self._tokens = 0.0
+            self._blocked_until = max(self._blocked_until, time.monotonic() + pause)
+
+    def stats(self) -> Dict[str, float]:
+        """현재 토큰 수, 오늘 사용량/남은 할당량"""
+        with self._cond:
+            self._refill(time.monotonic())
+            tokens = self._tokens
+        used = self.quota.used(self.upstream)
+        stats = {"tokens": tokens, "used_today": float(used)}
+        if self.daily_limit > 0:
+            stats["remaining_today"] = float(max(0, self.daily_limit - used))
+        return stats
+
+    def _refill(self, now: float) -> None:
+        if self.qps > 0:
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.qps)
+        self._updated_at = now
+
+    def _take_token(self, background: bool) -> None:
+        if self.qps <= 0 and not self._blocked_until:
+            return
+        floor = self.burst * self.reserve if background else 0.0
+        deadline = time.monotonic() + (self.background_max_wait if background else self.max_wait)
+        with self._cond:
+            if not background:
+                self._interactive_waiting += 1
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    if now < self._blocked_until:
+                        wait = self._blocked_until - now
+                    elif self.qps <= 0:
+                        return
+                    elif background and self._interactive_waiting:
+                        wait = 1.0 / self.qps
+                    elif self._tokens >= 1.0 + floor:
+                        self._tokens -= 1.0
+                        return
+                    else:
+                        wait = (1.0 + floor - self._tokens) / self.qps
+                    if now + wait > deadline:
+                        raise RateLimitError(
+                            f"{self.upstream} API 호출이 많아 잠시 후 다시 시도해야 합니다.",
+                            retry_after=wait,
+                        )
+                    self._cond.wait(wait)
+            finally:
+                if not background:
+                    self._interactive_waiting -= 1
+                    self._cond.notify_all()
+
+
+# 외부 API별 기본 설정 (초당 요청 수, 순간 허용량) - 환경변수로 변경
+# 기본 (QPS, burst): 카카오 burst는 주변 검색 한 건의 최대 요청 수
+# (주소 변환 1 + 타일 SEARCH_MAX_TILE_FETCHES x SEARCH_MAX_TILE_PAGES + 반경 4단계 x SEARCH_MAX_PAGES = 19)
+# 보다 넉넉히 커서 동시에 들어온 검색 몇 건이 버킷을 바로 비우지 않음
+_DEFAULTS = {
+    "kakao": (20.0, 60.0),
+    "seoul": (5.0, 10.0),
+    "gyeonggi": (5.0, 10.0),
+}
+
+_limiters: Dict[str, UpstreamLimiter] = {}
+_limiters_lock = threading.Lock()
+_quota: Optional[DailyQuota] = None
+
+
+def _default_quota() -> DailyQuota:
+    global _quota
+    if _quota is None:
+        path = os.getenv(
+            "RATE_LIMIT_QUOTA_PATH",
+            os.path.join(os.path.expanduser("~"), ".cache", "parking-mcp", "quota.sqlite3"),
+        )
+        block = int(os.getenv("RATE_LIMIT_QUOTA_BLOCK", "20"))
+        try:
+            _quota = DailyQuota(path or None, block=block)
+        except (OSError, sqlite3.Error):
+            # 디스크에 쓸 수 없는 환경이면 메모리에서만 집계
+            _quota = DailyQuota(None)
+        # 종료할 때 쓰지 않은 예약분을 돌려줌
+        atexit.register(_quota.close)
+    return _quota
+
+
+def get_limiter(upstream: str) -> UpstreamLimiter:
+    """
+    외부 API별 프로세스 전역 속도 제한기 (환경변수 설정으로 최초 1회 생성)
+
+    {UPSTREAM}_QPS: 초당 요청 수 (0이면 제한 없음)
+    {UPSTREAM}_BURST: 순간 허용량
+    {UPSTREAM}_DAILY_QUOTA: 일일 호출 한도 (0이면 집계만)
+    RATE_LIMIT_RESERVE: 도구 호출용 예비 비율
+    RATE_LIMIT_MAX_WAIT / RATE_LIMIT_BACKGROUND_MAX_WAIT: 최대 대기 시간 (초)
+    """
+    with _limiters_lock:
+        if upstream not in _limiters:
+            prefix = upstream.upper()
+            qps, burst = _DEFAULTS.get(upstream, (0.0, 1.0))
+            _limiters[upstream] = UpstreamLimiter(
+                upstream,
+                qps=float(os.getenv(f"{prefix}_QPS", str(qps))),
+                burst=float(os.getenv(f"{prefix}_BURST", str(burst))),
+                daily_limit=int(os.getenv(f"{prefix}_DAILY_QUOTA", "0")),
+                reserve=float(os.getenv("RATE_LIMIT_RESERVE", "0.2")),
+                max_wait=float(os.getenv("RATE_LIMIT_MAX_WAIT", "2")),
+                background_max_wait=float(os.getenv("RATE_LIMIT_BACKGROUND_MAX_WAIT", "30")),
+                quota=_default_quota(),
+            )
+        return _limiters[upstream]
+
+
+def limiter_stats() -> Dict[str, float]:
+    """생성된 속도 제한기별 현재 토큰 수와 오늘 사용량 (지표 수집용)"""
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    stats = {}
+    for limiter in limiters:
+        for key, value in limiter.stats().items():
+            stats[f"{limiter.upstream}_{key}"] = value
+    return stats
+
+
+def rate_limited(upstream: str) -> Callable:
+    """
+    API 클라이언트 _make_request 속도 제한 데코레이터
+
+    실제 요청 전에 외부 API별 예산을 확보하고, 원천 API가 429로 거부하면
+    (RateLimitError) 제한기를 잠시 멈춰 이후 요청이 바로 다시 거부되지 않도록 합니다.
+    coalesce_requests 안쪽에 두어 병합된 요청은 한 번만 셉니다.
+
+    Args:
+        upstream: 외부 API 이름 (예: "kakao", "seoul", "gyeonggi")
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            limiter = get_limiter(upstream)
+            limiter.acquire()
+            try:
+                return func(*args, **kwargs)
+            except RateLimitError as e:
+                limiter.penalize(e.retry_after)
+                raise
+        return wrapper
+    return decorator
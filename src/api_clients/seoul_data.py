@@ -3,11 +3,19 @@
 서울시 실시간 주차 정보
 """
 
+import contextvars
 import os
 import requests
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 from dotenv import load_dotenv
 
+from src.api_clients.circuit_breaker import circuit_breaker
+from src.api_clients.http import get_shared_session
+from src.api_clients.rate_limit import RateLimitError, parse_retry_after, rate_limited
+from src.api_clients.singleflight import coalesce_requests
+from src.metrics import instrument_upstream
+
 load_dotenv()
 
 
@@ -16,10 +24,18 @@ class SeoulDataClient:
     
     BASE_URL = "http://openapi.seoul.go.kr:8088"
     
-    def __init__(self, api_key: Optional[str] = None):
+    # 서울 열린데이터 API는 한 번에 최대 1000건까지 조회 가능
+    MAX_PAGE_SIZE = 1000
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        session: Optional[requests.Session] = None
+    ):
         """
         Args:
             api_key: 서울 열린데이터 API 키 (없으면 환경변수에서 로드)
+            session: HTTP 세션 (없으면 프로세스 전역 커넥션 풀 사용)
         """
         self.api_key = api_key or os.getenv("SEOUL_DATA_API_KEY")
         if not self.api_key:
@@ -27,7 +43,12 @@ class SeoulDataClient:
                 "SEOUL_DATA_API_KEY가 설정되지 않았습니다. "
                 ".env 파일에 SEOUL_DATA_API_KEY를 추가하세요."
             )
+        self.session = session or get_shared_session()
     
+    @coalesce_requests("seoul")
+    @circuit_breaker("seoul")
+    @rate_limited("seoul")
+    @instrument_upstream("seoul")
     def _make_request(
         self,
         endpoint: str,
@@ -47,6 +68,8 @@ class SeoulDataClient:
         
         Raises:
             ValueError: API 키가 없거나 잘못된 경우
+            RateLimitError: 호출 한도 초과 (속도 제한, 일일 할당량, 429 응답)
+            CircuitOpenError: 연속 실패로 회로가 열려 호출하지 않음
             requests.exceptions.RequestException: HTTP 에러
             TimeoutError: 타임아웃 발생
         """
@@ -54,7 +77,7 @@ class SeoulDataClient:
         url = f"{self.BASE_URL}/{self.api_key}{endpoint}"
         
         try:
-            response = requests.get(url, params=params, timeout=timeout)
+            response = self.session.get(url, params=params, timeout=timeout)
             response.raise_for_status()
             
             # 빈 응답 체크
@@ -92,6 +115,11 @@ class SeoulDataClient:
                 raise ValueError("API 접근이 거부되었습니다.")
             elif e.response.status_code == 404:
                 raise ValueError("요청한 API 엔드포인트를 찾을 수 없습니다.")
+            elif e.response.status_code == 429:
+                raise RateLimitError(
+                    "API 호출 한도를 초과했습니다. 잠시 후 다시 시도하세요.",
+                    retry_after=parse_retry_after(e.response.headers.get("Retry-After")),
+                )
             elif 400 <= e.response.status_code < 500:
                 raise ValueError(f"클라이언트 에러 ({e.response.status_code}): {e.response.text}")
             elif 500 <= e.response.status_code < 600:
@@ -127,6 +155,58 @@ class SeoulDataClient:
         
         return self._make_request(endpoint, params)
     
+    def get_all_realtime_parking_info(
+        self,
+        page_size: int = MAX_PAGE_SIZE,
+        max_workers: int = 4
+    ) -> Dict:
+        """
+        서울시 실시간 주차 정보 전체 조회 (병렬 페이지 조회)
+        
+        첫 페이지의 list_total_count로 전체 건수를 확인한 뒤,
+        나머지 구간을 제한된 워커 풀로 동시에 받아 하나의 목록으로 합칩니다.
+        
+        Args:
+            page_size: 요청당 조회 건수 (최대 1000)
+            max_workers: 동시 요청 수
+        
+        Returns:
+            실시간 주차 정보 (get_realtime_parking_info와 같은 형식, row에 전체 행 포함)
+        """
+        page_size = max(1, min(page_size, self.MAX_PAGE_SIZE))
+        
+        first = self.get_realtime_parking_info(1, page_size)
+        info = first.get("data", {}).get("GetParkingInfo", {})
+        total = int(info.get("list_total_count", 0) or 0)
+        rows: List[Dict] = list(info.get("row", []))
+        
+        windows = [
+            (start, min(start + page_size - 1, total))
+            for start in range(page_size + 1, total + 1, page_size)
+        ]
+        if windows:
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                # 작업 스레드도 호출한 쪽의 우선순위(백그라운드 갱신 등)로 속도 제한을 받도록 컨텍스트를 복사해 실행
+                futures = [
+                    executor.submit(contextvars.copy_context().run, self.get_realtime_parking_info, *window)
+                    for window in windows
+                ]
+                # 입력 순서대로 결과를 모으므로 행 순서가 원본과 동일
+                for future in futures:
+                    rows.extend(
+                        future.result().get("data", {}).get("GetParkingInfo", {}).get("row", [])
+                    )
+        
+        return {
+            "status": "success",
+            "data": {
+                "GetParkingInfo": {
+                    "list_total_count": total,
+                    "row": rows,
+                }
+            }
+        }
+    
     def get_parking_availability(
         self,
         parking_code: Optional[str] = None,
@@ -0,0 +1,128 @@
+"""
+동일 요청 병합 (single-flight)
+같은 엔드포인트 + 파라미터로 동시에 들어온 요청을 하나의 실제 호출로 합치고 결과를 공유
+"""
+
+import functools
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from src import metrics
+
+SINGLEFLIGHT_SHARED = "parking_singleflight_shared_total"
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    진행 중인 호출 병합기
+
+    do(key, fn)을 같은 key로 동시에 호출하면 첫 호출만 fn을 실행하고,
+    나머지는 그 결과(또는 예외)를 그대로 받습니다. 호출이 끝나면 key는 바로 해제되므로
+    결과를 캐시하지는 않습니다.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        key 단위로 병합해 fn 실행
+
+        Args:
+            key: 요청 식별자
+            fn: 실제 호출 함수
+
+        Returns:
+            fn의 결과 (병합된 호출은 첫 호출의 결과 공유)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def in_flight(self) -> int:
+        """진행 중인 호출 수"""
+        with self._lock:
+            return len(self._calls)
+
+
+_groups: Dict[str, SingleFlight] = {}
+_groups_lock = threading.Lock()
+
+
+def get_group(upstream: str) -> SingleFlight:
+    """외부 API별 프로세스 전역 병합기"""
+    with _groups_lock:
+        if upstream not in _groups:
+            _groups[upstream] = SingleFlight()
+        return _groups[upstream]
+
+
+def coalesce_requests(upstream: str) -> Callable:
+    """
+    API 클라이언트 _make_request 병합 데코레이터
+
+    같은 API 키, BASE_URL, 엔드포인트, 파라미터로 동시에 들어온 요청을 하나로 합칩니다.
+
+    Args:
+        upstream: 외부 API 이름 (예: "kakao", "seoul", "gyeonggi")
+    """
+    group = get_group(upstream)
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self, endpoint: str, params: Dict, timeout: int = 10) -> Any:
+            key = (
+                self.BASE_URL,
+                getattr(self, "api_key", None),
+                endpoint,
+                tuple(sorted((k, repr(v)) for k, v in params.items())),
+            )
+
+            leader = []
+
+            def call() -> Any:
+                leader.append(True)
+                return func(self, endpoint, params, timeout)
+
+            try:
+                return group.do(key, call)
+            finally:
+                if not leader:
+                    metrics.registry.counter(
+                        SINGLEFLIGHT_SHARED, "병합되어 실제 호출 없이 결과를 공유한 요청 수"
+                    ).inc(upstream=upstream)
+        return wrapper
+    return decorator
@@ -0,0 +1,129 @@
+"""
+HTTP 전송(streamable HTTP / SSE) ASGI 앱
+uvicorn 워커 프로세스마다 이 모듈을 import해 앱을 만들며, 워커끼리는 아무것도 공유하지 않음
+(기본 정보 DB, 마지막 실시간 스냅샷, 카탈로그는 같은 로컬 SQLite 파일에서 읽음)
+워커가 여럿이면 실시간 스냅샷 갱신 프로세스 하나를 띄우고 워커는 공유 스냅샷 파일을 읽음
+
+실행:
+    parking-mcp --transport http --workers 4 --port 8000
+    uvicorn src.asgi:app --workers 4 --port 8000          # 직접 실행 (MCP_TRANSPORT로 전송 방식 선택)
+
+워커 무중단 재시작: 마스터 프로세스에 SIGHUP (워커를 하나씩 종료 후 다시 띄움)
+"""
+
+import os
+import subprocess
+import sys
+from typing import Optional
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse
+
+from src import metrics
+from src import server
+
+# 전송 방식 ("http" = streamable HTTP, "sse")
+TRANSPORTS = ("http", "sse")
+
+
+@server.app.custom_route("/metrics", methods=["GET"], include_in_schema=False)
+async def _metrics(request: Request) -> PlainTextResponse:
+    # 워커별 지표 (워커마다 따로 집계되므로 수집기에서 합산)
+    return PlainTextResponse(
+        metrics.registry.render_prometheus(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+@server.app.custom_route("/healthz", methods=["GET"], include_in_schema=False)
+async def _healthz(request: Request) -> JSONResponse:
+    return JSONResponse({"status": "ok", "pid": os.getpid(), "snapshots": server.snapshot_versions()})
+
+
+def create_app(transport: Optional[str] = None, path: Optional[str] = None):
+    """
+    MCP ASGI 앱 생성
+
+    Args:
+        transport: "http" 또는 "sse" (없으면 MCP_TRANSPORT, 기본값 http)
+        path: MCP 엔드포인트 경로 (없으면 MCP_HTTP_PATH, 기본값 /mcp 또는 /sse)
+
+    Returns:
+        Starlette 앱
+    """
+    transport = transport or os.getenv("MCP_TRANSPORT", "http")
+    if transport not in TRANSPORTS:
+        transport = "http"
+    path = path or os.getenv("MCP_HTTP_PATH") or ("/sse" if transport == "sse" else "/mcp")
+
+    server.warm_up()
+    if transport == "sse":
+        return server.app.http_app(path=path, transport="sse")
+    # 세션을 워커에 묶지 않아야 로드 밸런서가 요청을 아무 워커로나 보낼 수 있음
+    return server.app.http_app(path=path, transport="streamable-http", stateless_http=True)
+
+
+def serve(
+    transport: str = "http",
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    workers: int = 1,
+    path: Optional[str] = None,
+) -> None:
+    """
+    uvicorn으로 HTTP 전송 서버 실행
+
+    Args:
+        transport: "http" 또는 "sse"
+        host: 바인딩 주소
+        port: 포트
+        workers: 워커 프로세스 수 (SSE는 세션이 워커에 묶이므로 1만 허용)
+        path: MCP 엔드포인트 경로
+    """
+    import uvicorn
+
+    if transport not in TRANSPORTS:
+        raise ValueError(f"지원하지 않는 전송 방식입니다: {transport}")
+    if transport == "sse" and workers > 1:
+        raise ValueError("SSE 전송은 세션이 워커에 묶이므로 워커 1개로만 실행할 수 있습니다")
+
+    # 워커 프로세스는 import 문자열로 앱을 다시 만들므로 설정을 환경변수로 넘김
+    os.environ["MCP_TRANSPORT"] = transport
+    if path:
+        os.environ["MCP_HTTP_PATH"] = path
+
+    # 워커가 여럿이면 원천 API 갱신은 별도 프로세스 하나만 하고 워커는 공유 스냅샷을 읽음
+    refresher = None
+    if workers > 1 and "SNAPSHOT_ROLE" not in os.environ and os.getenv("SHARED_SNAPSHOT", "1") != "0":
+        refresher = subprocess.Popen([sys.executable, "-m", "src.shared_snapshot", "refresh"])
+        os.environ["SNAPSHOT_ROLE"] = "reader"
+
+    try:
+        uvicorn.run(
+            "src.asgi:app",
+            host=host,
+            port=port,
+            workers=max(1, workers),
+            timeout_graceful_shutdown=float(os.getenv("MCP_GRACEFUL_TIMEOUT", "30")),
+            log_level=os.getenv("MCP_LOG_LEVEL", "info"),
+        )
+    finally:
+        if refresher is not None:
+            refresher.terminate()
+            try:
+                refresher.wait(10)
+            except subprocess.TimeoutExpired:
+                refresher.kill()
+
+
+_app = None
+
+
+def __getattr__(name: str):
+    # uvicorn이 "src.asgi:app"을 읽을 때 앱 생성 (serve()를 부르는 마스터 프로세스는 만들지 않음)
+    global _app
+    if name == "app":
+        if _app is None:
+            _app = create_app()
+        return _app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
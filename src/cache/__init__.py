@@ -0,0 +1,13 @@
+"""
+캐시 모듈
+"""
+
+from src.cache.geocode_cache import GeocodeCache, get_geocode_cache
+from src.cache.tile_cache import TileCache, get_tile_cache
+
+__all__ = [
+    "GeocodeCache",
+    "get_geocode_cache",
+    "TileCache",
+    "get_tile_cache",
+]
@@ -0,0 +1,238 @@
+"""
+주소 → 좌표 변환 결과 캐시
+메모리 LRU + SQLite 디스크 캐시 (프로세스 재시작 후에도 유지)
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_address_key(address: str) -> str:
+    """
+    캐시 키용 주소 정규화 (유니코드 NFC, 공백 정리, 소문자)
+
+    Args:
+        address: 사용자가 입력한 주소
+
+    Returns:
+        캐시 키
+    """
+    text = unicodedata.normalize("NFC", address or "")
+    return _WHITESPACE.sub(" ", text).strip().lower()
+
+
+class GeocodeCache:
+    """
+    주소 → 좌표 변환 응답 캐시
+
+    자주 쓰는 주소는 메모리 LRU에서 바로 돌려주고, 메모리에서 밀려난 항목과
+    재시작 이전 항목은 SQLite 파일에서 읽어 옵니다. 항목은 ttl이 지나면 만료됩니다.
+    결과가 없는 주소(documents가 빈 응답)는 오타/신규 주소일 수 있으므로 negative_ttl만 유지합니다.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl: float = 30 * 24 * 3600,
+        max_memory_entries: int = 1024,
+        max_disk_entries: int = 100000,
+        negative_ttl: float = 600,
+        prune_interval: int = 256,
+    ):
+        """
+        Args:
+            path: SQLite 파일 경로 (None이면 메모리 캐시만 사용)
+            ttl: 항목 유효 기간 (초)
+            max_memory_entries: 메모리 LRU 최대 항목 수
+            max_disk_entries: 디스크 캐시 최대 항목 수 (초과 시 오래된 항목부터 삭제)
+            negative_ttl: 결과가 없는 응답의 유효 기간 (초)
+            prune_interval: 디스크 캐시 정리(만료/초과 항목 삭제) 주기 (저장 횟수)
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self.negative_ttl = negative_ttl
+        self.prune_interval = max(1, prune_interval)
+
+        self.hits = 0
+        self.misses = 0
+
+        self._memory: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._inserts_since_prune = 0
+
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS geocode ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " created_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS geocode_created_at ON geocode (created_at)"
+            )
+            self._prune_disk(time.time())
+            self._conn.commit()
+
+    def get(self, address: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 응답 조회
+
+        Args:
+            address: 주소
+
+        Returns:
+            캐시된 응답 (없거나 만료되면 None)
+        """
+        key = normalize_address_key(address)
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                created_at, value = entry
+                if now - created_at < self._ttl_for(value):
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._memory[key]
+
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT value, created_at FROM geocode WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    value = json.loads(row[0])
+                    if now - row[1] < self._ttl_for(value):
+                        self._remember(key, row[1], value)
+                        self.hits += 1
+                        return value
+
+            self.misses += 1
+            return None
+
+    def set(self, address: str, value: Dict[str, Any]) -> None:
+        """
+        응답 저장
+
+        Args:
+            address: 주소
+            value: 주소 → 좌표 변환 응답
+        """
+        key = normalize_address_key(address)
+        now = time.time()
+
+        with self._lock:
+            self._remember(key, now, value)
+            # 결과 없는 응답은 짧게 메모리에만 둠 (재시작하면 다시 조회)
+            if self._conn is not None and not _is_negative(value):
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO geocode (key, value, created_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(value, ensure_ascii=False), now),
+                )
+                self._inserts_since_prune += 1
+                if self._inserts_since_prune >= self.prune_interval:
+                    self._prune_disk(now)
+                self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계
+
+        Returns:
+            hits, misses, hit_ratio, memory_entries
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / total if total else 0.0,
+                "memory_entries": len(self._memory),
+            }
+
+    def clear(self) -> None:
+        """메모리/디스크 캐시 전체 삭제"""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM geocode")
+                self._conn.commit()
+
+    def _ttl_for(self, value: Dict[str, Any]) -> float:
+        return min(self.ttl, self.negative_ttl) if _is_negative(value) else self.ttl
+
+    def _remember(self, key: str, created_at: float, value: Dict[str, Any]) -> None:
+        self._memory[key] = (created_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _prune_disk(self, now: float) -> None:
+        self._inserts_since_prune = 0
+        self._conn.execute("DELETE FROM geocode WHERE created_at < ?", (now - self.ttl,))
+        count = self._conn.execute("SELECT COUNT(*) FROM geocode").fetchone()[0]
+        if count > self.max_disk_entries:
+            self._conn.execute(
+                "DELETE FROM geocode WHERE key IN ("
+                " SELECT key FROM geocode ORDER BY created_at LIMIT ?)",
+                (count - self.max_disk_entries,),
+            )
+
+
+def _is_negative(value: Dict[str, Any]) -> bool:
+    # 주소 → 좌표 변환 결과가 없는 응답 (documents가 비어 있음)
+    data = value.get("data") if isinstance(value, dict) else None
+    return isinstance(data, dict) and not data.get("documents")
+
+
+_default_cache: Optional[GeocodeCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_geocode_cache() -> GeocodeCache:
+    """
+    프로세스 전역 주소 캐시 반환 (환경변수 설정으로 최초 1회 생성)
+
+    GEOCODE_CACHE_PATH: SQLite 파일 경로 (빈 값이면 메모리 캐시만 사용)
+    GEOCODE_CACHE_TTL: 항목 유효 기간 (초)
+    GEOCODE_CACHE_SIZE: 메모리 LRU 최대 항목 수
+    GEOCODE_CACHE_NEGATIVE_TTL: 결과가 없는 주소의 유효 기간 (초)
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            path = os.getenv(
+                "GEOCODE_CACHE_PATH",
+                os.path.join(os.path.expanduser("~"), ".cache", "parking-mcp", "geocode.sqlite3"),
+            )
+            try:
+                _default_cache = GeocodeCache(
+                    path=path or None,
+                    ttl=float(os.getenv("GEOCODE_CACHE_TTL", str(30 * 24 * 3600))),
+                    max_memory_entries=int(os.getenv("GEOCODE_CACHE_SIZE", "1024")),
+                    negative_ttl=float(os.getenv("GEOCODE_CACHE_NEGATIVE_TTL", "600")),
+                )
+            except (OSError, sqlite3.Error):
+                # 디스크에 쓸 수 없는 환경이면 메모리 캐시로 동작
+                _default_cache = GeocodeCache(path=None)
+        return _default_cache
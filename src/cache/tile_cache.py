@@ -0,0 +1,386 @@
+"""
+지도 타일 단위 카카오 카테고리 검색 결과 캐시
+지도를 고정된 geohash 타일로 나눠 타일별 주차장(PK6) 목록을 캐시하고,
+주변 검색은 반경을 덮는 타일들을 합친 뒤 거리로 걸러 응답
+"""
+
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from dotenv import load_dotenv
+
+from src.matching.ranking import CandidateSet
+
+load_dotenv()
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+_BASE32_INDEX = {c: i for i, c in enumerate(_BASE32)}
+
+# 위도 1도의 거리 (미터)
+_METERS_PER_DEG_LAT = 111320.0
+
+
+def geohash_encode(lat: float, lng: float, precision: int = 6) -> str:
+    """
+    좌표를 geohash 문자열로 변환
+
+    Args:
+        lat: 위도
+        lng: 경도
+        precision: 문자 수 (6이면 약 1.2km x 0.6km 타일)
+
+    Returns:
+        geohash 문자열
+    """
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    value = 0
+    even = True
+    while len(chars) < precision:
+        target, rng = (lng, lng_range) if even else (lat, lat_range)
+        mid = (rng[0] + rng[1]) / 2
+        if target >= mid:
+            value = (value << 1) | 1
+            rng[0] = mid
+        else:
+            value <<= 1
+            rng[1] = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(_BASE32[value])
+            bits = 0
+            value = 0
+    return "".join(chars)
+
+
+def geohash_bounds(tile: str) -> Tuple[float, float, float, float]:
+    """
+    geohash 타일의 경계
+
+    Args:
+        tile: geohash 문자열
+
+    Returns:
+        (남, 서, 북, 동) 위경도
+    """
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    even = True
+    for char in tile:
+        value = _BASE32_INDEX[char]
+        for shift in range(4, -1, -1):
+            rng = lng_range if even else lat_range
+            mid = (rng[0] + rng[1]) / 2
+            if (value >> shift) & 1:
+                rng[0] = mid
+            else:
+                rng[1] = mid
+            even = not even
+    return lat_range[0], lng_range[0], lat_range[1], lng_range[1]
+
+
+def tile_size(precision: int) -> Tuple[float, float]:
+    """precision 타일 한 칸의 (위도 폭, 경도 폭) (도)"""
+    bits = 5 * precision
+    lng_bits = (bits + 1) // 2
+    lat_bits = bits // 2
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lng_bits)
+
+
+def tiles_in_bounds(
+    south: float,
+    west: float,
+    north: float,
+    east: float,
+    precision: int = 6
+) -> List[str]:
+    """
+    사각형 범위를 덮는 타일 목록
+
+    Args:
+        south, west, north, east: 범위 위경도
+        precision: geohash 문자 수
+
+    Returns:
+        geohash 타일 목록 (남서쪽부터 행 순서)
+    """
+    lat_step, lng_step = tile_size(precision)
+    tiles = []
+    seen = set()
+    lat_index = math.floor((south + 90.0) / lat_step)
+    while lat_index * lat_step - 90.0 <= north:
+        center_lat = (lat_index + 0.5) * lat_step - 90.0
+        lng_index = math.floor((west + 180.0) / lng_step)
+        while lng_index * lng_step - 180.0 <= east:
+            center_lng = (lng_index + 0.5) * lng_step - 180.0
+            tile = geohash_encode(center_lat, center_lng, precision)
+            if tile not in seen:
+                seen.add(tile)
+                tiles.append(tile)
+            lng_index += 1
+        lat_index += 1
+    return tiles
+
+
+class TileCache:
+    """
+    geohash 타일별 주차장 목록 캐시
+
+    사용자마다 좌표가 조금씩 달라도 같은 동네라면 같은 타일을 쓰므로 캐시가 공유됩니다.
+    타일 목록은 메모리 LRU에 보관하며 ttl이 지나면 만료됩니다. 저장할 때 좌표를 CandidateSet
+    열 배열로 한 번만 변환해 두므로, 반경 필터는 조회마다 문서를 다시 파싱하지 않습니다.
+    외부 API 호출은 하지 않으며, 채우는 쪽(검색기)이 lookup()에서 빠진 타일을 받아 set()합니다.
+    미리 만들어 둔 카탈로그 타일은 preload()로 올리며, LRU 크기 제한을 받지 않습니다.
+    카카오 페이지 한도로 전부 받지 못한 타일은 mark_truncated()로 ttl 동안 기억해 검색기가
+    타일 대신 거리순 반경 검색을 쓰도록 합니다.
+    """
+
+    def __init__(
+        self,
+        precision: int = 6,
+        ttl: float = 24 * 3600,
+        max_tiles: int = 4096,
+        max_radius: float = 1000.0,
+    ):
+        """
+        Args:
+            precision: geohash 문자 수
+            ttl: 타일 유효 기간 (초)
+            max_tiles: 메모리에 둘 최대 타일 수
+            max_radius: 타일 캐시로 처리할 최대 검색 반경 (미터, 더 넓으면 타일 수가 너무 많음)
+        """
+        self.precision = precision
+        self.ttl = ttl
+        self.max_tiles = max_tiles
+        self.max_radius = max_radius
+
+        self.hits = 0
+        self.misses = 0
+
+        self._tiles: "OrderedDict[str, Tuple[float, CandidateSet]]" = OrderedDict()
+        # 카탈로그 타일: {타일: 주차장 후보}와 공통 만료 시각
+        self._pinned: Dict[str, CandidateSet] = {}
+        self._pinned_until = 0.0
+        # 전부 받지 못한 타일: {타일: 기록 시각}
+        self._truncated: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def covering_tiles(self, lat: float, lng: float, radius_m: float) -> List[str]:
+        """
+        반경 원을 덮는 타일 목록
+
+        Args:
+            lat: 위도
+            lng: 경도
+            radius_m: 반경 (미터)
+
+        Returns:
+            geohash 타일 목록
+        """
+        d_lat = radius_m / _METERS_PER_DEG_LAT
+        d_lng = radius_m / (_METERS_PER_DEG_LAT * max(math.cos(math.radians(lat)), 1e-6))
+        return tiles_in_bounds(lat - d_lat, lng - d_lng, lat + d_lat, lng + d_lng, self.precision)
+
+    def lookup(self, tiles: Iterable[str]) -> Tuple[Dict[str, List[Dict[str, Any]]], List[str]]:
+        """
+        캐시된 타일과 빠진 타일 분리
+
+        Args:
+            tiles: 타일 목록
+
+        Returns:
+            ({타일: 주차장 목록}, 빠진 타일 목록)
+        """
+        cached, missing = self.lookup_candidates(tiles)
+        return {tile: candidates.documents for tile, candidates in cached.items()}, missing
+
+    def lookup_candidates(self, tiles: Iterable[str]) -> Tuple[Dict[str, CandidateSet], List[str]]:
+        """
+        lookup()과 같지만 타일별 주차장 후보 열 배열 반환
+
+        Returns:
+            ({타일: CandidateSet}, 빠진 타일 목록)
+        """
+        now = time.time()
+        cached: Dict[str, CandidateSet] = {}
+        missing: List[str] = []
+        with self._lock:
+            pinned = self._pinned if now < self._pinned_until else {}
+            for tile in tiles:
+                if tile in pinned:
+                    cached[tile] = pinned[tile]
+                    self.hits += 1
+                    continue
+                entry = self._tiles.get(tile)
+                if entry is not None and now - entry[0] < self.ttl:
+                    self._tiles.move_to_end(tile)
+                    cached[tile] = entry[1]
+                    self.hits += 1
+                else:
+                    # 만료된 타일은 lookup_stale()용으로 남겨 두고 다시 받아 set()으로 덮어씀
+                    missing.append(tile)
+                    self.misses += 1
+        return cached, missing
+
+    def lookup_stale(self, tiles: Iterable[str]) -> Dict[str, CandidateSet]:
+        """
+        만료된 타일까지 포함해 남아 있는 타일 조회 (원천 API 장애 시 대체용)
+
+        Args:
+            tiles: 타일 목록
+
+        Returns:
+            {타일: CandidateSet} (메모리에서 밀려난 타일은 빠짐)
+        """
+        stale: Dict[str, CandidateSet] = {}
+        with self._lock:
+            for tile in tiles:
+                entry = self._tiles.get(tile)
+                if entry is not None:
+                    stale[tile] = entry[1]
+                elif tile in self._pinned:
+                    stale[tile] = self._pinned[tile]
+        return stale
+
+    def set(self, tile: str, documents: List[Dict[str, Any]]) -> CandidateSet:
+        """
+        타일 주차장 목록 저장
+
+        Args:
+            tile: geohash 타일
+            documents: 타일 안의 카카오 문서 목록
+
+        Returns:
+            저장한 주차장 후보 열 배열
+        """
+        candidates = CandidateSet(documents)
+        with self._lock:
+            self._tiles[tile] = (time.time(), candidates)
+            self._tiles.move_to_end(tile)
+            while len(self._tiles) > self.max_tiles:
+                self._tiles.popitem(last=False)
+        return candidates
+
+    def mark_truncated(self, tile: str) -> None:
+        """
+        카카오 페이지 한도 때문에 타일을 전부 받을 수 없음을 기록
+
+        Args:
+            tile: geohash 타일
+        """
+        with self._lock:
+            self._truncated.pop(tile, None)
+            self._truncated[tile] = time.time()
+            while len(self._truncated) > self.max_tiles:
+                self._truncated.pop(next(iter(self._truncated)))
+
+    def has_truncated(self, tiles: Iterable[str]) -> bool:
+        """
+        타일 중 ttl 안에 mark_truncated()한 타일이 있는지
+
+        Args:
+            tiles: 타일 목록
+        """
+        now = time.time()
+        with self._lock:
+            return any(now - self._truncated.get(tile, -math.inf) < self.ttl for tile in tiles)
+
+    def preload(self, tiles: Dict[str, List[Dict[str, Any]]], expires_at: float) -> None:
+        """
+        카탈로그 타일 전체 교체
+
+        Args:
+            tiles: {타일: 주차장 목록} (주차장이 없는 타일도 포함해야 해당 지역을 API 없이 응답)
+            expires_at: 카탈로그 만료 시각 (epoch 초, 이후로는 일반 캐시/API 사용)
+        """
+        pinned = {tile: CandidateSet(documents) for tile, documents in tiles.items()}
+        with self._lock:
+            self._pinned = pinned
+            self._pinned_until = expires_at
+
+    @staticmethod
+    def within(
+        tile_documents: Iterable[Union[List[Dict[str, Any]], CandidateSet]],
+        lat: float,
+        lng: float,
+        radius_m: float
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 타일의 문서를 합쳐 반경 안만 가까운 순으로 반환
+
+        Args:
+            tile_documents: 타일별 문서 목록 또는 CandidateSet
+            lat: 위도
+            lng: 경도
+            radius_m: 반경 (미터)
+
+        Returns:
+            문서 사본 목록 (distance 필드를 요청 좌표 기준 미터로 채움)
+        """
+        sets = [
+            documents if isinstance(documents, CandidateSet) else CandidateSet(documents)
+            for documents in tile_documents
+        ]
+        return CandidateSet.concat(sets).within_documents(lat, lng, radius_m)
+
+    @staticmethod
+    def rect(tile: str) -> str:
+        """카카오 rect 파라미터 ("서 경도,남 위도,동 경도,북 위도")"""
+        south, west, north, east = geohash_bounds(tile)
+        return f"{west},{south},{east},{north}"
+
+    def stats(self) -> Dict[str, Any]:
+        """적중 통계"""
+        total = self.hits + self.misses
+        with self._lock:
+            tiles = len(self._tiles)
+            pinned = len(self._pinned) if time.time() < self._pinned_until else 0
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+            "tiles": tiles,
+            "catalog_tiles": pinned,
+        }
+
+    def clear(self) -> None:
+        """캐시 비우기"""
+        with self._lock:
+            self._tiles.clear()
+            self._truncated.clear()
+            self._pinned = {}
+            self._pinned_until = 0.0
+        self.hits = 0
+        self.misses = 0
+
+
+_default_cache: Optional[TileCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_tile_cache() -> TileCache:
+    """
+    프로세스 전역 타일 캐시 반환 (환경변수 설정으로 최초 1회 생성)
+
+    TILE_CACHE_PRECISION: geohash 문자 수
+    TILE_CACHE_TTL: 타일 유효 기간 (초)
+    TILE_CACHE_SIZE: 메모리에 둘 최대 타일 수
+    TILE_CACHE_MAX_RADIUS: 타일 캐시로 처리할 최대 반경 (미터, 0이면 사용 안 함)
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = TileCache(
+                precision=int(os.getenv("TILE_CACHE_PRECISION", "6")),
+                ttl=float(os.getenv("TILE_CACHE_TTL", str(24 * 3600))),
+                max_tiles=int(os.getenv("TILE_CACHE_SIZE", "4096")),
+                max_radius=float(os.getenv("TILE_CACHE_MAX_RADIUS", "1000")),
+            )
+        return _default_cache
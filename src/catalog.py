@@ -0,0 +1,419 @@
+"""
+서울/경기 주차장 카탈로그 (미리 수집해 둔 카카오 주차장 목록)
+지역을 geohash 타일 격자로 훑어 카카오 주차장(PK6)을 모으고, 카카오 id로 중복을 없앤 뒤
+공공데이터 주차장과 연결해 SQLite에 저장. 서버는 시작할 때 읽어 타일 캐시에 올리고,
+카탈로그가 덮지 않는 지역만 카카오 API를 호출
+
+수집:
+    python -m src.catalog crawl [--region seoul|gyeonggi|all] [--path 경로]
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+from src import metrics
+from src.cache.tile_cache import TileCache, geohash_bounds, tiles_in_bounds
+from src.matching.spatial_index import parse_coordinate
+
+load_dotenv()
+
+# 지역별 수집 범위 (남, 서, 북, 동)
+REGION_BOUNDS: Dict[str, Tuple[float, float, float, float]] = {
+    "seoul": (37.413, 126.734, 37.715, 127.270),
+    "gyeonggi": (36.893, 126.374, 38.284, 127.858),
+}
+
+# 카카오 카테고리 검색 제한 (페이지당 최대 15건, 최대 45페이지)
+_PAGE_SIZE = 15
+_MAX_PAGE = 45
+# 페이지 한도를 넘는 타일을 나눌 최대 정밀도
+_MAX_SPLIT_PRECISION = 8
+
+# 공공데이터 연결 결과: (지역, 공공데이터 주차장 코드) 또는 None
+PublicMatch = Optional[Tuple[str, str]]
+
+
+class ParkingCatalog:
+    """
+    카탈로그 SQLite 저장소
+
+    타일 단위로 수집 시각과 주차장 목록을 통째로 교체합니다. 주차장이 없는 타일도
+    기록해 두어야 서버가 그 지역을 API 호출 없이 "주차장 없음"으로 응답할 수 있습니다.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        Args:
+            path: SQLite 파일 경로 (기본값 메모리 DB)
+        """
+        self.path = path
+        if path != ":memory:":
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS tiles (
+                    tile TEXT PRIMARY KEY,
+                    crawled_at REAL NOT NULL,
+                    place_count INTEGER NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS places (
+                    kakao_id TEXT PRIMARY KEY,
+                    tile TEXT NOT NULL,
+                    region TEXT,
+                    public_code TEXT,
+                    document TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS places_tile ON places (tile);
+                """
+            )
+            self._conn.commit()
+
+    def save_tile(self, tile: str, documents: List[Dict[str, Any]], crawled_at: Optional[float] = None) -> int:
+        """
+        타일 주차장 목록 교체
+
+        같은 카카오 id가 이미 다른 타일에 있으면 이 타일로 옮깁니다.
+
+        Args:
+            tile: geohash 타일
+            documents: 카카오 문서 목록 (public_region/public_code 필드 포함 가능)
+            crawled_at: 수집 시각 (없으면 현재)
+
+        Returns:
+            저장한 주차장 수
+        """
+        records = {}
+        for document in documents:
+            kakao_id = str(document.get("id") or "")
+            if kakao_id and kakao_id not in records:
+                records[kakao_id] = (
+                    kakao_id,
+                    tile,
+                    document.get("public_region"),
+                    document.get("public_code"),
+                    json.dumps(document, ensure_ascii=False),
+                )
+        with self._lock:
+            self._conn.execute("DELETE FROM places WHERE tile = ?", (tile,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO places (kakao_id, tile, region, public_code, document)"
+                " VALUES (?, ?, ?, ?, ?)",
+                records.values(),
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tiles (tile, crawled_at, place_count) VALUES (?, ?, ?)",
+                (tile, crawled_at or time.time(), len(records)),
+            )
+            self._conn.commit()
+        return len(records)
+
+    def crawled_at(self, tile: str) -> float:
+        """타일 수집 시각 (수집 이력이 없으면 0)"""
+        with self._lock:
+            row = self._conn.execute("SELECT crawled_at FROM tiles WHERE tile = ?", (tile,)).fetchone()
+        return row[0] if row else 0.0
+
+    def load_tiles(self) -> Tuple[Dict[str, List[Dict[str, Any]]], float]:
+        """
+        전체 타일 로드
+
+        Returns:
+            ({타일: 카카오 문서 목록}, 가장 오래된 타일의 수집 시각)
+        """
+        with self._lock:
+            tile_rows = self._conn.execute("SELECT tile, crawled_at FROM tiles").fetchall()
+            place_rows = self._conn.execute("SELECT tile, document FROM places").fetchall()
+
+        tiles: Dict[str, List[Dict[str, Any]]] = {tile: [] for tile, _ in tile_rows}
+        for tile, document in place_rows:
+            if tile in tiles:
+                tiles[tile].append(json.loads(document))
+        oldest = min((crawled_at for _, crawled_at in tile_rows), default=0.0)
+        return tiles, oldest
+
+    def stats(self) -> Dict[str, Any]:
+        """타일 수, 주차장 수, 공공데이터 연결 수"""
+        with self._lock:
+            tiles = self._conn.execute("SELECT COUNT(*) FROM tiles").fetchone()[0]
+            places, matched = self._conn.execute(
+                "SELECT COUNT(*), COUNT(public_code) FROM places"
+            ).fetchone()
+        return {"tiles": tiles, "places": places, "matched": matched}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class _Throttle:
+    """스레드 간 공유하는 초당 요청 수 제한"""
+
+    def __init__(self, qps: float):
+        self.interval = 1.0 / qps if qps > 0 else 0.0
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+def fetch_tile(client, tile: str, throttle: Optional[_Throttle] = None) -> List[Dict[str, Any]]:
+    """
+    타일 범위의 카카오 주차장 전체
+
+    카카오 페이지 한도(45페이지)를 넘는 타일은 하위 타일로 나눠 받습니다.
+
+    Args:
+        client: KakaoLocalClient
+        tile: geohash 타일
+        throttle: 요청 속도 제한
+
+    Returns:
+        카카오 문서 목록
+    """
+    rect = TileCache.rect(tile)
+    documents: List[Dict[str, Any]] = []
+    page = 1
+    while True:
+        if throttle is not None:
+            throttle.wait()
+        data = client.search_category("PK6", rect=rect, page=page, size=_PAGE_SIZE).get("data", {})
+        documents.extend(data.get("documents", []))
+        meta = data.get("meta", {})
+        if page == 1 and int(meta.get("total_count") or 0) > int(meta.get("pageable_count") or 0) \
+                and len(tile) < _MAX_SPLIT_PRECISION:
+            children = [tile + char for char in "0123456789bcdefghjkmnpqrstuvwxyz"]
+            return [doc for child in children for doc in fetch_tile(client, child, throttle)]
+        if meta.get("is_end", True) or page >= _MAX_PAGE:
+            return documents
+        page += 1
+
+
+def join_public(
+    documents: Iterable[Dict[str, Any]],
+    match: Callable[[Dict[str, Any]], PublicMatch]
+) -> List[Dict[str, Any]]:
+    """
+    카카오 문서에 공공데이터 주차장 연결 정보 추가
+
+    Args:
+        documents: 카카오 문서 목록
+        match: 문서 → (지역, 공공데이터 주차장 코드) 또는 None
+
+    Returns:
+        public_region/public_code 필드를 채운 문서 사본 목록
+    """
+    joined = []
+    for document in documents:
+        document = dict(document)
+        matched = match(document)
+        document["public_region"], document["public_code"] = matched if matched else (None, None)
+        joined.append(document)
+    return joined
+
+
+def public_matcher(master_db) -> Callable[[Dict[str, Any]], PublicMatch]:
+    """
+    기본 정보 DB로 카카오 문서 → 공공데이터 주차장 매칭 함수 생성
+
+    Args:
+        master_db: src.master_db.MasterDB (서울/경기가 동기화되어 있어야 함)
+    """
+    from src.master_db import REGIONS
+    from src.matching import LotMatcher
+
+    matchers = {}
+    for region, fields in REGIONS.items():
+        address_fields = (fields["address"], "LOCPLC_LOTNO_ADDR") if region == "gyeonggi" else (fields["address"],)
+        matchers[region] = (
+            LotMatcher(master_db.rows(region), fields["name"], address_fields, fields["lat"], fields["lng"]),
+            fields["code"],
+        )
+
+    def match(document: Dict[str, Any]) -> PublicMatch:
+        address = document.get("address_name", "")
+        region = "seoul" if "서울" in address else "gyeonggi" if "경기" in address else None
+        if region is None:
+            return None
+        matcher, code_field = matchers[region]
+        row = matcher.match(
+            document.get("place_name", ""), address,
+            parse_coordinate(document.get("y")), parse_coordinate(document.get("x")),
+        )
+        return (region, str(row.get(code_field))) if row is not None else None
+
+    return match
+
+
+def crawl(
+    catalog: ParkingCatalog,
+    client,
+    bounds: Tuple[float, float, float, float],
+    precision: int = 6,
+    match: Optional[Callable[[Dict[str, Any]], PublicMatch]] = None,
+    max_workers: int = 4,
+    qps: float = 20.0,
+    max_age: Optional[float] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> Dict[str, int]:
+    """
+    범위를 타일 격자로 훑어 카탈로그 저장
+
+    Args:
+        catalog: 저장할 카탈로그
+        client: KakaoLocalClient
+        bounds: (남, 서, 북, 동)
+        precision: 타일 geohash 문자 수 (서버 TILE_CACHE_PRECISION과 같아야 함)
+        match: 공공데이터 연결 함수 (없으면 연결하지 않음)
+        max_workers: 동시 타일 수
+        qps: 초당 카카오 요청 수 제한
+        max_age: 이보다 최근에 수집한 타일은 건너뜀 (초, 없으면 전부 다시 수집)
+        progress: (완료 타일 수, 전체 타일 수) 콜백 (실패한 타일도 완료로 셈)
+
+    Returns:
+        {"tiles": 수집 타일 수, "skipped": 건너뛴 타일 수, "failed": 실패한 타일 수, "places": 저장한 주차장 수}
+        실패한 타일(호출 한도, 회로 열림, HTTP 오류 등)은 기록하지 않으므로 max_age를 주고 다시 실행하면
+        그 타일만 이어서 수집합니다.
+    """
+    tiles = tiles_in_bounds(*bounds, precision=precision)
+    now = time.time()
+    todo = [t for t in tiles if max_age is None or now - catalog.crawled_at(t) >= max_age]
+    throttle = _Throttle(qps)
+    result = {"tiles": 0, "skipped": len(tiles) - len(todo), "failed": 0, "places": 0}
+    lock = threading.Lock()
+
+    def work(tile: str) -> None:
+        try:
+            saved = collect(tile)
+        except Exception as e:
+            # 타일 하나의 실패로 지역 전체 수집을 멈추지 않음
+            metrics.record_error("catalog_crawl", e)
+            with lock:
+                result["failed"] += 1
+        else:
+            with lock:
+                result["tiles"] += 1
+                result["places"] += saved
+        if progress is not None:
+            with lock:
+                progress(result["tiles"] + result["failed"], len(todo))
+
+    def collect(tile: str) -> int:
+        documents = fetch_tile(client, tile, throttle)
+        # 타일 경계 밖 문서(카카오 rect 경계 포함 규칙 차이)는 제외
+        south, west, north, east = geohash_bounds(tile)
+        documents = [
+            d for d in documents
+            if south <= (parse_coordinate(d.get("y")) or 0) < north
+            and west <= (parse_coordinate(d.get("x")) or 0) < east
+        ]
+        if match is not None:
+            documents = join_public(documents, match)
+        return catalog.save_tile(tile, documents)
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        for future in [executor.submit(work, tile) for tile in todo]:
+            future.result()
+    return result
+
+
+def default_catalog_path() -> str:
+    """CATALOG_PATH 환경변수 (없으면 ~/.cache/parking-mcp/catalog.sqlite3)"""
+    return os.getenv(
+        "CATALOG_PATH",
+        os.path.join(os.path.expanduser("~"), ".cache", "parking-mcp", "catalog.sqlite3"),
+    )
+
+
+def open_catalog(path: Optional[str] = None) -> Optional[ParkingCatalog]:
+    """
+    카탈로그 열기 (경로가 비었거나 파일이 없으면 None)
+
+    Args:
+        path: SQLite 파일 경로 (없으면 default_catalog_path())
+    """
+    path = path if path is not None else default_catalog_path()
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        return ParkingCatalog(path)
+    except sqlite3.Error:
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="서울/경기 주차장 카탈로그 수집")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    crawl_parser = subparsers.add_parser("crawl", help="카카오 카테고리 검색으로 타일 격자 수집")
+    crawl_parser.add_argument("--region", choices=("seoul", "gyeonggi", "all"), default="all")
+    crawl_parser.add_argument("--path", default=None, help="SQLite 파일 경로 (기본값 CATALOG_PATH)")
+    crawl_parser.add_argument("--precision", type=int, default=int(os.getenv("TILE_CACHE_PRECISION", "6")))
+    crawl_parser.add_argument("--workers", type=int, default=4, help="동시 타일 수")
+    crawl_parser.add_argument("--qps", type=float, default=20.0, help="초당 카카오 요청 수")
+    crawl_parser.add_argument("--max-age", type=float, default=None,
+                              help="이보다 최근(초)에 수집한 타일은 건너뜀")
+    crawl_parser.add_argument("--no-join", action="store_true", help="공공데이터 연결 생략")
+    args = parser.parse_args()
+
+    from src.api_clients import KakaoLocalClient, set_default_priority
+    from src.api_clients.rate_limit import BACKGROUND
+    from src.master_db import open_master_db, sync_gyeonggi, sync_seoul
+
+    # 수집은 백그라운드 작업: 일일 할당량의 예비분은 서버의 도구 호출용으로 남김
+    set_default_priority(BACKGROUND)
+    os.environ.setdefault("KAKAO_QPS", str(args.qps))
+
+    catalog = ParkingCatalog(args.path or default_catalog_path())
+    client = KakaoLocalClient()
+    match = None
+    if not args.no_join:
+        db = open_master_db()
+        for region, sync in (("seoul", sync_seoul), ("gyeonggi", sync_gyeonggi)):
+            if not db.is_fresh(region, 86400):
+                sync(db)
+        match = public_matcher(db)
+
+    print(f"[카탈로그] {catalog.path}")
+    for region, bounds in REGION_BOUNDS.items():
+        if args.region not in (region, "all"):
+            continue
+        start = time.perf_counter()
+        total = len(tiles_in_bounds(*bounds, precision=args.precision))
+
+        def progress(done: int, todo: int) -> None:
+            if done % 100 == 0 or done == todo:
+                print(f"  {region}: {done}/{todo} 타일")
+
+        result = crawl(catalog, client, bounds, precision=args.precision, match=match,
+                       max_workers=args.workers, qps=args.qps, max_age=args.max_age, progress=progress)
+        print(f"[OK] {region}: 타일 {total}개 중 {result['tiles']}개 수집 ({result['skipped']}개 건너뜀), "
+              f"주차장 {result['places']}건 ({time.perf_counter() - start:.0f}초)")
+        if result["failed"]:
+            print(f"[!] {region}: 타일 {result['failed']}개 실패 (--max-age를 주고 다시 실행하면 실패한 타일만 수집)")
+    stats = catalog.stats()
+    print(f"[카탈로그] 타일 {stats['tiles']}개, 주차장 {stats['places']}건, 공공데이터 연결 {stats['matched']}건")
+    catalog.close()
+
+
+if __name__ == "__main__":
+    main()
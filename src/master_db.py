@@ -0,0 +1,340 @@
+"""
+서울/경기 주차장 기본 정보 로컬 SQLite 미러
+운영시간, 요금, 총 주차면 수, 좌표처럼 거의 바뀌지 않는 정보를 색인된 SQLite에 보관하고,
+실시간 경로에서는 변동 필드(현재 주차 대수 등)만 메모리에 둠
+(좌표 검색은 DB가 아니라 서버가 DB 행으로 만든 LotMatcher 격자 색인이 담당)
+
+동기화:
+    python -m src.master_db sync [--region seoul|gyeonggi] [--path 경로]
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+from src.api_clients.rate_limit import BACKGROUND, set_default_priority
+from src.matching.spatial_index import parse_coordinate
+
+load_dotenv()
+
+# 지역별 필드 구성
+REGIONS: Dict[str, Dict[str, str]] = {
+    "seoul": {
+        "code": "PKLT_CD",
+        "name": "PKLT_NM",
+        "address": "ADDR",
+        "lat": "LAT",
+        "lng": "LOT",
+        "total": "TPKCT",
+    },
+    "gyeonggi": {
+        "code": "PARKPLC_MANAGE_NO",
+        "name": "PARKPLC_NM",
+        "address": "LOCPLC_ROADNM_ADDR",
+        "lat": "REFINE_WGS84_LAT",
+        "lng": "REFINE_WGS84_LOGT",
+        "total": "PARKNG_COMPRT_PLANE_CNT",
+    },
+}
+
+# 서울 GetParkingInfo에서 갱신마다 바뀌는 필드 (나머지는 기본 정보로 미러)
+SEOUL_VOLATILE_FIELDS = (
+    "NOW_PRK_VHCL_CNT",
+    "NOW_PRK_VHCL_UPDT_TM",
+    "PRK_STTS_YN",
+    "PRK_STTS_NM",
+)
+
+
+def split_volatile(
+    rows: Iterable[Dict[str, Any]],
+    code_field: str = "PKLT_CD",
+    volatile_fields: Tuple[str, ...] = SEOUL_VOLATILE_FIELDS
+) -> List[Dict[str, Any]]:
+    """
+    행 목록에서 변동 필드만 남긴 행 목록 (주차장 코드 기준 첫 행만 유지)
+
+    Args:
+        rows: 공공데이터 행 목록
+        code_field: 주차장 코드 필드
+        volatile_fields: 남길 변동 필드
+
+    Returns:
+        [{code_field: ..., 변동 필드...}]
+    """
+    seen = set()
+    result = []
+    for row in rows:
+        code = row.get(code_field)
+        if code in seen:
+            continue
+        seen.add(code)
+        slim = {code_field: code}
+        for field in volatile_fields:
+            if field in row:
+                slim[field] = row[field]
+        result.append(slim)
+    return result
+
+
+class MasterDB:
+    """
+    주차장 기본 정보 SQLite 저장소
+
+    지역별로 전체 행을 통째로 교체하는 방식으로 동기화하며, 동기화 시각을 기록해
+    신선도를 판단합니다. 조회는 지역 전체 행(rows)과 주차장 코드(get) 단위입니다.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        Args:
+            path: SQLite 파일 경로 (기본값 메모리 DB)
+        """
+        self.path = path
+        if path != ":memory:":
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._create_schema()
+
+    def _create_schema(self) -> None:
+        with self._lock:
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS lots (
+                    id INTEGER PRIMARY KEY,
+                    region TEXT NOT NULL,
+                    code TEXT NOT NULL,
+                    name TEXT,
+                    address TEXT,
+                    lat REAL,
+                    lng REAL,
+                    total_spots INTEGER,
+                    attrs TEXT NOT NULL,
+                    UNIQUE (region, code)
+                );
+                CREATE INDEX IF NOT EXISTS lots_region_name ON lots (region, name);
+                CREATE TABLE IF NOT EXISTS sync_state (
+                    region TEXT PRIMARY KEY,
+                    synced_at REAL NOT NULL,
+                    row_count INTEGER NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS snapshots (
+                    name TEXT PRIMARY KEY,
+                    saved_at REAL NOT NULL,
+                    rows TEXT NOT NULL
+                );
+                """
+            )
+            try:
+                # 예전 버전이 만든 R-tree 색인은 더 이상 갱신하지 않으므로 삭제
+                self._conn.execute("DROP TABLE IF EXISTS lots_rtree")
+            except sqlite3.OperationalError:
+                # R-tree 모듈이 없는 SQLite 빌드에서는 가상 테이블을 지울 수 없음 (읽지도 않으므로 무시)
+                pass
+            self._conn.commit()
+
+    def sync(
+        self,
+        region: str,
+        rows: Iterable[Dict[str, Any]],
+        exclude_fields: Iterable[str] = ()
+    ) -> int:
+        """
+        지역 전체 행 교체
+
+        Args:
+            region: "seoul" 또는 "gyeonggi"
+            rows: 공공데이터 행 목록
+            exclude_fields: 저장하지 않을 필드 (변동 필드 등)
+
+        Returns:
+            저장한 주차장 수 (코드 중복 제외)
+        """
+        fields = REGIONS[region]
+        exclude = set(exclude_fields)
+        records = {}
+        for row in rows:
+            code = row.get(fields["code"])
+            if code is None or code in records:
+                continue
+            attrs = {k: v for k, v in row.items() if k not in exclude}
+            total = row.get(fields["total"])
+            try:
+                total = int(float(total)) if total not in (None, "") else None
+            except (TypeError, ValueError):
+                total = None
+            records[code] = (
+                region,
+                str(code),
+                row.get(fields["name"]),
+                row.get(fields["address"]),
+                parse_coordinate(row.get(fields["lat"])),
+                parse_coordinate(row.get(fields["lng"])),
+                total,
+                json.dumps(attrs, ensure_ascii=False),
+            )
+
+        with self._lock:
+            conn = self._conn
+            conn.execute("DELETE FROM lots WHERE region = ?", (region,))
+            conn.executemany(
+                "INSERT INTO lots (region, code, name, address, lat, lng, total_spots, attrs)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                records.values(),
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO sync_state (region, synced_at, row_count) VALUES (?, ?, ?)",
+                (region, time.time(), len(records)),
+            )
+            conn.commit()
+        return len(records)
+
+    def synced_at(self, region: str) -> float:
+        """마지막 동기화 시각 (epoch 초, 동기화 이력이 없으면 0)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT synced_at FROM sync_state WHERE region = ?", (region,)
+            ).fetchone()
+        return row[0] if row else 0.0
+
+    def is_fresh(self, region: str, max_age: float) -> bool:
+        """마지막 동기화 후 max_age 초가 지나지 않았는지"""
+        synced_at = self.synced_at(region)
+        return bool(synced_at) and time.time() - synced_at < max_age
+
+    def rows(self, region: str) -> List[Dict[str, Any]]:
+        """
+        지역의 저장된 행 목록 (원본 필드명 그대로)
+
+        Args:
+            region: "seoul" 또는 "gyeonggi"
+
+        Returns:
+            행 목록 (동기화 순서)
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT attrs FROM lots WHERE region = ? ORDER BY id", (region,)
+            )
+            return [json.loads(attrs) for (attrs,) in cursor]
+
+    def get(self, region: str, code: str) -> Optional[Dict[str, Any]]:
+        """주차장 코드로 행 조회"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT attrs FROM lots WHERE region = ? AND code = ?", (region, str(code))
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save_snapshot(self, name: str, rows: List[Dict[str, Any]]) -> None:
+        """
+        변동 스냅샷 저장 (재시작 직후 바로 제공할 마지막 정상 스냅샷)
+
+        Args:
+            name: 스냅샷 이름
+            rows: 행 목록
+        """
+        payload = json.dumps(rows, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO snapshots (name, saved_at, rows) VALUES (?, ?, ?)",
+                (name, time.time(), payload),
+            )
+            self._conn.commit()
+
+    def load_snapshot(self, name: str) -> Optional[Tuple[float, List[Dict[str, Any]]]]:
+        """
+        저장된 변동 스냅샷 조회
+
+        Returns:
+            (저장 시각, 행 목록) (없으면 None)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT saved_at, rows FROM snapshots WHERE name = ?", (name,)
+            ).fetchone()
+        return (row[0], json.loads(row[1])) if row else None
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def default_master_db_path() -> str:
+    """MASTER_DB_PATH 환경변수 (없으면 ~/.cache/parking-mcp/master.sqlite3)"""
+    return os.getenv(
+        "MASTER_DB_PATH",
+        os.path.join(os.path.expanduser("~"), ".cache", "parking-mcp", "master.sqlite3"),
+    )
+
+
+def open_master_db(path: Optional[str] = None) -> MasterDB:
+    """
+    기본 정보 DB 열기 (디스크에 쓸 수 없으면 메모리 DB)
+
+    Args:
+        path: SQLite 파일 경로 (없으면 default_master_db_path())
+    """
+    path = path if path is not None else default_master_db_path()
+    try:
+        return MasterDB(path or ":memory:")
+    except (OSError, sqlite3.Error):
+        return MasterDB(":memory:")
+
+
+def sync_seoul(db: MasterDB, client=None, max_workers: int = 4) -> int:
+    """서울 GetParkingInfo 전체를 받아 기본 정보 동기화"""
+    from src.api_clients import SeoulDataClient
+
+    client = client or SeoulDataClient()
+    response = client.get_all_realtime_parking_info(max_workers=max_workers)
+    rows = response.get("data", {}).get("GetParkingInfo", {}).get("row", [])
+    return db.sync("seoul", rows, exclude_fields=SEOUL_VOLATILE_FIELDS)
+
+
+def sync_gyeonggi(db: MasterDB, client=None, max_workers: int = 4) -> int:
+    """경기 ParkingPlace 전체를 받아 기본 정보 동기화"""
+    from src.api_clients import GyeonggiDataClient
+
+    client = client or GyeonggiDataClient()
+    response = client.get_all_parking_places(max_workers=max_workers)
+    places = response.get("data", {}).get("ParkingPlace", [])
+    rows = places[1].get("row", []) if len(places) > 1 else []
+    return db.sync("gyeonggi", rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="주차장 기본 정보 SQLite 미러")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    sync_parser = subparsers.add_parser("sync", help="공공데이터 API에서 기본 정보 동기화")
+    sync_parser.add_argument("--region", choices=("seoul", "gyeonggi", "all"), default="all")
+    sync_parser.add_argument("--path", default=None, help="SQLite 파일 경로 (기본값 MASTER_DB_PATH)")
+    sync_parser.add_argument("--workers", type=int, default=4, help="동시 페이지 요청 수")
+    args = parser.parse_args()
+
+    set_default_priority(BACKGROUND)
+    db = MasterDB(args.path or default_master_db_path())
+    print(f"[기본 정보 DB] {db.path}")
+    for region, sync in (("seoul", sync_seoul), ("gyeonggi", sync_gyeonggi)):
+        if args.region not in (region, "all"):
+            continue
+        start = time.perf_counter()
+        try:
+            count = sync(db, max_workers=args.workers)
+            print(f"[OK] {region}: {count}건 동기화 ({time.perf_counter() - start:.1f}초)")
+        except Exception as e:
+            print(f"[X] {region} 동기화 실패: {e}")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
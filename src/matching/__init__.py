@@ -0,0 +1,16 @@
+"""
+카카오 장소 ↔ 공공데이터 주차장 매칭 모듈 (좌표 색인, 후보 순위 계산 포함)
+"""
+
+from src.matching.name_index import NameIndex
+from src.matching.spatial_index import GridIndex, haversine
+from src.matching.lot_matcher import LotMatcher
+from src.matching.ranking import CandidateSet
+
+__all__ = [
+    "NameIndex",
+    "GridIndex",
+    "LotMatcher",
+    "CandidateSet",
+    "haversine",
+]
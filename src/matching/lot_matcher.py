@@ -0,0 +1,81 @@
+"""
+좌표 + 이름 기반 주차장 매칭
+카카오 장소 좌표 주변의 공공데이터 주차장을 먼저 찾고, 없으면 이름 색인으로 대체
+"""
+
+from typing import Any, Dict, Iterable, Optional, Sequence
+
+from src.matching.name_index import NameIndex
+from src.matching.spatial_index import GridIndex
+
+
+class LotMatcher:
+    """
+    공공데이터 스냅샷에 대한 주차장 매칭기
+
+    좌표가 있으면 격자 색인으로 max_distance_m 이내 주차장을 가까운 순으로 보고,
+    이름이 어느 정도 비슷하거나 아주 가까운(same_site_m 이내) 주차장을 고릅니다.
+    근처에 마땅한 주차장이 없거나 좌표가 없으면 이름/주소 색인 결과를 사용합니다.
+    """
+
+    def __init__(
+        self,
+        rows: Sequence[Dict[str, Any]],
+        name_field: str,
+        address_fields: Iterable[str],
+        lat_field: str,
+        lng_field: str,
+        max_distance_m: float = 200.0,
+        same_site_m: float = 30.0,
+        min_nearby_name_score: float = 0.3,
+    ):
+        """
+        Args:
+            rows: 공공데이터 행 목록
+            name_field: 주차장 이름 필드
+            address_fields: 주소 필드 목록
+            lat_field: 위도 필드
+            lng_field: 경도 필드
+            max_distance_m: 좌표 매칭 최대 거리 (미터)
+            same_site_m: 이름과 관계없이 같은 주차장으로 보는 거리 (미터)
+            min_nearby_name_score: 근처 주차장을 인정하는 최소 이름 유사도
+        """
+        self.rows = rows
+        self.names = NameIndex(rows, name_field, address_fields)
+        self.spatial = GridIndex(rows, lat_field, lng_field)
+        self.max_distance_m = max_distance_m
+        self.same_site_m = same_site_m
+        self.min_nearby_name_score = min_nearby_name_score
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def match(
+        self,
+        name: str,
+        address: str = "",
+        lat: Optional[float] = None,
+        lng: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        카카오 장소에 해당하는 공공데이터 주차장 행 검색
+
+        Args:
+            name: 카카오 장소 이름
+            address: 카카오 장소 주소
+            lat: 카카오 장소 위도 (y)
+            lng: 카카오 장소 경도 (x)
+
+        Returns:
+            매칭된 행 (없으면 None)
+        """
+        if lat is not None and lng is not None:
+            nearby = self.spatial.within_indices(lat, lng, self.max_distance_m)
+            for distance, i in nearby:
+                name_score, _ = self.names.similarity(i, name, address)
+                if name_score >= self.min_nearby_name_score:
+                    return self.rows[i]
+            if nearby and nearby[0][0] <= self.same_site_m:
+                return self.rows[nearby[0][1]]
+
+        return self.names.best_match(name, address)
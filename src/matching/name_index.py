@@ -0,0 +1,269 @@
+"""
+주차장 이름/주소 역색인
+정규화 토큰과 글자 2-gram으로 후보를 찾고 유사도로 순위를 매김
+"""
+
+import re
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+# 이름 끝에 붙는 일반 명칭 (비교 시 제거)
+_GENERIC_SUFFIXES = ("공영주차장", "노상주차장", "노외주차장", "부설주차장", "주차장")
+
+# 주소 앞에 붙는 광역 지자체 명칭 (카카오/공공데이터 표기가 서로 다름)
+_REGION_PREFIXES = ("서울특별시", "서울시", "서울", "경기도", "경기")
+
+_NON_WORD = re.compile(r"[^0-9a-z가-힣]+")
+
+
+def normalize_name(name: str) -> str:
+    """
+    주차장 이름 정규화 (소문자, 공백/기호 제거, 일반 명칭 접미사 제거)
+
+    Args:
+        name: 주차장 이름
+
+    Returns:
+        비교용 핵심 이름 (예: "세종로 공영주차장(시)" → "세종로시")
+    """
+    text = _NON_WORD.sub("", (name or "").lower())
+    for suffix in _GENERIC_SUFFIXES:
+        idx = text.find(suffix)
+        if idx > 0:
+            text = text[:idx] + text[idx + len(suffix):]
+            break
+    return text
+
+
+def normalize_address(address: str) -> str:
+    """
+    주소 정규화 (광역 지자체 접두어, 공백/기호 제거)
+
+    Args:
+        address: 주소
+
+    Returns:
+        비교용 주소 문자열
+    """
+    text = (address or "").strip()
+    for prefix in _REGION_PREFIXES:
+        if text.startswith(prefix):
+            text = text[len(prefix):]
+            break
+    return _NON_WORD.sub("", text.lower())
+
+
+def tokenize(text: str) -> List[str]:
+    """공백/기호 기준 토큰 분리 후 정규화"""
+    return [t for t in (normalize_name(w) for w in (text or "").split()) if t]
+
+
+def bigrams(text: str) -> Set[str]:
+    """글자 2-gram 집합 (한 글자 문자열은 그 자체)"""
+    if len(text) < 2:
+        return {text} if text else set()
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def _dice(a: Set[str], b: Set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return 2.0 * len(a & b) / (len(a) + len(b))
+
+
+class NameIndex:
+    """
+    공공데이터 주차장 행에 대한 이름/주소 역색인
+
+    스냅샷 적재 시 한 번 만들어 두고, 카카오 검색 결과마다 전체 행을 훑는 대신
+    토큰·2-gram 역색인으로 후보를 좁힌 뒤 유사도로 최적 행을 고릅니다.
+    """
+
+    # 전체 행의 이 비율 이상에 등장하는 토큰/2-gram은 후보 검색에서 제외 (변별력 없음)
+    COMMON_GRAM_RATIO = 0.2
+
+    # 유사도를 계산할 최대 후보 수 (겹치는 토큰/2-gram이 많은 순)
+    MAX_CANDIDATES = 50
+
+    def __init__(
+        self,
+        rows: Sequence[Dict[str, Any]],
+        name_field: str,
+        address_fields: Iterable[str] = (),
+    ):
+        """
+        Args:
+            rows: 공공데이터 행 목록
+            name_field: 주차장 이름 필드 (예: "PKLT_NM", "PARKPLC_NM")
+            address_fields: 주소 필드 목록 (예: ("ADDR",))
+        """
+        self.rows = rows
+        self.name_field = name_field
+        self.address_fields = tuple(address_fields)
+
+        self._names: List[str] = []
+        self._name_grams: List[Set[str]] = []
+        self._addresses: List[List[str]] = []
+        self._address_grams: List[Set[str]] = []
+
+        self._token_postings: Dict[str, List[int]] = defaultdict(list)
+        self._gram_postings: Dict[str, List[int]] = defaultdict(list)
+        self._address_postings: Dict[str, List[int]] = defaultdict(list)
+
+        for i, row in enumerate(rows):
+            name = normalize_name(row.get(name_field, ""))
+            name_grams = bigrams(name)
+            addresses = [
+                normalize_address(row.get(field, ""))
+                for field in self.address_fields
+                if row.get(field)
+            ]
+            address_grams: Set[str] = set()
+            for address in addresses:
+                address_grams |= bigrams(address)
+
+            self._names.append(name)
+            self._name_grams.append(name_grams)
+            self._addresses.append(addresses)
+            self._address_grams.append(address_grams)
+
+            for token in set(tokenize(row.get(name_field, ""))):
+                self._token_postings[token].append(i)
+            for gram in name_grams:
+                self._gram_postings[gram].append(i)
+            for gram in address_grams:
+                self._address_postings[gram].append(i)
+
+        self._max_postings = max(10, int(len(rows) * self.COMMON_GRAM_RATIO))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def candidates(self, name: str, address: str = "") -> Counter:
+        """
+        역색인으로 후보 행 검색
+
+        Args:
+            name: 검색할 주차장 이름
+            address: 검색할 주소
+
+        Returns:
+            {행 번호: 겹치는 토큰/2-gram 수}
+        """
+        return self._candidates(self._prepare(name, address))
+
+    def search(
+        self,
+        name: str,
+        address: str = "",
+        limit: int = 5
+    ) -> List[Tuple[float, Dict[str, Any]]]:
+        """
+        이름/주소로 후보를 찾아 유사도 순으로 반환
+
+        Args:
+            name: 검색할 주차장 이름
+            address: 검색할 주소
+            limit: 최대 결과 수
+
+        Returns:
+            [(점수, 행)] 점수 내림차순
+        """
+        query = self._prepare(name, address)
+        ranked = []
+        for i, _ in self._candidates(query).most_common(self.MAX_CANDIDATES):
+            name_score, address_score = self._score(i, query)
+            ranked.append((name_score + 0.3 * address_score, i))
+        ranked.sort(key=lambda item: (-item[0], item[1]))
+        return [(score, self.rows[i]) for score, i in ranked[:limit]]
+
+    def best_match(
+        self,
+        name: str,
+        address: str = "",
+        min_score: float = 0.6
+    ) -> Optional[Dict[str, Any]]:
+        """
+        가장 잘 맞는 행 반환
+
+        이름 유사도가 min_score 이상이거나 주소가 그대로 포함되는 행만 인정합니다.
+
+        Args:
+            name: 검색할 주차장 이름
+            address: 검색할 주소
+            min_score: 최소 이름 유사도
+
+        Returns:
+            최적 행 (없으면 None)
+        """
+        query = self._prepare(name, address)
+        best = None
+        best_score = 0.0
+        top = self._candidates(query).most_common(self.MAX_CANDIDATES)
+        for i in sorted(i for i, _ in top):
+            name_score, address_score = self._score(i, query)
+            if name_score < min_score and address_score < 1.0:
+                continue
+            total = name_score + 0.3 * address_score
+            if total > best_score:
+                best, best_score = i, total
+        return self.rows[best] if best is not None else None
+
+    def similarity(self, i: int, name: str, address: str = "") -> Tuple[float, float]:
+        """
+        특정 행과 검색어의 (이름 유사도, 주소 유사도)
+
+        Args:
+            i: 행 번호 (rows 기준)
+            name: 검색할 주차장 이름
+            address: 검색할 주소
+
+        Returns:
+            (이름 유사도, 주소 유사도) 각각 0.0 ~ 1.0
+        """
+        return self._score(i, self._prepare(name, address))
+
+    def _prepare(self, name: str, address: str) -> Tuple[List[str], str, Set[str], str, Set[str]]:
+        query_name = normalize_name(name)
+        query_address = normalize_address(address)
+        return (
+            tokenize(name),
+            query_name,
+            bigrams(query_name),
+            query_address,
+            bigrams(query_address),
+        )
+
+    def _candidates(self, query: Tuple) -> Counter:
+        tokens, _, name_grams, _, address_grams = query
+        hits: Counter = Counter()
+        for postings, keys in (
+            (self._token_postings, tokens),
+            (self._gram_postings, name_grams),
+            (self._address_postings, address_grams),
+        ):
+            for key in keys:
+                posting = postings.get(key)
+                if posting and len(posting) <= self._max_postings:
+                    hits.update(posting)
+        return hits
+
+    def _score(self, i: int, query: Tuple) -> Tuple[float, float]:
+        """
+        행과 검색어의 (이름 유사도, 주소 유사도) 계산
+
+        이름/주소가 서로 포함 관계면 1.0, 아니면 2-gram Dice 계수를 사용합니다.
+        """
+        _, query_name, name_grams, query_address, address_grams = query
+        row_name = self._names[i]
+        if query_name and row_name and (query_name in row_name or row_name in query_name):
+            name_score = 1.0
+        else:
+            name_score = _dice(name_grams, self._name_grams[i])
+
+        if query_address and any(query_address in a for a in self._addresses[i]):
+            address_score = 1.0
+        else:
+            address_score = _dice(address_grams, self._address_grams[i])
+
+        return name_score, address_score
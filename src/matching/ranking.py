@@ -0,0 +1,230 @@
+"""
+주차장 후보 열 단위(columnar) 저장과 벡터화 순위 계산
+후보의 좌표/주차면 수/가용 대수/요금을 열 배열로 한 번만 변환해 두고,
+거리(haversine) 필터와 가용률/요금 점수를 배열 연산으로 계산
+
+NumPy가 설치되어 있으면 사용하고 (pip install parking-mcp[fast]),
+없으면 같은 결과를 내는 순수 Python 구현으로 동작
+"""
+
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from src.matching.spatial_index import EARTH_RADIUS_M, parse_coordinate
+
+try:
+    import numpy as np
+except ImportError:  # 선택 의존성
+    np = None
+
+HAS_NUMPY = np is not None
+
+_NAN = float("nan")
+
+
+def _number(value: Any) -> float:
+    """숫자 변환 (빈 값/형식 오류는 NaN)"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return _NAN
+
+
+def _column(values: Sequence[float]):
+    return np.asarray(values, dtype=np.float64) if HAS_NUMPY else list(values)
+
+
+class CandidateSet:
+    """
+    주차장 후보 열 배열
+
+    documents의 순서대로 위도/경도(라디안), 주차면 수, 가용 대수, 요금을 보관합니다.
+    좌표가 없는 후보는 거리 계산에서 제외되고 (거리 inf), 알 수 없는 값은 NaN입니다.
+    """
+
+    __slots__ = ("documents", "lat", "lng", "cos_lat", "capacity", "available", "fee")
+
+    def __init__(
+        self,
+        documents: Sequence[Dict[str, Any]],
+        capacity: Optional[Sequence[Any]] = None,
+        available: Optional[Sequence[Any]] = None,
+        fee: Optional[Sequence[Any]] = None,
+    ):
+        """
+        Args:
+            documents: 카카오 문서 목록 (x, y 좌표 필드)
+            capacity: 후보별 전체 주차면 수 (없으면 전부 NaN)
+            available: 후보별 가용 대수 (없으면 전부 NaN)
+            fee: 후보별 기본 요금 (없으면 전부 NaN)
+        """
+        self.documents = list(documents)
+        size = len(self.documents)
+        lat, lng = [], []
+        for document in self.documents:
+            doc_lat = parse_coordinate(document.get("y"))
+            doc_lng = parse_coordinate(document.get("x"))
+            if doc_lat is None or doc_lng is None:
+                lat.append(_NAN)
+                lng.append(_NAN)
+            else:
+                lat.append(math.radians(doc_lat))
+                lng.append(math.radians(doc_lng))
+        self.lat = _column(lat)
+        self.lng = _column(lng)
+        self.cos_lat = np.cos(self.lat) if HAS_NUMPY else [math.cos(v) for v in lat]
+        self.capacity = _column([_number(v) for v in capacity] if capacity is not None else [_NAN] * size)
+        self.available = _column([_number(v) for v in available] if available is not None else [_NAN] * size)
+        self.fee = _column([_number(v) for v in fee] if fee is not None else [_NAN] * size)
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    @classmethod
+    def concat(cls, sets: Sequence["CandidateSet"]) -> "CandidateSet":
+        """여러 후보 집합을 이어 붙인 새 집합 (문서는 다시 변환하지 않음)"""
+        merged = cls.__new__(cls)
+        merged.documents = [document for s in sets for document in s.documents]
+        for name in ("lat", "lng", "cos_lat", "capacity", "available", "fee"):
+            columns = [getattr(s, name) for s in sets]
+            if HAS_NUMPY:
+                value = np.concatenate(columns) if columns else np.empty(0)
+            else:
+                value = [v for column in columns for v in column]
+            setattr(merged, name, value)
+        return merged
+
+    def distances(self, lat: float, lng: float):
+        """
+        기준 좌표에서 각 후보까지의 거리
+
+        Args:
+            lat: 위도
+            lng: 경도
+
+        Returns:
+            거리 배열 (미터, 좌표 없는 후보는 inf, NumPy가 없으면 list)
+        """
+        phi = math.radians(lat)
+        lam = math.radians(lng)
+        cos_phi = math.cos(phi)
+        if HAS_NUMPY:
+            a = np.sin((self.lat - phi) / 2) ** 2 + cos_phi * self.cos_lat * np.sin((self.lng - lam) / 2) ** 2
+            distance = 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+            return np.where(np.isnan(distance), np.inf, distance)
+
+        result = []
+        for doc_lat, doc_lng, cos_lat in zip(self.lat, self.lng, self.cos_lat):
+            if doc_lat != doc_lat:
+                result.append(math.inf)
+                continue
+            a = math.sin((doc_lat - phi) / 2) ** 2 + cos_phi * cos_lat * math.sin((doc_lng - lam) / 2) ** 2
+            result.append(2 * EARTH_RADIUS_M * math.asin(math.sqrt(min(a, 1.0))))
+        return result
+
+    def within(self, lat: float, lng: float, radius_m: float) -> List[Tuple[float, int]]:
+        """
+        반경 안 후보를 가까운 순으로
+
+        Returns:
+            [(거리, 후보 번호)]
+        """
+        distance = self.distances(lat, lng)
+        if HAS_NUMPY:
+            inside = np.flatnonzero(distance <= radius_m)
+            order = inside[np.argsort(distance[inside], kind="stable")]
+            return list(zip(distance[order].tolist(), order.tolist()))
+        found = [(d, i) for i, d in enumerate(distance) if d <= radius_m]
+        found.sort()
+        return found
+
+    def within_documents(self, lat: float, lng: float, radius_m: float) -> List[Dict[str, Any]]:
+        """
+        반경 안 문서를 가까운 순으로 (같은 카카오 id는 한 번만)
+
+        Returns:
+            문서 사본 목록 (distance 필드를 요청 좌표 기준 미터로 채움)
+        """
+        result = []
+        seen = set()
+        for distance, i in self.within(lat, lng, radius_m):
+            document = self.documents[i]
+            key = document.get("id") or (document.get("place_name"), document.get("x"), document.get("y"))
+            if key in seen:
+                continue
+            seen.add(key)
+            result.append(dict(document, distance=str(int(distance))))
+        return result
+
+    def scores(
+        self,
+        lat: float,
+        lng: float,
+        availability_weight: float = 0.0,
+        fee_weight: float = 0.0,
+        distance_scale: float = 1000.0,
+        fee_scale: float = 1000.0,
+    ):
+        """
+        후보별 비용 점수 (낮을수록 좋음)
+
+        비용 = 거리 / distance_scale - availability_weight x 가용률 + fee_weight x 요금 / fee_scale
+        가용률(가용 대수 / 주차면 수)을 모르면 0으로, 요금을 모르면 알려진 요금의 평균으로 봅니다.
+
+        Args:
+            lat: 위도
+            lng: 경도
+            availability_weight: 가용률 가중치
+            fee_weight: 요금 가중치
+            distance_scale: 비용 1에 해당하는 거리 (미터)
+            fee_scale: 비용 1에 해당하는 요금 (원)
+
+        Returns:
+            점수 배열 (NumPy가 없으면 list)
+        """
+        distance = self.distances(lat, lng)
+        if HAS_NUMPY:
+            cost = distance / distance_scale
+            if availability_weight:
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    ratio = np.clip(self.available / self.capacity, 0.0, 1.0)
+                cost = cost - availability_weight * np.nan_to_num(ratio, nan=0.0, posinf=0.0, neginf=0.0)
+            if fee_weight:
+                known = self.fee[~np.isnan(self.fee)]
+                fee = np.where(np.isnan(self.fee), known.mean() if known.size else 0.0, self.fee)
+                cost = cost + fee_weight * fee / fee_scale
+            return cost
+
+        known = [f for f in self.fee if f == f]
+        default_fee = sum(known) / len(known) if known else 0.0
+        cost = []
+        for d, capacity, available, fee in zip(distance, self.capacity, self.available, self.fee):
+            value = d / distance_scale
+            if availability_weight and capacity > 0 and available == available:
+                value -= availability_weight * min(max(available / capacity, 0.0), 1.0)
+            if fee_weight:
+                value += fee_weight * (fee if fee == fee else default_fee) / fee_scale
+            cost.append(value)
+        return cost
+
+    def rank(self, lat: float, lng: float, limit: Optional[int] = None, **weights: float) -> List[int]:
+        """
+        점수 순 후보 번호 (같은 점수는 원래 순서 유지)
+
+        Args:
+            lat: 위도
+            lng: 경도
+            limit: 최대 개수 (없으면 전체)
+            **weights: scores()의 가중치/척도 인자
+
+        Returns:
+            후보 번호 목록
+        """
+        cost = self.scores(lat, lng, **weights)
+        if HAS_NUMPY:
+            if limit is not None and limit < len(cost):
+                top = np.argpartition(cost, limit - 1)[:limit] if limit > 0 else np.empty(0, dtype=np.int64)
+                return top[np.lexsort((top, cost[top]))].tolist()
+            return np.argsort(cost, kind="stable").tolist()
+        order = sorted(range(len(cost)), key=cost.__getitem__)
+        return order if limit is None else order[:max(0, limit)]
@@ -0,0 +1,151 @@
+"""
+주차장 좌표 격자 색인
+위경도를 고정 크기 격자 칸으로 나눠 반경 내 주차장을 빠르게 찾음
+"""
+
+import math
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+EARTH_RADIUS_M = 6371000.0
+
+# 위도 1도의 거리 (미터)
+_METERS_PER_DEG_LAT = 111320.0
+
+
+def haversine(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """
+    두 좌표 사이의 대원 거리
+
+    Args:
+        lat1, lng1: 첫 번째 좌표 (위도, 경도)
+        lat2, lng2: 두 번째 좌표 (위도, 경도)
+
+    Returns:
+        거리 (미터)
+    """
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+def parse_coordinate(value: Any) -> Optional[float]:
+    """공공데이터 좌표 값 변환 (빈 값/0/형식 오류는 None)"""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if number else None
+
+
+class GridIndex:
+    """
+    공공데이터 주차장 행에 대한 격자 공간 색인
+
+    각 행을 cell_size_m 크기의 격자 칸에 넣어 두고, 조회 시 반경을 덮는 칸만
+    확인합니다. 좌표가 없거나 잘못된 행은 색인에서 제외됩니다.
+    """
+
+    def __init__(
+        self,
+        rows: Sequence[Dict[str, Any]],
+        lat_field: str,
+        lng_field: str,
+        cell_size_m: float = 250.0,
+        reference_lat: float = 37.5,
+    ):
+        """
+        Args:
+            rows: 공공데이터 행 목록
+            lat_field: 위도 필드 (예: "LAT", "REFINE_WGS84_LAT")
+            lng_field: 경도 필드 (예: "LOT", "REFINE_WGS84_LOGT")
+            cell_size_m: 격자 칸 크기 (미터)
+            reference_lat: 경도 간격 계산 기준 위도 (수도권 37.5도)
+        """
+        self.rows = rows
+        self.cell_size_m = cell_size_m
+        self._cell_lat = cell_size_m / _METERS_PER_DEG_LAT
+        self._cell_lng = cell_size_m / (_METERS_PER_DEG_LAT * math.cos(math.radians(reference_lat)))
+
+        self._coords: Dict[int, Tuple[float, float]] = {}
+        self._cells: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+
+        for i, row in enumerate(rows):
+            lat = parse_coordinate(row.get(lat_field))
+            lng = parse_coordinate(row.get(lng_field))
+            if lat is None or lng is None:
+                continue
+            self._coords[i] = (lat, lng)
+            self._cells[self._cell(lat, lng)].append(i)
+
+    def __len__(self) -> int:
+        return len(self._coords)
+
+    def _cell(self, lat: float, lng: float) -> Tuple[int, int]:
+        return int(math.floor(lat / self._cell_lat)), int(math.floor(lng / self._cell_lng))
+
+    def within_indices(
+        self,
+        lat: float,
+        lng: float,
+        radius_m: float
+    ) -> List[Tuple[float, int]]:
+        """
+        반경 내 행 번호 검색
+
+        Args:
+            lat: 위도
+            lng: 경도
+            radius_m: 반경 (미터)
+
+        Returns:
+            [(거리, 행 번호)] 거리 오름차순
+        """
+        span = int(math.ceil(radius_m / self.cell_size_m))
+        center_lat, center_lng = self._cell(lat, lng)
+
+        found = []
+        for d_lat in range(-span, span + 1):
+            for d_lng in range(-span, span + 1):
+                for i in self._cells.get((center_lat + d_lat, center_lng + d_lng), ()):
+                    row_lat, row_lng = self._coords[i]
+                    distance = haversine(lat, lng, row_lat, row_lng)
+                    if distance <= radius_m:
+                        found.append((distance, i))
+        found.sort()
+        return found
+
+    def within(
+        self,
+        lat: float,
+        lng: float,
+        radius_m: float
+    ) -> List[Tuple[float, Dict[str, Any]]]:
+        """
+        반경 내 주차장 검색
+
+        Returns:
+            [(거리, 행)] 거리 오름차순
+        """
+        return [(distance, self.rows[i]) for distance, i in self.within_indices(lat, lng, radius_m)]
+
+    def nearest(
+        self,
+        lat: float,
+        lng: float,
+        max_distance_m: float
+    ) -> Optional[Tuple[float, Dict[str, Any]]]:
+        """
+        max_distance_m 이내에서 가장 가까운 주차장
+
+        Returns:
+            (거리, 행) (없으면 None)
+        """
+        found = self.within_indices(lat, lng, max_distance_m)
+        if not found:
+            return None
+        distance, i = found[0]
+        return distance, self.rows[i]
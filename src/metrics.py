@@ -0,0 +1,338 @@
+"""
+서버 지표 수집
+단계별 지연 시간 히스토그램, 외부 API 호출/오류 카운터, 캐시 적중률을 모아
+Prometheus 텍스트 형식 또는 dict로 제공
+"""
+
+import bisect
+import functools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# 지연 시간 히스토그램 버킷 (초)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _escape_label_value(value: Any) -> str:
+    # Prometheus 텍스트 형식: 레이블 값의 \, ", 줄바꿈은 이스케이프
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    items = list(key) + ([extra] if extra else [])
+    if not items:
+        return ""
+    body = ",".join(f'{k}="{_escape_label_value(v)}"' for k, v in items)
+    return "{" + body + "}"
+
+
+class Counter:
+    """레이블별 누적 카운터"""
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help_text = help_text
+        self._values: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels: Any) -> float:
+        with self._lock:
+            return self._values.get(_label_key(labels), 0.0)
+
+    def collect(self) -> Dict[LabelKey, float]:
+        with self._lock:
+            return dict(self._values)
+
+
+class Histogram:
+    """레이블별 누적 히스토그램"""
+
+    def __init__(self, name: str, help_text: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(sorted(buckets))
+        self._values: Dict[LabelKey, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            # [버킷별 개수..., +Inf 개수, 합계]
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0.0] * (len(self.buckets) + 2)
+            state[bisect.bisect_left(self.buckets, value)] += 1
+            state[-1] += value
+
+    def collect(self) -> Dict[LabelKey, List[float]]:
+        with self._lock:
+            return {key: list(state) for key, state in self._values.items()}
+
+
+class MetricsRegistry:
+    """
+    지표 저장소
+
+    counter()/histogram()으로 지표를 만들고, register_collector()로 캐시 통계처럼
+    조회 시점에 값을 읽어 오는 게이지를 등록합니다.
+    """
+
+    def __init__(self):
+        self._counters: Dict[str, Counter] = {}
+        self._histograms: Dict[str, Histogram] = {}
+        self._collectors: List[Tuple[str, str, Callable[[], Dict[LabelKey, float]]]] = []
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help_text: str = "") -> Counter:
+        with self._lock:
+            if name not in self._counters:
+                self._counters[name] = Counter(name, help_text)
+            return self._counters[name]
+
+    def histogram(self, name: str, help_text: str = "") -> Histogram:
+        with self._lock:
+            if name not in self._histograms:
+                self._histograms[name] = Histogram(name, help_text)
+            return self._histograms[name]
+
+    def register_collector(
+        self,
+        name: str,
+        help_text: str,
+        collect: Callable[[], Dict[str, float]],
+        label: str = "kind"
+    ) -> None:
+        """
+        조회 시점에 값을 계산하는 게이지 등록
+
+        Args:
+            name: 지표 이름
+            help_text: 설명
+            collect: {레이블 값: 수치}를 반환하는 함수
+            label: 레이블 이름
+        """
+        def collect_gauge() -> Dict[LabelKey, float]:
+            return {((label, str(k)),): float(v) for k, v in collect().items()}
+
+        with self._lock:
+            self._collectors = [c for c in self._collectors if c[0] != name]
+            self._collectors.append((name, help_text, collect_gauge))
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 형식으로 출력"""
+        lines: List[str] = []
+        for counter in list(self._counters.values()):
+            lines.append(f"# HELP {counter.name} {counter.help_text}")
+            lines.append(f"# TYPE {counter.name} counter")
+            for key, value in sorted(counter.collect().items()):
+                lines.append(f"{counter.name}{_format_labels(key)} {value:g}")
+
+        for histogram in list(self._histograms.values()):
+            lines.append(f"# HELP {histogram.name} {histogram.help_text}")
+            lines.append(f"# TYPE {histogram.name} histogram")
+            for key, state in sorted(histogram.collect().items()):
+                cumulative = 0.0
+                for bound, count in zip(histogram.buckets, state):
+                    cumulative += count
+                    lines.append(f"{histogram.name}_bucket{_format_labels(key, ('le', f'{bound:g}'))} {cumulative:g}")
+                cumulative += state[len(histogram.buckets)]
+                lines.append(f"{histogram.name}_bucket{_format_labels(key, ('le', '+Inf'))} {cumulative:g}")
+                lines.append(f"{histogram.name}_sum{_format_labels(key)} {state[-1]:g}")
+                lines.append(f"{histogram.name}_count{_format_labels(key)} {cumulative:g}")
+
+        for name, help_text, collect in list(self._collectors):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            try:
+                values = collect()
+            except Exception:
+                values = {}
+            for key, value in sorted(values.items()):
+                lines.append(f"{name}{_format_labels(key)} {value:g}")
+
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        지표를 dict로 반환 (MCP Tool 응답용)
+
+        히스토그램은 개수, 합계, 평균과 버킷 경계 기준 p50/p95/p99 추정치로 요약합니다.
+        """
+        result: Dict[str, Any] = {}
+        for counter in list(self._counters.values()):
+            result[counter.name] = [
+                {"labels": dict(key), "value": value}
+                for key, value in sorted(counter.collect().items())
+            ]
+
+        for histogram in list(self._histograms.values()):
+            summaries = []
+            for key, state in sorted(histogram.collect().items()):
+                count = sum(state[:-1])
+                summaries.append({
+                    "labels": dict(key),
+                    "count": int(count),
+                    "sum": round(state[-1], 6),
+                    "avg": round(state[-1] / count, 6) if count else 0.0,
+                    "p50": _bucket_quantile(histogram.buckets, state, 0.50),
+                    "p95": _bucket_quantile(histogram.buckets, state, 0.95),
+                    "p99": _bucket_quantile(histogram.buckets, state, 0.99),
+                })
+            result[histogram.name] = summaries
+
+        for name, _, collect in list(self._collectors):
+            try:
+                values = collect()
+            except Exception:
+                values = {}
+            result[name] = [{"labels": dict(key), "value": value} for key, value in sorted(values.items())]
+
+        return result
+
+    def reset(self) -> None:
+        """수집한 값 전체 초기화 (등록한 게이지는 유지)"""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+
+def _bucket_quantile(buckets: Tuple[float, ...], state: List[float], q: float) -> Optional[float]:
+    """q 분위수가 속한 버킷의 상한 (+Inf 버킷이면 None)"""
+    total = sum(state[:-1])
+    if not total:
+        return None
+    target = total * q
+    cumulative = 0.0
+    for bound, count in zip(buckets, state):
+        cumulative += count
+        if cumulative >= target:
+            return bound
+    return None
+
+
+registry = MetricsRegistry()
+
+# 주요 지표 이름
+STAGE_SECONDS = "parking_stage_seconds"
+UPSTREAM_REQUESTS = "parking_upstream_requests_total"
+UPSTREAM_ERRORS = "parking_upstream_errors_total"
+UPSTREAM_SECONDS = "parking_upstream_request_seconds"
+ERRORS = "parking_errors_total"
+
+
+@contextmanager
+def time_stage(stage: str, **labels: Any) -> Iterator[None]:
+    """
+    처리 단계 소요 시간 측정
+
+    Args:
+        stage: 단계 이름 (예: "geocode", "kakao_search", "realtime_lookup")
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        registry.histogram(STAGE_SECONDS, "처리 단계별 소요 시간 (초)").observe(
+            time.perf_counter() - start, stage=stage, **labels
+        )
+
+
+def record_error(component: str, error: BaseException) -> None:
+    """
+    삼킨 예외 기록 (except 블록에서 그냥 넘어가는 대신 호출)
+
+    Args:
+        component: 예외가 발생한 구성 요소 (예: "seoul_realtime")
+        error: 발생한 예외
+    """
+    registry.counter(ERRORS, "구성 요소별 처리 중 오류 수").inc(
+        component=component, error=type(error).__name__
+    )
+
+
+def instrument_upstream(upstream: str) -> Callable:
+    """
+    API 클라이언트 _make_request 계측 데코레이터
+
+    호출 수, 소요 시간, 오류 종류(타임아웃 포함)를 외부 API별로 기록합니다.
+
+    Args:
+        upstream: 외부 API 이름 (예: "kakao", "seoul", "gyeonggi")
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            registry.counter(UPSTREAM_REQUESTS, "외부 API 호출 수").inc(upstream=upstream)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                kind = "timeout" if isinstance(e, TimeoutError) else type(e).__name__
+                registry.counter(UPSTREAM_ERRORS, "외부 API 오류 수").inc(upstream=upstream, kind=kind)
+                raise
+            finally:
+                registry.histogram(UPSTREAM_SECONDS, "외부 API 응답 시간 (초)").observe(
+                    time.perf_counter() - start, upstream=upstream
+                )
+        return wrapper
+    return decorator
+
+
+_metrics_server: Optional[ThreadingHTTPServer] = None
+
+
+def start_metrics_server(port: Optional[int] = None, host: Optional[str] = None) -> Optional[ThreadingHTTPServer]:
+    """
+    /metrics 경로로 Prometheus 텍스트를 제공하는 HTTP 서버 시작
+
+    Args:
+        port: 포트 (없으면 METRICS_PORT 환경변수, 그것도 없으면 시작하지 않음)
+        host: 바인딩 주소 (없으면 METRICS_HOST 환경변수, 기본값 127.0.0.1)
+
+    Returns:
+        시작한 서버 (시작하지 않았으면 None)
+    """
+    global _metrics_server
+    if _metrics_server is not None:
+        return _metrics_server
+
+    port = port if port is not None else int(os.getenv("METRICS_PORT", "0") or 0)
+    if not port:
+        return None
+    host = host or os.getenv("METRICS_HOST", "127.0.0.1")
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_response(404)
+                self.end_headers()
+                return
+            payload = registry.render_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    _metrics_server = ThreadingHTTPServer((host, port), Handler)
+    _metrics_server.daemon_threads = True
+    threading.Thread(target=_metrics_server.serve_forever, name="metrics-server", daemon=True).start()
+    return _metrics_server
@@ -0,0 +1,168 @@
+"""
+공공데이터 주차장 행의 압축 레코드
+API 응답 행(수십 개의 문자열 필드 dict)에서 서버가 쓰는 필드만 골라 __slots__ 객체로 보관
+문자열은 intern해 같은 값(상태명, 요금 구분 등)을 공유하고, 숫자 필드는 int/float로 변환
+
+레코드는 원본 필드명으로 get()을 지원하므로 매칭 색인, 스냅샷 저장소 등
+dict 행을 받던 코드에 그대로 넘길 수 있음
+"""
+
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.matching.spatial_index import parse_coordinate
+
+
+def _text(value: Any) -> Optional[str]:
+    """문자열 (intern, None은 그대로)"""
+    if value is None:
+        return None
+    return sys.intern(value if isinstance(value, str) else str(value))
+
+
+def _int(value: Any) -> Optional[int]:
+    """정수 ("1260", 1260.0 모두 허용, 빈 값/형식 오류는 None)"""
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+# 변환 함수별 고정 폭 저장 형식 ("s" 문자열, "q" 정수, "d" 실수) - 공유 스냅샷 파일에서 사용
+_KINDS: Dict[Callable[[Any], Any], str] = {_text: "s", _int: "q", parse_coordinate: "d"}
+
+
+class CompactRecord:
+    """
+    압축 레코드 기반 클래스
+
+    하위 클래스는 FIELDS에 (속성 이름, 원본 필드명, 변환 함수)를 나열하고
+    __slots__를 같은 속성 이름으로 선언합니다.
+    """
+
+    __slots__ = ()
+
+    FIELDS: Tuple[Tuple[str, str, Callable[[Any], Any]], ...] = ()
+    # 원본 필드명 → 속성 이름
+    _ATTRS: Dict[str, str] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._ATTRS = {field: attr for attr, field, _ in cls.FIELDS}
+
+    def __init__(self, **values: Any):
+        for attr, _, _ in self.FIELDS:
+            setattr(self, attr, values.get(attr))
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> "CompactRecord":
+        """
+        API 응답 행에서 레코드 생성
+
+        Args:
+            row: 원본 필드명 dict (없는 필드는 None)
+        """
+        record = cls.__new__(cls)
+        for attr, field, convert in cls.FIELDS:
+            setattr(record, attr, convert(row.get(field)))
+        return record
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict[str, Any]]) -> List["CompactRecord"]:
+        """행 목록 일괄 변환 (이미 레코드인 행은 그대로)"""
+        return [row if isinstance(row, cls) else cls.from_row(row) for row in rows]
+
+    def get(self, field: str, default: Any = None) -> Any:
+        """
+        원본 필드명으로 값 조회 (dict.get 호환)
+
+        Args:
+            field: 원본 필드명 (예: "PKLT_NM")
+            default: 필드가 없거나 값이 None일 때 반환할 값
+        """
+        attr = self._ATTRS.get(field)
+        value = getattr(self, attr) if attr is not None else None
+        return default if value is None else value
+
+    def __getitem__(self, field: str) -> Any:
+        attr = self._ATTRS.get(field)
+        if attr is None:
+            raise KeyError(field)
+        return getattr(self, attr)
+
+    def __contains__(self, field: str) -> bool:
+        return field in self._ATTRS
+
+    @classmethod
+    def kinds(cls) -> Tuple[str, ...]:
+        """속성별 저장 형식 ("s" 문자열, "q" 정수, "d" 실수, FIELDS 순서)"""
+        return tuple(_KINDS[convert] for _, _, convert in cls.FIELDS)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """원본 필드명 dict (JSON 저장용)"""
+        return {field: getattr(self, attr) for attr, field, _ in self.FIELDS}
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, attr) == getattr(other, attr) for attr, _, _ in self.FIELDS)
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{attr}={getattr(self, attr)!r}" for attr, _, _ in self.FIELDS)
+        return f"{type(self).__name__}({values})"
+
+
+class SeoulLot(CompactRecord):
+    """서울 GetParkingInfo 기본 정보 (변동 필드 제외)"""
+
+    FIELDS = (
+        ("code", "PKLT_CD", _text),
+        ("name", "PKLT_NM", _text),
+        ("address", "ADDR", _text),
+        ("lat", "LAT", parse_coordinate),
+        ("lng", "LOT", parse_coordinate),
+        ("total", "TPKCT", _int),
+        ("pay", "PAY_YN_NM", _text),
+        ("basic_fee", "BSC_PRK_CRG", _int),
+        ("basic_minutes", "BSC_PRK_HR", _int),
+        ("add_fee", "ADD_PRK_CRG", _int),
+        ("add_minutes", "ADD_PRK_HR", _int),
+        ("daily_max_fee", "DAY_MAX_CRG", _int),
+        ("weekday_open", "WD_OPER_BGNG_TM", _text),
+        ("weekday_close", "WD_OPER_END_TM", _text),
+    )
+    __slots__ = tuple(attr for attr, _, _ in FIELDS)
+
+
+class SeoulOccupancy(CompactRecord):
+    """서울 GetParkingInfo 변동 필드 (현재 주차 대수 등)"""
+
+    FIELDS = (
+        ("code", "PKLT_CD", _text),
+        ("parked", "NOW_PRK_VHCL_CNT", _int),
+        ("updated_at", "NOW_PRK_VHCL_UPDT_TM", _text),
+        ("status_code", "PRK_STTS_YN", _text),
+        ("status", "PRK_STTS_NM", _text),
+    )
+    __slots__ = tuple(attr for attr, _, _ in FIELDS)
+
+
+class GyeonggiLot(CompactRecord):
+    """경기 ParkingPlace 주차장"""
+
+    FIELDS = (
+        ("code", "PARKPLC_MANAGE_NO", _text),
+        ("name", "PARKPLC_NM", _text),
+        ("road_address", "LOCPLC_ROADNM_ADDR", _text),
+        ("lot_address", "LOCPLC_LOTNO_ADDR", _text),
+        ("lat", "REFINE_WGS84_LAT", parse_coordinate),
+        ("lng", "REFINE_WGS84_LOGT", parse_coordinate),
+        ("total", "PARKNG_COMPRT_PLANE_CNT", _int),
+        ("charge", "CHRG_INFO", _text),
+        ("basic_fee", "PARKNG_BASIS_USE_CHRG", _int),
+        ("basic_minutes", "PARKNG_BASIS_TM", _int),
+        ("daily_fee", "DAY1_PARKTK_CHRG", _int),
+        ("weekday_open", "WKDAY_OPERT_BEGIN_TM", _text),
+        ("weekday_close", "WKDAY_OPERT_END_TM", _text),
+    )
+    __slots__ = tuple(attr for attr, _, _ in FIELDS)
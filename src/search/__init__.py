@@ -0,0 +1,11 @@
+"""
+주변 주차장 검색 모듈
+"""
+
+from src.search.adaptive_search import AdaptiveParkingSearch, default_search_settings, wait_for_tile_warming
+
+__all__ = [
+    "AdaptiveParkingSearch",
+    "default_search_settings",
+    "wait_for_tile_warming",
+]
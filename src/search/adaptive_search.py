@@ -0,0 +1,487 @@
+"""
+카카오 주변 주차장 적응형 검색
+거리순 페이지를 동시에 받아 오고, 결과가 부족하면 반경을 넓히며,
+충분한 결과가 모이면 바로 멈춰 API 호출 수를 줄임
+"""
+
+import asyncio
+import math
+import os
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from dotenv import load_dotenv
+
+from src import metrics
+from src.api_clients import AsyncRateLimiter, CircuitOpenError, RateLimitError, background_priority, run_blocking
+from src.cache.tile_cache import TileCache, geohash_bounds
+from src.matching.spatial_index import haversine
+
+load_dotenv()
+
+# 카카오 키워드 검색 제한 (페이지당 최대 15건, 최대 45페이지)
+KAKAO_MAX_PAGE_SIZE = 15
+KAKAO_MAX_PAGE = 45
+
+ADAPTIVE_SEARCHES = "parking_adaptive_search_total"
+ADAPTIVE_PAGES = "parking_adaptive_search_pages_total"
+TILE_TRUNCATED = "parking_tile_truncated_total"
+TILE_STALE_SERVED = "parking_tile_stale_served_total"
+TILE_FALLBACK = "parking_tile_fallback_total"
+
+DEFAULT_RADII = (500, 1000, 2000, 5000)
+
+
+def _parse_radii(value: str) -> Tuple[int, ...]:
+    """쉼표로 구분한 반경 목록 (비어 있으면 기본 반경)"""
+    return tuple(sorted({int(part) for part in value.split(",") if part.strip()})) or DEFAULT_RADII
+
+
+class AdaptiveParkingSearch:
+    """
+    반경 확장형 주변 주차장 검색기
+
+    반경마다 거리순(sort=distance) 1페이지를 먼저 받고, 아직 부족하면 남은 페이지를
+    동시에 받습니다 (meta.is_end 또는 max_pages까지). 그래도 target건이 안 되면
+    지금까지의 밀도로 필요한 반경을 추정해 다음 단계로 넓힙니다.
+    is_good이 주어지면 좋은 결과(예: 공공데이터와 매칭되는 주차장)가 min_good건
+    이상 모여야 멈춥니다. is_good이 None을 돌려준 문서는 판단 대상이 아닌 것으로 보고,
+    판단 대상 문서가 하나도 없으면 (예: 공공데이터가 없는 지역) min_good을 요구하지 않습니다.
+
+    tile_cache가 주어지면 tile_cache.max_radius 이하 반경은 키워드 검색 대신 반경을 덮는
+    geohash 타일의 카테고리 검색 결과(캐시, 빠진 타일만 요청)를 합쳐 거리로 거릅니다.
+    타일은 반경 하나를 채우는 데 페이지가 훨씬 많이 들므로, 빠진 타일이 검색당 max_tile_fetches개를
+    넘거나 타일이 max_tile_pages 페이지 안에 다 들어오지 않으면(카카오 페이지 한도) 그 반경은
+    키워드 검색으로 받고, 남은 한도 안에서 가까운 빠진 타일은 백그라운드 우선순위로 따로 받아
+    다음 검색을 위해 캐시를 채웁니다 (응답은 기다리지 않음, wait_for_tile_warming 참고).
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        radii: Sequence[int] = DEFAULT_RADII,
+        target: int = 10,
+        min_good: int = 3,
+        max_pages: int = 3,
+        page_size: int = KAKAO_MAX_PAGE_SIZE,
+        is_good: Optional[Callable[[Dict[str, Any]], Optional[bool]]] = None,
+        tile_cache: Optional[TileCache] = None,
+        max_tile_fetches: int = 2,
+        max_tile_pages: int = 3,
+        tile_warm_qps: float = 0.0,
+    ):
+        """
+        Args:
+            client: search_place를 제공하는 비동기 카카오 클라이언트
+            radii: 시도할 반경 목록 (미터, 오름차순, 하나 이상)
+            target: 돌려줄 결과 수
+            min_good: 멈추기 위해 필요한 좋은 결과 수 (is_good이 없으면 무시)
+            max_pages: 반경별 최대 페이지 수
+            page_size: 페이지당 결과 수 (1~15)
+            is_good: 문서가 좋은 결과인지 판단하는 함수 (판단 대상이 아니면 None, I/O 스레드 풀에서 실행)
+            tile_cache: 타일 캐시 (search_category를 제공하는 client 필요)
+            max_tile_fetches: 검색 한 번에 카카오에서 새로 받을 최대 타일 수
+            max_tile_pages: 타일 하나에 받을 최대 페이지 수 (넘으면 타일 대신 키워드 검색)
+            tile_warm_qps: 백그라운드 타일 채우기의 초당 요청 수 (0 이하이면 제한 없음)
+
+        Raises:
+            ValueError: radii가 비어 있음
+        """
+        if not radii:
+            raise ValueError("검색 반경(radii)이 하나 이상 필요합니다")
+        self.client = client
+        self.radii = tuple(sorted(radii))
+        self.target = target
+        self.min_good = min_good if is_good is not None else 0
+        self.max_pages = max(1, min(max_pages, KAKAO_MAX_PAGE))
+        self.page_size = max(1, min(page_size, KAKAO_MAX_PAGE_SIZE))
+        self.is_good = is_good
+        self.tile_cache = tile_cache
+        self.max_tile_fetches = max(0, max_tile_fetches)
+        self.max_tile_pages = max(1, min(max_tile_pages, KAKAO_MAX_PAGE))
+        self.tile_warm_qps = tile_warm_qps
+
+    async def search(
+        self,
+        lat: float,
+        lng: float,
+        limiter: Optional[AsyncRateLimiter] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        좌표 주변 주차장 검색
+
+        Args:
+            lat: 위도
+            lng: 경도
+            limiter: 카카오 요청마다 거칠 요청 속도 제한기
+
+        Returns:
+            카카오 문서 목록 (가까운 순, 최대 target건)
+        """
+        found: Dict[str, Dict[str, Any]] = {}
+        good: Dict[str, Optional[bool]] = {}
+        reason = "exhausted"
+        radius = self.radii[0]
+        # 이 검색에서 더 받을 수 있는 타일 수
+        budget = {"tiles": self.max_tile_fetches}
+
+        while True:
+            exhausted = await self._collect(lat, lng, radius, found, good, budget, limiter)
+            if self._is_enough(found, good):
+                reason = "enough"
+                break
+            if not exhausted:
+                # 거리순 상위 페이지를 다 받았는데도 부족하면 반경을 넓혀도 더 가까운 결과는 없음
+                reason = "page_limit"
+                break
+            next_radius = self._next_radius(radius, found, good)
+            if next_radius is None:
+                break
+            radius = next_radius
+
+        metrics.registry.counter(ADAPTIVE_SEARCHES, "적응형 주변 검색 수 (최종 반경, 종료 사유별)").inc(
+            radius=radius, reason=reason
+        )
+        return self._select(lat, lng, found, good)
+
+    async def _collect(
+        self,
+        lat: float,
+        lng: float,
+        radius: int,
+        found: Dict[str, Dict[str, Any]],
+        good: Dict[str, Optional[bool]],
+        budget: Dict[str, int],
+        limiter: Optional[AsyncRateLimiter]
+    ) -> bool:
+        """
+        한 반경의 페이지를 받아 found/good에 합침
+
+        Returns:
+            이 반경의 결과를 끝까지 받았는지 (meta.is_end)
+        """
+        if self.tile_cache is None or radius > self.tile_cache.max_radius:
+            return await self._collect_pages(lat, lng, radius, found, good, limiter)
+
+        try:
+            tiles = self.tile_cache.covering_tiles(lat, lng, radius)
+            cached, missing = self.tile_cache.lookup_candidates(tiles)
+            reason = self._fallback_reason(cached, missing, budget)
+            if reason is None and missing:
+                budget["tiles"] -= len(missing)
+                await self._fill_tiles(missing, cached, limiter)
+                if len(cached) < len(tiles):
+                    reason = "truncated"
+            if reason is not None:
+                metrics.registry.counter(
+                    TILE_FALLBACK, "타일 대신 키워드 검색으로 받은 반경 수 (cold: 캐시 없음, budget: 타일 수 한도, truncated: 페이지 한도)"
+                ).inc(reason=reason)
+                # 응답은 키워드 검색으로 하고, 남은 한도 안에서 가까운 빠진 타일은 백그라운드로 받아 두어
+                # 카탈로그가 없거나 만료된 지역도 반복 검색으로 캐시가 채워지게 함
+                self._start_warming(self._warm_candidates(lat, lng, [tile for tile in tiles if tile not in cached], budget))
+                return await self._collect_pages(lat, lng, radius, found, good, limiter)
+            documents = TileCache.within((cached[tile] for tile in tiles), lat, lng, radius)
+        except (CircuitOpenError, RateLimitError) as e:
+            # 카카오 회로가 열려 있거나 호출 한도에 걸리면 만료된 타일로 대신 응답 (덮는 타일이 하나라도 없으면 실패)
+            documents = self._stale_tile_documents(lat, lng, radius, e)
+        await self._add_documents(documents, found, good)
+        return True
+
+    async def _collect_pages(
+        self,
+        lat: float,
+        lng: float,
+        radius: int,
+        found: Dict[str, Dict[str, Any]],
+        good: Dict[str, Optional[bool]],
+        limiter: Optional[AsyncRateLimiter]
+    ) -> bool:
+        """거리순 키워드 검색으로 한 반경의 페이지를 받음 (_collect 참고)"""
+        meta = await self._add_page(lat, lng, radius, 1, found, good, limiter)
+        if meta.get("is_end", True) or self._is_enough(found, good):
+            return bool(meta.get("is_end", True))
+
+        pageable = int(meta.get("pageable_count") or 0)
+        last_page = min(self.max_pages, max(1, math.ceil(pageable / self.page_size)))
+        metas = await asyncio.gather(*(
+            self._add_page(lat, lng, radius, page, found, good, limiter)
+            for page in range(2, last_page + 1)
+        ))
+        if not metas:
+            return pageable <= self.page_size
+        return any(m.get("is_end", False) for m in metas)
+
+    async def _add_page(
+        self,
+        lat: float,
+        lng: float,
+        radius: int,
+        page: int,
+        found: Dict[str, Dict[str, Any]],
+        good: Dict[str, Optional[bool]],
+        limiter: Optional[AsyncRateLimiter]
+    ) -> Dict[str, Any]:
+        if limiter is not None:
+            await limiter.acquire()
+        metrics.registry.counter(ADAPTIVE_PAGES, "적응형 주변 검색의 카카오 페이지 요청 수").inc()
+        response = await self.client.search_place(
+            "주차장",
+            category_group_code="PK6",
+            x=lng,
+            y=lat,
+            radius=radius,
+            page=page,
+            size=self.page_size,
+            sort="distance",
+        )
+        data = response.get("data", {})
+        await self._add_documents(data.get("documents", []), found, good)
+        return data.get("meta", {})
+
+    async def _add_documents(
+        self,
+        documents: List[Dict[str, Any]],
+        found: Dict[str, Dict[str, Any]],
+        good: Dict[str, Optional[bool]]
+    ) -> None:
+        new_documents = []
+        for document in documents:
+            key = document.get("id") or f"{document.get('place_name')}|{document.get('x')}|{document.get('y')}"
+            if key not in found:
+                found[key] = document
+                new_documents.append((key, document))
+
+        if self.is_good is not None and new_documents:
+            flags = await run_blocking(lambda: [self.is_good(doc) for _, doc in new_documents])
+            for (key, _), flag in zip(new_documents, flags):
+                good[key] = None if flag is None else bool(flag)
+
+    def _fallback_reason(
+        self,
+        cached: Dict[str, Any],
+        missing: List[str],
+        budget: Dict[str, int]
+    ) -> Optional[str]:
+        """
+        빠진 타일을 받아 타일로 응답할 수 없는 이유
+
+        Returns:
+            cold/budget/truncated (빠진 타일을 받아 타일로 응답하면 None)
+        """
+        if not missing:
+            return None
+        if self.tile_cache.has_truncated(missing):
+            return "truncated"
+        if len(missing) > budget["tiles"]:
+            return "budget" if cached else "cold"
+        return None
+
+    def _warm_candidates(self, lat: float, lng: float, missing: List[str], budget: Dict[str, int]) -> List[str]:
+        """남은 한도만큼 검색 좌표에 가까운 빠진 타일 (페이지 한도를 넘는 타일 제외, 한도에서 차감)"""
+        candidates = [tile for tile in missing if not self.tile_cache.has_truncated([tile])]
+        candidates.sort(key=lambda tile: _tile_distance(lat, lng, tile))
+        warm = candidates[:max(0, budget["tiles"])]
+        budget["tiles"] -= len(warm)
+        return warm
+
+    async def _fill_tiles(
+        self,
+        tiles: List[str],
+        cached: Dict[str, Any],
+        limiter: Optional[AsyncRateLimiter]
+    ) -> None:
+        """타일을 동시에 받아 캐시에 저장하고 cached에 추가 (페이지 한도를 넘는 타일은 빠짐)"""
+        filled = await asyncio.gather(*(self._fetch_tile(tile, limiter) for tile in tiles))
+        for tile, documents in zip(tiles, filled):
+            if documents is not None:
+                cached[tile] = self.tile_cache.set(tile, documents)
+
+    def _start_warming(self, tiles: List[str]) -> None:
+        """
+        타일을 받아 캐시에 채우는 백그라운드 작업 시작 (검색 응답은 기다리지 않음)
+
+        프로세스 전체에서 한 작업만 tile_warm_qps 속도로 돌려 카카오 토큰을 도구 호출에 남깁니다.
+        이미 채우는 중이면 건너뛰고, 남은 타일은 다음 검색이 다시 고릅니다.
+        """
+        if not tiles or _warming:
+            return
+        task = asyncio.get_running_loop().create_task(self._warm_tiles(tiles, AsyncRateLimiter(self.tile_warm_qps)))
+        _warming.add(task)
+        task.add_done_callback(_warming.discard)
+
+    async def _warm_tiles(self, tiles: List[str], limiter: AsyncRateLimiter) -> None:
+        # 백그라운드 우선순위로 한 타일씩: 도구 호출용 토큰/일일 할당량 예비분을 쓰지 않고,
+        # 기다리는 도구 호출에 양보하며, 작업 스레드를 하나만 씀
+        with background_priority():
+            try:
+                for tile in tiles:
+                    documents = await self._fetch_tile(tile, limiter)
+                    if documents is not None:
+                        self.tile_cache.set(tile, documents)
+            except Exception as e:
+                metrics.record_error("tile_warm", e)
+
+    def _stale_tile_documents(
+        self,
+        lat: float,
+        lng: float,
+        radius: int,
+        error: Exception
+    ) -> List[Dict[str, Any]]:
+        """만료된 타일까지 써서 반경 안 문서 반환 (덮는 타일이 하나라도 없으면 error를 다시 올림)"""
+        tiles = self.tile_cache.covering_tiles(lat, lng, radius)
+        stale = self.tile_cache.lookup_stale(tiles)
+        if len(stale) < len(tiles):
+            raise error
+        metrics.registry.counter(
+            TILE_STALE_SERVED, "카카오 회로가 열리거나 호출 한도에 걸려 만료된 타일로 응답한 검색 수"
+        ).inc()
+        return TileCache.within((stale[tile] for tile in tiles), lat, lng, radius)
+
+    async def _fetch_tile(self, tile: str, limiter: Optional[AsyncRateLimiter]) -> Optional[List[Dict[str, Any]]]:
+        """
+        타일 범위의 주차장 전체 (첫 페이지 후 남은 페이지 동시 요청)
+
+        Returns:
+            문서 목록 (max_tile_pages 또는 카카오 페이지 한도 안에 다 들어오지 않으면 None)
+        """
+        rect = TileCache.rect(tile)
+
+        async def fetch(page: int) -> Dict[str, Any]:
+            if limiter is not None:
+                await limiter.acquire()
+            metrics.registry.counter(ADAPTIVE_PAGES, "적응형 주변 검색의 카카오 페이지 요청 수").inc()
+            response = await self.client.search_category(
+                "PK6", rect=rect, page=page, size=KAKAO_MAX_PAGE_SIZE
+            )
+            return response.get("data", {})
+
+        first = await fetch(1)
+        documents = list(first.get("documents", []))
+        meta = first.get("meta", {})
+        if meta.get("is_end", True):
+            return documents
+
+        pageable = int(meta.get("pageable_count") or 0)
+        last_page = math.ceil(pageable / KAKAO_MAX_PAGE_SIZE)
+        if int(meta.get("total_count") or 0) > pageable or last_page > self.max_tile_pages:
+            # 다 받으려면 페이지가 너무 많은 타일은 남은 페이지를 받지 않고 기억해 둠 (다음부터 키워드 검색)
+            metrics.registry.counter(TILE_TRUNCATED, "페이지 한도로 타일 대신 키워드 검색을 쓴 타일 수").inc()
+            self.tile_cache.mark_truncated(tile)
+            return None
+        for data in await asyncio.gather(*(fetch(page) for page in range(2, last_page + 1))):
+            documents.extend(data.get("documents", []))
+        return documents
+
+    def _is_enough(self, found: Dict[str, Dict[str, Any]], good: Dict[str, Optional[bool]]) -> bool:
+        return len(found) >= self.target and _good_count(good) >= self._required_good(good)
+
+    def _required_good(self, good: Dict[str, Optional[bool]]) -> int:
+        """판단 대상 문서가 있을 때만 min_good 요구"""
+        if any(flag is not None for flag in good.values()):
+            return self.min_good
+        return 0
+
+    def _next_radius(
+        self,
+        radius: int,
+        found: Dict[str, Dict[str, Any]],
+        good: Dict[str, Optional[bool]]
+    ) -> Optional[int]:
+        """
+        다음 반경 (더 넓힐 수 없으면 None)
+
+        결과 수가 반경의 제곱에 비례한다고 보고 부족한 배수만큼 한 번에 건너뜁니다.
+        """
+        larger = [r for r in self.radii if r > radius]
+        if not larger:
+            return None
+
+        factor = 0.0
+        if found and len(found) < self.target:
+            factor = self.target / len(found)
+        good_count = _good_count(good)
+        required = self._required_good(good)
+        if good_count and good_count < required:
+            factor = max(factor, required / good_count)
+        if not factor:
+            return larger[0]
+
+        estimate = radius * math.sqrt(factor)
+        for candidate in larger:
+            if candidate >= estimate:
+                return candidate
+        return larger[-1]
+
+    def _select(
+        self,
+        lat: float,
+        lng: float,
+        found: Dict[str, Dict[str, Any]],
+        good: Dict[str, Optional[bool]]
+    ) -> List[Dict[str, Any]]:
+        """
+        가까운 순 상위 target건 (좋은 결과가 min_good건보다 적게 들어가면
+        빠진 좋은 결과 중 가까운 것으로 먼 쪽의 일반 결과를 교체)
+        """
+        ranked = sorted(found.items(), key=lambda item: _distance(lat, lng, item[1]))
+        chosen = ranked[:self.target]
+        rest_good = [item for item in ranked[self.target:] if good.get(item[0])]
+        missing = self._required_good(good) - sum(1 for key, _ in chosen if good.get(key))
+        for replacement in rest_good[:max(0, missing)]:
+            for i in range(len(chosen) - 1, -1, -1):
+                if not good.get(chosen[i][0]):
+                    chosen[i] = replacement
+                    break
+        chosen.sort(key=lambda item: _distance(lat, lng, item[1]))
+        return [document for _, document in chosen]
+
+
+# 진행 중인 타일 채우기 작업 (최대 하나, 완료 전에 가비지 컬렉션되지 않도록 참조 유지)
+_warming: Set["asyncio.Task[None]"] = set()
+
+
+async def wait_for_tile_warming() -> None:
+    """진행 중인 백그라운드 타일 채우기가 끝날 때까지 대기 (테스트/벤치마크용)"""
+    while _warming:
+        await asyncio.gather(*list(_warming), return_exceptions=True)
+
+
+def _good_count(good: Dict[str, Optional[bool]]) -> int:
+    return sum(1 for flag in good.values() if flag)
+
+
+def _tile_distance(lat: float, lng: float, tile: str) -> float:
+    """좌표에서 타일 중심까지 거리 (미터)"""
+    south, west, north, east = geohash_bounds(tile)
+    return haversine(lat, lng, (south + north) / 2, (west + east) / 2)
+
+
+def _distance(lat: float, lng: float, document: Dict[str, Any]) -> float:
+    """카카오 distance 필드 (없으면 좌표로 계산)"""
+    try:
+        return float(document["distance"])
+    except (KeyError, TypeError, ValueError):
+        pass
+    try:
+        return haversine(lat, lng, float(document["y"]), float(document["x"]))
+    except (KeyError, TypeError, ValueError):
+        return float("inf")
+
+
+def default_search_settings() -> Dict[str, Any]:
+    """
+    환경변수 기반 검색 설정
+
+    Returns:
+        AdaptiveParkingSearch 키워드 인자
+        (radii, target, min_good, max_pages, max_tile_fetches, max_tile_pages, tile_warm_qps)
+    """
+    return {
+        "radii": _parse_radii(os.getenv("SEARCH_RADII", "")),
+        "target": int(os.getenv("SEARCH_TARGET_COUNT", "10")),
+        "min_good": int(os.getenv("SEARCH_MIN_MATCHED", "3")),
+        "max_pages": int(os.getenv("SEARCH_MAX_PAGES", "3")),
+        "max_tile_fetches": int(os.getenv("SEARCH_MAX_TILE_FETCHES", "2")),
+        "max_tile_pages": int(os.getenv("SEARCH_MAX_TILE_PAGES", "3")),
+        "tile_warm_qps": float(os.getenv("SEARCH_TILE_WARM_QPS", "2")),
+    }
@@ -2,6 +2,11 @@
 주차장 정보 조회 MCP 서버
 """
 
+import argparse
+import asyncio
+import os
+import time
+from functools import lru_cache
 from typing import List, Dict, Optional, Any, Tuple
 from fastmcp import FastMCP
 
@@ -9,7 +14,24 @@ from src.api_clients import (
     KakaoLocalClient,
     SeoulDataClient,
     GyeonggiDataClient,
+    AsyncKakaoLocalClient,
+    AsyncRateLimiter,
+    CircuitOpenError,
+    RateLimitError,
+    run_blocking,
 )
+from src.api_clients.circuit_breaker import breaker_states
+from src.api_clients.rate_limit import limiter_stats
+from src import metrics
+from src.cache import get_geocode_cache, get_tile_cache
+from src.cache.geocode_cache import normalize_address_key
+from src.catalog import open_catalog
+from src.master_db import SEOUL_VOLATILE_FIELDS, MasterDB, open_master_db, split_volatile
+from src.matching import CandidateSet, LotMatcher
+from src.records import GyeonggiLot, SeoulLot, SeoulOccupancy
+from src.search import AdaptiveParkingSearch, default_search_settings
+from src.shared_snapshot import SharedSnapshotReader, default_shared_dir
+from src.snapshot import SnapshotStore
 
 app = FastMCP("Parking Info Server")
 
@@ -30,6 +52,29 @@ def _get_region(address: str) -> str:
     return "other"
 
 
+# -------------------------------
+# API 클라이언트 (서버 수명 동안 재사용, 공용 커넥션 풀 사용)
+# -------------------------------
+@lru_cache(maxsize=None)
+def _kakao_client() -> KakaoLocalClient:
+    return KakaoLocalClient()
+
+
+@lru_cache(maxsize=None)
+def _async_kakao_client() -> AsyncKakaoLocalClient:
+    return AsyncKakaoLocalClient(_kakao_client())
+
+
+@lru_cache(maxsize=None)
+def _seoul_client() -> SeoulDataClient:
+    return SeoulDataClient()
+
+
+@lru_cache(maxsize=None)
+def _gyeonggi_client() -> GyeonggiDataClient:
+    return GyeonggiDataClient()
+
+
 # -------------------------------
 # 공통 포맷 함수 (⭐️ 핵심 수정)
 # -------------------------------
@@ -64,38 +109,212 @@ def _format_parking_info(
 
     if region == "seoul":
         result["update_time"] = realtime_info.get("update_time")
+        result["data_age_seconds"] = realtime_info.get("data_age_seconds")
 
     return result
 
 
+# -------------------------------
+# 주차장 기본 정보 DB (운영시간, 요금, 좌표 등 정적 정보)
+# -------------------------------
+@lru_cache(maxsize=None)
+def _master_db() -> MasterDB:
+    # 첫 사용 시 열기 (import만으로 ~/.cache에 파일을 만들지 않도록)
+    return open_master_db()
+
+# 기본 정보 DB를 다시 동기화하기까지의 최대 경과 시간 (초)
+_MASTER_MAX_AGE = float(os.getenv("MASTER_MAX_AGE", "86400"))
+
+# 카카오 장소 좌표와 공공데이터 좌표를 같은 주차장으로 볼 최대 거리 (미터)
+_MATCH_DISTANCE_M = float(os.getenv("MATCH_DISTANCE_M", "200"))
+
+
+# -------------------------------
+# 서울 실시간 스냅샷 (프로세스 전역 공유)
+# -------------------------------
+def _fetch_seoul_rows() -> List[Dict[str, Any]]:
+    response = _seoul_client().get_all_realtime_parking_info(
+        max_workers=int(os.getenv("SEOUL_FETCH_WORKERS", "4"))
+    )
+    if response.get("status") != "success":
+        raise ConnectionError("서울 주차 정보를 불러오지 못했습니다.")
+    return response.get("data", {}).get("GetParkingInfo", {}).get("row", [])
+
+
+def _load_seoul_occupancy() -> List[SeoulOccupancy]:
+    """
+    서울 변동 필드 스냅샷 로드
+
+    API는 필드를 골라 받을 수 없으므로 전체 행을 받되, 기본 정보 DB가 오래됐을 때만
+    정적 필드를 DB에 반영하고 메모리에는 주차장 코드와 변동 필드만 압축 레코드로 남깁니다.
+    """
+    rows = _fetch_seoul_rows()
+    if not _master_db().is_fresh("seoul", _MASTER_MAX_AGE):
+        _master_db().sync("seoul", rows, exclude_fields=SEOUL_VOLATILE_FIELDS)
+        _seoul_master.refresh()
+    occupancy = split_volatile(rows)
+    # 재시작 직후 API 응답을 기다리지 않고 제공할 수 있도록 마지막 정상 스냅샷 저장
+    _master_db().save_snapshot("seoul_occupancy", occupancy)
+    return SeoulOccupancy.from_rows(occupancy)
+
+
+def _seed_seoul_occupancy() -> Optional[Tuple[float, List[SeoulOccupancy]]]:
+    saved = _master_db().load_snapshot("seoul_occupancy")
+    if saved is None:
+        return None
+    saved_at, rows = saved
+    return saved_at, SeoulOccupancy.from_rows(rows)
+
+
+# 조회 시 원천 API를 기다리지 않고 마지막 스냅샷을 바로 제공 (갱신은 백그라운드)
+_STALE_WHILE_REVALIDATE = os.getenv("SNAPSHOT_STALE_WHILE_REVALIDATE", "1") != "0"
+# 스냅샷이 아직 없을 때 첫 적재를 기다릴 최대 시간 (초)
+_SNAPSHOT_MAX_WAIT = float(os.getenv("SNAPSHOT_MAX_WAIT", "2"))
+
+
+def _master_rows(region: str) -> List[Dict[str, Any]]:
+    rows = _master_db().rows(region)
+    # reader는 갱신 프로세스가 DB를 처음 동기화하기 전에 뜰 수 있음
+    # 빈 결과를 실패로 보고 reload TTL 대신 최소 간격 후 다시 읽도록 함
+    if not rows and _SNAPSHOT_ROLE == "reader":
+        raise LookupError(f"{region} 기본 정보 DB가 아직 동기화되지 않았습니다.")
+    return rows
+
+
+# 서울 기본 정보 (DB에서 읽어 이름/주소/좌표 매칭 색인 구성)
+_seoul_master = SnapshotStore(
+    "seoul_master",
+    lambda: SeoulLot.from_rows(_master_rows("seoul")),
+    ttl=float(os.getenv("MASTER_RELOAD_TTL", "3600")),
+    index_builder=lambda rows: LotMatcher(
+        rows, "PKLT_NM", ("ADDR",), "LAT", "LOT",
+        max_distance_m=_MATCH_DISTANCE_M,
+    ),
+)
+
+def _update_occupancy_index(
+    index: Dict[Any, SeoulOccupancy],
+    changed: List[SeoulOccupancy],
+    removed: List[Any]
+) -> Dict[Any, SeoulOccupancy]:
+    # 바뀐 주차장만 교체 (항목 단위 대입이라 조회 중에도 안전)
+    for row in changed:
+        index[row.get("PKLT_CD")] = row
+    for code in removed:
+        index.pop(code, None)
+    return index
+
+
+# 스냅샷 역할: standalone (직접 갱신), writer (공유 스냅샷 갱신 프로세스),
+# reader (갱신 프로세스가 쓴 공유 스냅샷 파일만 읽음, 원천 API 미호출)
+_SNAPSHOT_ROLE = os.getenv("SNAPSHOT_ROLE", "standalone")
+
+
+# 서울 변동 정보 (주차장 코드 → 현재 주차 대수 등)
+# 주차장 코드와 NOW_PRK_VHCL_UPDT_TM이 같은 행은 기존 객체를 그대로 두고 바뀐 행만 반영
+_seoul_snapshot = SharedSnapshotReader(
+    "seoul",
+    default_shared_dir(),
+    SeoulOccupancy,
+    check_interval=float(os.getenv("SHARED_SNAPSHOT_CHECK_INTERVAL", "1")),
+) if _SNAPSHOT_ROLE == "reader" else SnapshotStore(
+    "seoul",
+    _load_seoul_occupancy,
+    ttl=float(os.getenv("SEOUL_SNAPSHOT_TTL", "300")),
+    update_field="NOW_PRK_VHCL_UPDT_TM",
+    index_builder=lambda rows: {row.get("PKLT_CD"): row for row in rows},
+    key_field="PKLT_CD",
+    index_updater=_update_occupancy_index,
+    stale_while_revalidate=_STALE_WHILE_REVALIDATE,
+    max_wait=_SNAPSHOT_MAX_WAIT,
+    seed_loader=_seed_seoul_occupancy,
+    max_seed_age=float(os.getenv("SEOUL_SNAPSHOT_MAX_STALE", "3600")),
+)
+
+
+# -------------------------------
+# 경기 주차장 스냅샷 (전체 페이지 병합)
+# -------------------------------
+def _load_gyeonggi_rows() -> List[GyeonggiLot]:
+    # 경기 데이터는 전부 정적 정보이므로 DB가 신선하면 API를 호출하지 않음
+    # (reader는 DB 동기화를 갱신 프로세스에 맡기고 항상 DB만 읽음)
+    if _SNAPSHOT_ROLE == "reader" or _master_db().is_fresh("gyeonggi", _MASTER_MAX_AGE):
+        return GyeonggiLot.from_rows(_master_rows("gyeonggi"))
+
+    response = _gyeonggi_client().get_all_parking_places(
+        max_workers=int(os.getenv("GYEONGGI_FETCH_WORKERS", "4"))
+    )
+    if response.get("status") != "success":
+        raise ConnectionError("경기 주차장 정보를 불러오지 못했습니다.")
+    places = response.get("data", {}).get("ParkingPlace", [])
+    rows = places[1].get("row", []) if len(places) > 1 else []
+    _master_db().sync("gyeonggi", rows)
+    return GyeonggiLot.from_rows(rows)
+
+
+# 경기 데이터는 실시간 대수가 없는 정적 정보이므로 갱신 주기를 길게 둠
+_gyeonggi_snapshot = SnapshotStore(
+    "gyeonggi",
+    _load_gyeonggi_rows,
+    ttl=float(os.getenv("GYEONGGI_SNAPSHOT_TTL", "3600")),
+    index_builder=lambda rows: LotMatcher(
+        rows, "PARKPLC_NM", ("LOCPLC_ROADNM_ADDR", "LOCPLC_LOTNO_ADDR"),
+        "REFINE_WGS84_LAT", "REFINE_WGS84_LOGT",
+        max_distance_m=_MATCH_DISTANCE_M,
+    ),
+    stale_while_revalidate=_STALE_WHILE_REVALIDATE,
+    max_wait=_SNAPSHOT_MAX_WAIT,
+    # 오래된 기본 정보라도 없는 것보다 나으므로 DB 내용을 그대로 초기 스냅샷으로 사용
+    seed_loader=lambda: (_master_db().synced_at("gyeonggi"), GyeonggiLot.from_rows(_master_db().rows("gyeonggi"))),
+    max_seed_age=float("inf"),
+)
+
+
 # -------------------------------
 # 서울 실시간 정보
 # -------------------------------
-def _get_realtime_info_seoul(parking_name: str, address: str) -> Dict[str, Any]:
+def _data_age_seconds(snapshot: SnapshotStore) -> Optional[int]:
+    """응답에 붙일 스냅샷 데이터 나이 (초)"""
+    age = snapshot.data_age()
+    return int(age) if age is not None else None
+
+
+def _get_realtime_info_seoul(
+    parking_name: str,
+    address: str,
+    lat: Optional[float] = None,
+    lng: Optional[float] = None,
+    public_code: Optional[str] = None
+) -> Dict[str, Any]:
     try:
-        client = SeoulDataClient()
-        response = client.get_realtime_parking_info(1, 1000)
-
-        if response.get("status") == "success":
-            rows = response.get("data", {}).get("GetParkingInfo", {}).get("row", [])
-            for p in rows:
-                if parking_name in p.get("PKLT_NM", "") or address in p.get("ADDR", ""):
-                    total = int(p.get("TPKCT", 0))
-                    current = int(p.get("NOW_PRK_VHCL_CNT", 0))
-                    return {
-                        "available_spots": max(0, total - current),
-                        "total_spots": total,
-                        "update_time": p.get("NOW_PRK_VHCL_UPDT_TM"),
-                        "operating_info": {
-                            "status": p.get("PRK_STTS_NM", "")
-                        },
-                        "fee_info": {
-                            "basic_fee": p.get("BSC_PRK_CRG", 0),
-                            "daily_max_fee": p.get("DAY_MAX_CRG", 0),
-                        }
-                    }
-    except Exception:
-        pass
+        # 변동 스냅샷을 먼저 읽어야 첫 로드 때 기본 정보 DB가 채워짐
+        occupancy = _seoul_snapshot.get_index()
+        if public_code and occupancy:
+            # 카탈로그에서 이미 연결된 주차장은 매칭 없이 코드로 조회
+            row = _master_db().get("seoul", public_code)
+            p = SeoulLot.from_row(row) if row is not None else None
+        else:
+            matcher = _seoul_master.get_index()
+            p = matcher.match(parking_name, address, lat, lng) if occupancy and matcher else None
+        o = occupancy.get(p.get("PKLT_CD")) if p is not None else None
+        if o is not None:
+            total = int(p.get("TPKCT", 0))
+            current = int(o.get("NOW_PRK_VHCL_CNT", 0))
+            return {
+                "available_spots": max(0, total - current),
+                "total_spots": total,
+                "update_time": o.get("NOW_PRK_VHCL_UPDT_TM"),
+                "data_age_seconds": _data_age_seconds(_seoul_snapshot),
+                "operating_info": {
+                    "status": o.get("PRK_STTS_NM", "")
+                },
+                "fee_info": {
+                    "basic_fee": p.get("BSC_PRK_CRG", 0),
+                    "daily_max_fee": p.get("DAY_MAX_CRG", 0),
+                }
+            }
+    except Exception as e:
+        metrics.record_error("seoul_realtime", e)
 
     return {
         "status": "unavailable",
@@ -106,25 +325,29 @@ def _get_realtime_info_seoul(parking_name: str, address: str) -> Dict[str, Any]:
 # -------------------------------
 # 경기 정보 (실시간 대수 없음)
 # -------------------------------
-def _get_realtime_info_gyeonggi(parking_name: str, address: str) -> Dict[str, Any]:
+def _get_realtime_info_gyeonggi(
+    parking_name: str,
+    address: str,
+    lat: Optional[float] = None,
+    lng: Optional[float] = None,
+    public_code: Optional[str] = None
+) -> Dict[str, Any]:
     try:
-        client = GyeonggiDataClient()
-        response = client.get_realtime_parking_info(page=1, size=100)
-
-        if response.get("status") == "success":
-            places = response.get("data", {}).get("ParkingPlace", [])
-            rows = places[1].get("row", []) if isinstance(places, list) and len(places) > 1 else []
-
-            for p in rows:
-                if parking_name in p.get("PARKPLC_NM", ""):
-                    return {
-                        "total_spots": p.get("PARKNG_COMPRT_PLANE_CNT"),
-                        "available_spots": None,
-                        "operating_info": {},
-                        "fee_info": {}
-                    }
-    except Exception:
-        pass
+        if public_code:
+            row = _master_db().get("gyeonggi", public_code)
+            p = GyeonggiLot.from_row(row) if row is not None else None
+        else:
+            matcher = _gyeonggi_snapshot.get_index()
+            p = matcher.match(parking_name, address, lat, lng) if matcher else None
+        if p is not None:
+            return {
+                "total_spots": p.get("PARKNG_COMPRT_PLANE_CNT"),
+                "available_spots": None,
+                "operating_info": {},
+                "fee_info": {}
+            }
+    except Exception as e:
+        metrics.record_error("gyeonggi_realtime", e)
 
     return {
         "status": "unavailable",
@@ -135,54 +358,223 @@ def _get_realtime_info_gyeonggi(parking_name: str, address: str) -> Dict[str, An
 # -------------------------------
 # 주소 → 좌표
 # -------------------------------
-def _address_to_coordinates(address: str) -> Tuple[Optional[float], Optional[float]]:
+async def _address_to_coordinates(address: str) -> Tuple[Optional[float], Optional[float]]:
     try:
-        client = KakaoLocalClient()
-        response = client.address_to_coordinates(address)
+        with metrics.time_stage("geocode"):
+            response = await _async_kakao_client().address_to_coordinates(address)
         docs = response.get("data", {}).get("documents", [])
         if docs:
             return float(docs[0]["y"]), float(docs[0]["x"])
-    except Exception:
-        pass
+    except (RateLimitError, CircuitOpenError):
+        # 호출 한도 초과/회로 열림은 "주차 정보 없음"이 아니므로 호출한 쪽에서 실패 결과로 응답
+        raise
+    except Exception as e:
+        metrics.record_error("geocode", e)
     return None, None
 
 
+def _document_coordinates(document: Dict[str, Any]) -> Tuple[Optional[float], Optional[float]]:
+    """카카오 검색 결과 문서의 (위도, 경도)"""
+    try:
+        return float(document["y"]), float(document["x"])
+    except (KeyError, TypeError, ValueError):
+        return None, None
+
+
 # -------------------------------
-# MCP Tool
+# 주차장 1건 정보 구성
 # -------------------------------
-@app.tool()
-def search_nearby_parking(address: str) -> dict:
-    lat, lng = _address_to_coordinates(address)
-    if lat is None or lng is None:
-        return {
-            "success": True,
-            "parkings": [],
-            "count": 0,
-            "notice": "주차 정보가 없습니다"
-        }
+def _build_parking_entry(document: Dict[str, Any]) -> Dict[str, Any]:
+    addr = document.get("address_name", "")
+    region = _get_region(addr)
+    place_lat, place_lng = _document_coordinates(document)
 
-    kakao = KakaoLocalClient()
-    response = kakao.search_parking_nearby(lat, lng, 1000, 10)
-    parkings = []
-
-    for p in response.get("data", {}).get("documents", []):
-        addr = p.get("address_name", "")
-        region = _get_region(addr)
+    # 카탈로그 문서에는 공공데이터 주차장 코드가 미리 연결되어 있음
+    public_code = document.get("public_code") if document.get("public_region") == region else None
 
+    with metrics.time_stage("realtime_lookup", region=region):
         realtime = (
-            _get_realtime_info_seoul(p["place_name"], addr) if region == "seoul"
-            else _get_realtime_info_gyeonggi(p["place_name"], addr) if region == "gyeonggi"
+            _get_realtime_info_seoul(document["place_name"], addr, place_lat, place_lng, public_code) if region == "seoul"
+            else _get_realtime_info_gyeonggi(document["place_name"], addr, place_lat, place_lng, public_code) if region == "gyeonggi"
             else {"status": "unavailable"}
         )
 
-        standard = {
-            "name": p["place_name"],
-            "address": addr,
-            "total_spots": None,
-            "fee": None
-        }
+    standard = {
+        "name": document["place_name"],
+        "address": addr,
+        "total_spots": None,
+        "fee": None
+    }
+
+    with metrics.time_stage("format"):
+        return _format_parking_info(standard, region, realtime)
+
+
+# 주차장별 실시간 정보 조회 동시 실행 수
+_REALTIME_CONCURRENCY = int(os.getenv("REALTIME_CONCURRENCY", "8"))
+
+
+async def _build_parking_entries(documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """주차장별 실시간 정보 조회를 동시 실행 수 제한 하에 병렬로 수행 (결과는 입력 순서 유지)"""
+    semaphore = asyncio.Semaphore(max(1, _REALTIME_CONCURRENCY))
+
+    async def build(document: Dict[str, Any]) -> Dict[str, Any]:
+        async with semaphore:
+            return await run_blocking(_build_parking_entry, document)
+
+    return list(await asyncio.gather(*(build(document) for document in documents)))
+
+
+def _has_public_match(document: Dict[str, Any]) -> Optional[bool]:
+    """
+    카카오 문서가 공공데이터 주차장과 매칭되는지 (적응형 검색의 좋은 결과 기준)
+
+    공공데이터가 없는 지역의 문서는 None
+    """
+    addr = document.get("address_name", "")
+    region = _get_region(addr)
+    snapshot = _seoul_master if region == "seoul" else _gyeonggi_snapshot if region == "gyeonggi" else None
+    if snapshot is None:
+        return None
+    if "public_code" in document:
+        return document["public_code"] is not None
+    matcher = snapshot.get_index()
+    if not matcher:
+        return False
+    lat, lng = _document_coordinates(document)
+    return matcher.match(document.get("place_name", ""), addr, lat, lng) is not None
+
+
+_SEARCH_SETTINGS = default_search_settings()
+
+
+# -------------------------------
+# 주차장 카탈로그 (미리 수집한 카카오 주차장 → 타일 캐시 예열)
+# -------------------------------
+# 카탈로그를 카카오 API 대신 사용할 최대 나이 (초)
+_CATALOG_MAX_AGE = float(os.getenv("CATALOG_MAX_AGE", str(7 * 24 * 3600)))
+
+
+def _load_catalog_tiles() -> List[Dict[str, Any]]:
+    catalog = open_catalog()
+    if catalog is None:
+        return []
+    try:
+        tiles, oldest = catalog.load_tiles()
+    finally:
+        catalog.close()
+    return [{"tile": tile, "documents": documents, "crawled_at": oldest} for tile, documents in tiles.items()]
+
+
+def _preload_catalog(rows: List[Dict[str, Any]]) -> int:
+    """카탈로그 타일을 타일 캐시에 올림 (정밀도가 다른 타일은 무시)"""
+    cache = get_tile_cache()
+    if cache is None:
+        return 0
+    tiles = {row["tile"]: row["documents"] for row in rows if len(row["tile"]) == cache.precision}
+    oldest = min((row["crawled_at"] for row in rows), default=0.0)
+    cache.preload(tiles, expires_at=oldest + _CATALOG_MAX_AGE)
+    return len(tiles)
+
+
+# 다른 프로세스(수집기)가 카탈로그 파일을 갱신하면 주기적으로 다시 읽음
+_catalog_snapshot = SnapshotStore(
+    "catalog",
+    _load_catalog_tiles,
+    ttl=float(os.getenv("CATALOG_RELOAD_TTL", "3600")),
+    index_builder=_preload_catalog,
+)
 
-        parkings.append(_format_parking_info(standard, region, realtime))
+
+async def _search_near_coordinates(
+    lat: float,
+    lng: float,
+    limiter: Optional[AsyncRateLimiter] = None
+) -> List[Dict[str, Any]]:
+    """좌표 주변 주차장 검색 후 주차장별 정보 구성"""
+    engine = AdaptiveParkingSearch(
+        _async_kakao_client(),
+        is_good=_has_public_match,
+        tile_cache=get_tile_cache(),
+        **_SEARCH_SETTINGS
+    )
+    with metrics.time_stage("kakao_search"):
+        documents = await engine.search(lat, lng, limiter=limiter)
+    entries = await _build_parking_entries(documents)
+    return _rank_entries(lat, lng, documents, entries)
+
+
+# 결과 순위 가중치 (둘 다 0이면 거리순 유지)
+# 기본값: 빈자리가 모두 남은 주차장은 만차인 곳보다 300m, 기본 요금 1000원이 싼 곳은 100m 멀어도 앞에 둠
+_RANK_AVAILABILITY_WEIGHT = float(os.getenv("RANK_AVAILABILITY_WEIGHT", "0.3"))
+_RANK_FEE_WEIGHT = float(os.getenv("RANK_FEE_WEIGHT", "0.1"))
+
+
+def _rank_entries(
+    lat: float,
+    lng: float,
+    documents: List[Dict[str, Any]],
+    entries: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """거리, 가용률, 기본 요금 점수로 주차장 정렬 (가중치가 모두 0이면 그대로)"""
+    if not (_RANK_AVAILABILITY_WEIGHT or _RANK_FEE_WEIGHT) or len(entries) < 2:
+        return entries
+    with metrics.time_stage("rank"):
+        candidates = CandidateSet(
+            documents,
+            capacity=[entry.get("total_spots") for entry in entries],
+            available=[entry.get("available_spots") for entry in entries],
+            fee=[(entry.get("fee_info") or {}).get("basic_fee") for entry in entries],
+        )
+        order = candidates.rank(
+            lat, lng,
+            availability_weight=_RANK_AVAILABILITY_WEIGHT,
+            fee_weight=_RANK_FEE_WEIGHT,
+        )
+    return [entries[i] for i in order]
+
+
+def _no_parking_result() -> Dict[str, Any]:
+    return {
+        "success": True,
+        "parkings": [],
+        "count": 0,
+        "notice": "주차 정보가 없습니다"
+    }
+
+
+def _retry_later_result(error: Exception) -> Dict[str, Any]:
+    """카카오 호출 한도(RateLimitError) 또는 열린 회로(CircuitOpenError) 실패 결과 (retry_after 포함)"""
+    if isinstance(error, CircuitOpenError):
+        message = "카카오 검색이 잠시 응답하지 않아 잠시 후 다시 시도해 주세요"
+    else:
+        message = "검색 요청이 많아 잠시 후 다시 시도해 주세요"
+    result = {
+        "success": False,
+        "error": message,
+        "parkings": [],
+        "count": 0
+    }
+    if error.retry_after is not None:
+        result["retry_after"] = round(error.retry_after, 1)
+    return result
+
+
+# -------------------------------
+# MCP Tool
+# -------------------------------
+@app.tool()
+async def search_nearby_parking(address: str) -> dict:
+    with metrics.time_stage("search_nearby_parking"):
+        try:
+            lat, lng = await _address_to_coordinates(address)
+            if lat is None or lng is None:
+                return _no_parking_result()
+            parkings = await _search_near_coordinates(lat, lng)
+        except (RateLimitError, CircuitOpenError) as e:
+            # 카카오 호출 한도에 걸리거나 회로가 열리면 (대신 쓸 타일도 없으면) 예외 대신 실패 결과로 응답
+            metrics.record_error("kakao_search", e)
+            return _retry_later_result(e)
 
     return {
         "success": True,
@@ -191,6 +583,142 @@ def search_nearby_parking(address: str) -> dict:
     }
 
 
+# 배치 검색 설정
+_BATCH_MAX_ADDRESSES = int(os.getenv("BATCH_MAX_ADDRESSES", "50"))
+_BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", "4"))
+_BATCH_KAKAO_QPS = float(os.getenv("BATCH_KAKAO_QPS", "10"))
+
+
+@app.tool()
+async def search_nearby_parking_batch(addresses: List[str]) -> dict:
+    """
+    여러 주소의 주변 주차장을 한 번에 검색
+
+    같은 주소는 한 번만 좌표로 변환하고, 같은 좌표는 한 번만 검색합니다.
+    실시간 정보는 모든 주소가 같은 스냅샷을 사용합니다.
+    """
+    if len(addresses) > _BATCH_MAX_ADDRESSES:
+        return {
+            "success": False,
+            "error": f"한 번에 최대 {_BATCH_MAX_ADDRESSES}개 주소까지 검색할 수 있습니다",
+            "results": [],
+            "count": 0
+        }
+
+    semaphore = asyncio.Semaphore(max(1, _BATCH_CONCURRENCY))
+    limiter = AsyncRateLimiter(_BATCH_KAKAO_QPS)
+
+    async def limited(coro_func, *args):
+        async with semaphore:
+            await limiter.acquire()
+            return await coro_func(*args)
+
+    # 1) 주소 중복 제거 후 좌표 변환
+    unique_addresses = {}
+    for address in addresses:
+        unique_addresses.setdefault(normalize_address_key(address), address)
+    keys = list(unique_addresses)
+    coordinates = dict(zip(keys, await asyncio.gather(
+        *(limited(_address_to_coordinates, unique_addresses[key]) for key in keys),
+        return_exceptions=True
+    )))
+
+    # 2) 좌표 중복 제거 후 주변 검색 (검색 한 건이 여러 페이지를 요청하므로 요청마다 속도 제한)
+    async def search(lat: float, lng: float) -> List[Dict[str, Any]]:
+        async with semaphore:
+            return await _search_near_coordinates(lat, lng, limiter=limiter)
+
+    unique_points = sorted({point for point in coordinates.values() if isinstance(point, tuple) and None not in point})
+    searches = await asyncio.gather(
+        *(search(lat, lng) for lat, lng in unique_points),
+        return_exceptions=True
+    )
+    parkings_by_point = dict(zip(unique_points, searches))
+
+    # 3) 입력 순서대로 주소별 결과 구성
+    results = []
+    for address in addresses:
+        point = coordinates[normalize_address_key(address)]
+        # 좌표 변환이 호출 한도/회로 열림으로 실패한 주소는 예외가 그대로 들어 있음
+        parkings = point if isinstance(point, Exception) else parkings_by_point.get(point)
+        if parkings is None:
+            result = _no_parking_result()
+        elif isinstance(parkings, (RateLimitError, CircuitOpenError)):
+            result = _retry_later_result(parkings)
+        elif isinstance(parkings, Exception):
+            result = {
+                "success": False,
+                "error": "주차장 검색 중 문제가 발생했습니다",
+                "parkings": [],
+                "count": 0
+            }
+        else:
+            result = {
+                "success": True,
+                "parkings": parkings,
+                "count": len(parkings)
+            }
+        results.append({"address": address, **result})
+
+    return {
+        "success": True,
+        "results": results,
+        "count": len(results)
+    }
+
+
+# -------------------------------
+# 서버 지표
+# -------------------------------
+def _geocode_cache_stats() -> Dict[str, float]:
+    stats = get_geocode_cache().stats()
+    return {"hits": stats["hits"], "misses": stats["misses"], "hit_ratio": stats["hit_ratio"]}
+
+
+def _tile_cache_stats() -> Dict[str, float]:
+    cache = get_tile_cache()
+    if cache is None:
+        return {}
+    return cache.stats()
+
+
+def _snapshot_stats() -> Dict[str, float]:
+    stats = {}
+    for snapshot in (_seoul_master, _seoul_snapshot, _gyeonggi_snapshot, _catalog_snapshot):
+        stats[f"{snapshot.name}_rows"] = snapshot.row_count
+        stats[f"{snapshot.name}_version"] = snapshot.version
+        if snapshot.loaded_at:
+            stats[f"{snapshot.name}_age_seconds"] = time.time() - snapshot.loaded_at
+    return stats
+
+
+metrics.registry.register_collector(
+    "parking_geocode_cache", "주소 → 좌표 캐시 적중 통계", _geocode_cache_stats
+)
+metrics.registry.register_collector(
+    "parking_tile_cache", "주변 검색 타일 캐시 적중 통계", _tile_cache_stats
+)
+metrics.registry.register_collector(
+    "parking_snapshot", "공공데이터 스냅샷 행 수 및 경과 시간 (초)", _snapshot_stats
+)
+metrics.registry.register_collector(
+    "parking_upstream_budget", "외부 API별 남은 토큰 수와 오늘 사용량/남은 할당량", limiter_stats
+)
+metrics.registry.register_collector(
+    "parking_circuit_state", "외부 API별 회로 차단기 상태 (0 닫힘, 1 반열림, 2 열림)", breaker_states,
+    label="upstream"
+)
+
+
+@app.tool()
+def get_server_metrics() -> dict:
+    """서버 지표 조회 (단계별 지연 시간, 외부 API 호출/오류 수, 캐시 적중률)"""
+    return {
+        "success": True,
+        "metrics": metrics.registry.snapshot()
+    }
+
+
 @app.tool()
 def mcp_health_check(address: str) -> dict:
     return {
@@ -203,8 +731,60 @@ def mcp_health_check(address: str) -> dict:
     }
 
 
-def main():
-    app.run()
+def realtime_sources() -> Tuple[SnapshotStore, SnapshotStore]:
+    """공유 스냅샷 갱신 프로세스가 돌릴 (서울 실시간, 경기) 스냅샷"""
+    return _seoul_snapshot, _gyeonggi_snapshot
+
+
+def snapshot_versions() -> Dict[str, int]:
+    """스냅샷별 현재 버전 (헬스 체크용)"""
+    return {
+        snapshot.name: snapshot.version
+        for snapshot in (_seoul_master, _seoul_snapshot, _gyeonggi_snapshot, _catalog_snapshot)
+    }
+
+
+def warm_up() -> None:
+    """
+    프로세스 시작 시 준비 작업
+
+    카탈로그를 타일 캐시에 올리고, 실시간 스냅샷은 로컬 DB에 저장된 마지막 스냅샷으로
+    채운 뒤 백그라운드 갱신을 시작합니다 (첫 요청이 원천 API를 기다리지 않도록).
+    """
+    _catalog_snapshot.get_rows()
+    if _STALE_WHILE_REVALIDATE:
+        # 저장된 스냅샷으로 바로 채우고 갱신 스레드 시작 (없으면 최대 SNAPSHOT_MAX_WAIT초 대기)
+        for snapshot in (_seoul_snapshot, _gyeonggi_snapshot):
+            snapshot.get_rows()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(prog="parking-mcp", description="주차장 정보 조회 MCP 서버")
+    parser.add_argument(
+        "--transport", choices=("stdio", "http", "sse"), default=os.getenv("MCP_TRANSPORT", "stdio"),
+        help="stdio (기본값, 클라이언트 1개) 또는 http (streamable HTTP) / sse",
+    )
+    parser.add_argument("--host", default=os.getenv("MCP_HOST", "127.0.0.1"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("MCP_PORT", "8000")))
+    parser.add_argument(
+        "--workers", type=int, default=int(os.getenv("MCP_WORKERS", "1")),
+        help="HTTP 워커 프로세스 수 (SIGHUP으로 워커 무중단 재시작)",
+    )
+    parser.add_argument("--path", default=os.getenv("MCP_HTTP_PATH"), help="MCP 엔드포인트 경로")
+    args = parser.parse_args(argv)
+
+    if args.transport == "stdio":
+        metrics.start_metrics_server()
+        warm_up()
+        app.run()
+        return
+
+    from src.asgi import serve
+
+    try:
+        serve(args.transport, host=args.host, port=args.port, workers=args.workers, path=args.path)
+    except ValueError as e:
+        parser.error(str(e))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,450 @@
+"""
+여러 서버 프로세스가 공유하는 실시간 스냅샷 파일
+갱신 프로세스 하나만 원천 API를 호출해 압축 레코드를 버전별 바이너리 파일로 쓰고,
+워커 프로세스는 파일을 mmap으로 열어 복사 없이 읽으며 새 버전이 나오면 통째로 교체
+
+파일 구성 (모두 little-endian, 8바이트 정렬):
+    헤더     magic "PKS1", 형식 번호(H), 열 수(H), 버전(Q), 기록 시각(d), 행 수(I)
+    열 형식  열마다 1바이트 ("s" 문자열, "q" 정수, "d" 실수)
+    열 데이터 정수/실수: 행 수 x 8바이트 (None은 INT64_MIN / NaN)
+             문자열: (시작, 길이) x 행 수 (q, 길이 -1은 None) + 바이트 길이(Q) + UTF-8 바이트
+    키 색인  키 열 번호(Q), 항목 수(Q), 키 순서로 정렬한 행 번호 x 항목 수 (q)
+             (문자열 키는 UTF-8 바이트 순서, None 키는 제외, 같은 키는 마지막 행만)
+현재 버전은 "<이름>.current" 포인터 파일이 가리키며, 포인터는 os.replace로 원자적으로 교체
+
+갱신 프로세스:
+    python -m src.shared_snapshot refresh
+"""
+
+import argparse
+import math
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Type
+
+from dotenv import load_dotenv
+
+from src import metrics
+from src.api_clients.rate_limit import BACKGROUND, set_default_priority
+from src.records import CompactRecord, SeoulOccupancy
+
+load_dotenv()
+
+_MAGIC = b"PKS1"
+_FORMAT = 2
+_HEADER = struct.Struct("<4sHHQdI")
+_INT_NONE = -(1 << 63)
+# 교체 후에도 남겨 둘 이전 버전 파일 수 (아직 읽고 있는 워커를 위해)
+_KEEP_FILES = 3
+
+SHARED_SNAPSHOT_SWAPS = "parking_shared_snapshot_swaps_total"
+
+
+def _pad(length: int) -> bytes:
+    return b"\0" * (-length % 8)
+
+
+def _sort_key(value: Any) -> Any:
+    # 읽는 쪽 이진 탐색과 같은 순서 (문자열은 UTF-8 바이트 비교)
+    return value.encode("utf-8") if isinstance(value, str) else value
+
+
+def _encode(
+    records: Sequence[CompactRecord],
+    record_cls: Type[CompactRecord],
+    version: int,
+    written_at: float,
+    key_attr: str = "code",
+) -> bytes:
+    kinds = record_cls.kinds()
+    parts = [_HEADER.pack(_MAGIC, _FORMAT, len(kinds), version, written_at, len(records))]
+    kind_bytes = "".join(kinds).encode("ascii")
+    parts.append(kind_bytes + _pad(_HEADER.size + len(kind_bytes)))
+
+    for (attr, _, _), kind in zip(record_cls.FIELDS, kinds):
+        values = [getattr(record, attr) for record in records]
+        if kind == "q":
+            parts.append(array("q", (_INT_NONE if v is None else v for v in values)).tobytes())
+        elif kind == "d":
+            parts.append(array("d", (math.nan if v is None else v for v in values)).tobytes())
+        else:
+            spans = array("q")
+            blob = bytearray()
+            for value in values:
+                if value is None:
+                    spans.extend((0, -1))
+                    continue
+                encoded = value.encode("utf-8")
+                spans.extend((len(blob), len(encoded)))
+                blob += encoded
+            parts.append(spans.tobytes())
+            parts.append(struct.pack("<Q", len(blob)) + bytes(blob) + _pad(len(blob)))
+
+    attrs = [attr for attr, _, _ in record_cls.FIELDS]
+    last_row: Dict[Any, int] = {}
+    for i, record in enumerate(records):
+        key = getattr(record, key_attr)
+        if key is not None:
+            last_row[key] = i
+    order = sorted(last_row.items(), key=lambda item: _sort_key(item[0]))
+    parts.append(struct.pack("<QQ", attrs.index(key_attr), len(order)))
+    parts.append(array("q", (i for _, i in order)).tobytes())
+    return b"".join(parts)
+
+
+class SharedTable:
+    """
+    스냅샷 파일 하나를 mmap으로 연 읽기 전용 표
+
+    행은 조회할 때 필요한 행만 레코드로 만들며 (한 번 만든 행은 재사용),
+    열 데이터는 복사하지 않고 mmap을 직접 가리킵니다. 키 조회도 워커마다 키 dict를
+    만들지 않고 파일의 정렬된 키 색인을 이진 탐색합니다.
+    """
+
+    def __init__(self, path: str, record_cls: Type[CompactRecord], key_attr: str = "code"):
+        """
+        Args:
+            path: 스냅샷 파일 경로
+            record_cls: 행 레코드 클래스 (파일의 열 구성과 같아야 함)
+            key_attr: get()에 쓸 키 속성 (publish()에 넘긴 키 속성과 같아야 함)
+        """
+        self.path = path
+        self.record_cls = record_cls
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mm)
+
+        magic, fmt, ncols, self.version, self.written_at, self.rows = _HEADER.unpack_from(view, 0)
+        if magic != _MAGIC or fmt != _FORMAT:
+            raise ValueError(f"스냅샷 파일 형식이 아닙니다: {path}")
+        offset = _HEADER.size
+        kinds = tuple(bytes(view[offset:offset + ncols]).decode("ascii"))
+        if kinds != record_cls.kinds():
+            raise ValueError(f"스냅샷 열 구성이 {record_cls.__name__}와 다릅니다: {path}")
+        offset += ncols
+        offset += -offset % 8
+
+        # 속성 → (형식, 값 배열, 문자열 바이트 시작 위치)
+        self._columns: Dict[str, tuple] = {}
+        for (attr, _, _), kind in zip(record_cls.FIELDS, kinds):
+            if kind in ("q", "d"):
+                size = self.rows * 8
+                self._columns[attr] = (kind, view[offset:offset + size].cast(kind), 0)
+                offset += size
+            else:
+                size = self.rows * 16
+                spans = view[offset:offset + size].cast("q")
+                offset += size
+                (blob_len,) = struct.unpack_from("<Q", view, offset)
+                offset += 8
+                self._columns[attr] = (kind, spans, offset)
+                offset += blob_len + (-blob_len % 8)
+
+        key_column, entries = struct.unpack_from("<QQ", view, offset)
+        offset += 16
+        if record_cls.FIELDS[key_column][0] != key_attr:
+            raise ValueError(f"스냅샷 키 색인이 {key_attr} 열이 아닙니다: {path}")
+        self._key_attr = key_attr
+        self._order = view[offset:offset + entries * 8].cast("q")
+
+        self._view = view
+        self._rows_cache: Dict[int, CompactRecord] = {}
+
+    def _value(self, attr: str, i: int) -> Any:
+        kind, column, base = self._columns[attr]
+        if kind == "q":
+            value = column[i]
+            return None if value == _INT_NONE else value
+        if kind == "d":
+            value = column[i]
+            return None if value != value else value
+        start, length = column[2 * i], column[2 * i + 1]
+        if length < 0:
+            return None
+        return sys.intern(str(self._view[base + start:base + start + length], "utf-8"))
+
+    def _raw_key(self, i: int) -> Any:
+        # 이진 탐색 비교용 키 (문자열은 디코드/intern 없이 바이트로)
+        kind, column, base = self._columns[self._key_attr]
+        if kind != "s":
+            return self._value(self._key_attr, i)
+        start, length = column[2 * i], column[2 * i + 1]
+        return bytes(self._view[base + start:base + start + length])
+
+    def _find(self, key: Any) -> Optional[int]:
+        kind = self._columns[self._key_attr][0]
+        if kind == "s":
+            if not isinstance(key, str):
+                return None
+            target = key.encode("utf-8")
+        elif isinstance(key, (int, float)):
+            target = key
+        else:
+            return None
+        low, high = 0, len(self._order)
+        while low < high:
+            mid = (low + high) // 2
+            if self._raw_key(self._order[mid]) < target:
+                low = mid + 1
+            else:
+                high = mid
+        if low < len(self._order) and self._raw_key(self._order[low]) == target:
+            return self._order[low]
+        return None
+
+    def row(self, i: int) -> CompactRecord:
+        """i번째 행 레코드"""
+        record = self._rows_cache.get(i)
+        if record is None:
+            record = self.record_cls.__new__(self.record_cls)
+            for attr, _, _ in self.record_cls.FIELDS:
+                setattr(record, attr, self._value(attr, i))
+            self._rows_cache[i] = record
+        return record
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """키 속성으로 행 조회 (dict.get 호환)"""
+        i = self._find(key)
+        return self.row(i) if i is not None else default
+
+    def __contains__(self, key: Any) -> bool:
+        return self._find(key) is not None
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __iter__(self) -> Iterator[Any]:
+        return (self._value(self._key_attr, i) for i in self._order)
+
+    def records(self) -> List[CompactRecord]:
+        """전체 행 레코드 목록"""
+        return [self.row(i) for i in range(self.rows)]
+
+
+def publish(
+    directory: str,
+    name: str,
+    records: Sequence[CompactRecord],
+    record_cls: Type[CompactRecord],
+    version: int,
+    written_at: Optional[float] = None,
+    key_attr: str = "code",
+) -> str:
+    """
+    스냅샷 새 버전 쓰기
+
+    버전마다 새 파일을 만들고 포인터 파일만 원자적으로 바꾸므로, 이전 버전을 mmap으로
+    읽고 있는 워커는 영향을 받지 않습니다. 오래된 버전 파일은 몇 개만 남기고 지웁니다.
+
+    Args:
+        directory: 스냅샷 디렉터리
+        name: 스냅샷 이름 (예: "seoul")
+        records: 행 레코드 목록
+        record_cls: 행 레코드 클래스
+        version: 스냅샷 버전
+        written_at: 데이터 적재 시각 (없으면 현재)
+        key_attr: 키 색인을 만들 속성
+
+    Returns:
+        쓴 파일 경로
+    """
+    os.makedirs(directory, exist_ok=True)
+    filename = f"{name}.{time.time_ns()}.bin"
+    path = os.path.join(directory, filename)
+    data = _encode(records, record_cls, version, written_at or time.time(), key_attr)
+    with open(path + ".tmp", "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(path + ".tmp", path)
+
+    pointer = os.path.join(directory, f"{name}.current")
+    with open(pointer + ".tmp", "w", encoding="ascii") as f:
+        f.write(filename)
+    for attempt in range(10):
+        try:
+            os.replace(pointer + ".tmp", pointer)
+            break
+        except PermissionError:
+            # Windows에서 워커가 포인터를 읽는 순간이면 잠시 후 재시도
+            time.sleep(0.01 * (attempt + 1))
+
+    old = sorted(
+        (entry for entry in os.listdir(directory)
+         if entry.startswith(f"{name}.") and entry.endswith(".bin") and entry != filename),
+        key=lambda entry: os.path.getmtime(os.path.join(directory, entry)),
+    )
+    for entry in old[:-_KEEP_FILES] if len(old) > _KEEP_FILES else []:
+        try:
+            os.remove(os.path.join(directory, entry))
+        except OSError:
+            pass  # 아직 열려 있는 파일 (Windows)
+    return path
+
+
+class SharedSnapshotReader:
+    """
+    공유 스냅샷 파일을 읽는 SnapshotStore 대체 (워커 프로세스용)
+
+    원천 API를 호출하지 않으며, 최대 check_interval초마다 포인터 파일을 확인해
+    새 버전이 있으면 새 SharedTable로 통째로 교체합니다 (참조 하나를 바꾸므로
+    조회 중인 스레드는 이전 표를 끝까지 안전하게 읽음).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        directory: str,
+        record_cls: Type[CompactRecord],
+        key_attr: str = "code",
+        check_interval: float = 1.0,
+    ):
+        """
+        Args:
+            name: 스냅샷 이름 (publish()와 같아야 함)
+            directory: 스냅샷 디렉터리
+            record_cls: 행 레코드 클래스
+            key_attr: get_index()가 돌려주는 표의 키 속성
+            check_interval: 새 버전 확인 간격 (초)
+        """
+        self.name = name
+        self.directory = directory
+        self.record_cls = record_cls
+        self.key_attr = key_attr
+        self.check_interval = check_interval
+        self._pointer = os.path.join(directory, f"{name}.current")
+        self._table: Optional[SharedTable] = None
+        self._current = ""
+        self._version = 0
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _check(self) -> Optional[SharedTable]:
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval and self._table is not None:
+            return self._table
+        with self._lock:
+            if now - self._checked_at < self.check_interval and self._table is not None:
+                return self._table
+            self._checked_at = now
+            try:
+                with open(self._pointer, encoding="ascii") as f:
+                    current = f.read().strip()
+                if current and current != self._current:
+                    table = SharedTable(os.path.join(self.directory, current), self.record_cls, self.key_attr)
+                    self._table = table
+                    self._current = current
+                    self._version += 1
+                    metrics.registry.counter(
+                        SHARED_SNAPSHOT_SWAPS, "공유 스냅샷 새 버전으로 교체한 횟수"
+                    ).inc(snapshot=self.name)
+            except FileNotFoundError:
+                pass  # 갱신 프로세스가 아직 첫 버전을 쓰지 않음
+            except (OSError, ValueError) as e:
+                metrics.record_error(f"{self.name}_shared_snapshot", e)
+        return self._table
+
+    def get_index(self) -> Optional[SharedTable]:
+        """현재 표 (키 속성 → 레코드, 아직 없으면 None)"""
+        return self._check()
+
+    def get_rows(self) -> List[CompactRecord]:
+        table = self._check()
+        return table.records() if table is not None else []
+
+    def refresh(self) -> bool:
+        """즉시 새 버전 확인"""
+        self._checked_at = 0.0
+        return self._check() is not None
+
+    def start(self) -> None:
+        """SnapshotStore 호환 (갱신은 다른 프로세스가 하므로 할 일 없음)"""
+
+    def stop(self) -> None:
+        """SnapshotStore 호환"""
+
+    @property
+    def loaded_at(self) -> float:
+        """갱신 프로세스가 데이터를 적재한 시각 (미적재 시 0)"""
+        return self._table.written_at if self._table is not None else 0.0
+
+    @property
+    def row_count(self) -> int:
+        return len(self._table) if self._table is not None else 0
+
+    @property
+    def version(self) -> int:
+        """이 프로세스가 교체한 횟수"""
+        return self._version
+
+    def data_age(self) -> Optional[float]:
+        """데이터 나이 (초, 미적재 시 None)"""
+        if self._table is None:
+            return None
+        return max(0.0, time.time() - self._table.written_at)
+
+
+def default_shared_dir() -> str:
+    """SHARED_SNAPSHOT_DIR 환경변수 (없으면 ~/.cache/parking-mcp/shared)"""
+    return os.getenv(
+        "SHARED_SNAPSHOT_DIR",
+        os.path.join(os.path.expanduser("~"), ".cache", "parking-mcp", "shared"),
+    )
+
+
+def run_refresher(stop: Optional[Any] = None, poll_interval: float = 1.0) -> None:
+    """
+    갱신 프로세스 본체
+
+    서버 모듈을 writer 역할로 불러 서울 실시간 스냅샷과 경기 스냅샷을 평소처럼 갱신하고
+    (기본 정보 DB 동기화 포함), 서울 스냅샷이 새로 적재될 때마다 공유 파일로 씁니다.
+
+    Args:
+        stop: 종료 신호 (threading/multiprocessing Event, 없으면 무한 실행)
+        poll_interval: 스냅샷 적재 확인 간격 (초)
+    """
+    os.environ["SNAPSHOT_ROLE"] = "writer"
+    from src import server
+
+    # 갱신 프로세스의 호출은 모두 백그라운드 우선순위 (일일 할당량 예비분은 워커의 도구 호출용)
+    set_default_priority(BACKGROUND)
+
+    directory = default_shared_dir()
+    seoul, gyeonggi = server.realtime_sources()
+    published = 0.0
+    while stop is None or not stop.is_set():
+        # 만료되면 각 스냅샷의 백그라운드 스레드가 갱신 (경기는 DB가 오래됐을 때만 API 호출)
+        rows = seoul.get_rows()
+        gyeonggi.get_rows()
+        if seoul.loaded_at and seoul.loaded_at != published:
+            try:
+                publish(directory, seoul.name, SeoulOccupancy.from_rows(rows), SeoulOccupancy,
+                        seoul.version, seoul.loaded_at)
+                published = seoul.loaded_at
+            except OSError as e:
+                metrics.record_error(f"{seoul.name}_shared_snapshot_publish", e)
+        if stop is not None:
+            stop.wait(poll_interval)
+        else:
+            time.sleep(poll_interval)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="공유 실시간 스냅샷 갱신 프로세스")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("refresh", help="원천 API를 주기적으로 호출해 공유 스냅샷 파일 갱신")
+    parser.parse_args()
+    print(f"[공유 스냅샷] {default_shared_dir()}")
+    try:
+        run_refresher()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,343 @@
+"""
+공공데이터 스냅샷 저장소
+프로세스 전역에서 공유되는, 주기적으로 갱신되는 전체 테이블 캐시
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from src import metrics
+from src.api_clients.rate_limit import background_priority
+
+# 서울/경기 공공데이터의 시각 필드는 한국 표준시 기준
+KST = timezone(timedelta(hours=9))
+
+
+def parse_update_time(value: Optional[str]) -> Optional[float]:
+    """
+    공공데이터 업데이트 시각 문자열을 epoch 초로 변환
+
+    Args:
+        value: "YYYY-MM-DD HH:MM:SS" 형식의 KST 시각 문자열
+
+    Returns:
+        epoch 초 (파싱 실패 시 None)
+    """
+    if not value:
+        return None
+    try:
+        parsed = datetime.strptime(str(value)[:19], "%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        return None
+    return parsed.replace(tzinfo=KST).timestamp()
+
+
+SNAPSHOT_CHANGED_ROWS = "parking_snapshot_changed_rows_total"
+
+
+class SnapshotStore:
+    """
+    전체 테이블을 한 번 받아 메모리에서 제공하는 스냅샷 저장소
+
+    첫 조회 시 동기적으로 적재하고, 이후에는 백그라운드 스레드가 TTL 주기로
+    갱신합니다. update_field가 주어지면 행들의 최신 업데이트 시각을 기준으로
+    다음 갱신 시점을 맞춥니다 (원천 데이터가 갱신될 즈음에 다시 받아옴).
+    index_builder가 주어지면 적재할 때마다 검색 인덱스를 함께 만들어 둡니다.
+
+    key_field가 주어지면 갱신 때 새 행을 기존 스냅샷과 키(와 update_field 값)로
+    비교해 바뀐 행만 반영합니다. 바뀌지 않은 행은 기존 객체를 그대로 재사용하고,
+    index_updater가 있으면 인덱스도 바뀐 행만 고칩니다. 바뀐 행이 있을 때만 version이 올라갑니다.
+
+    stale_while_revalidate 모드에서는 조회 스레드가 원천 API를 기다리지 않습니다.
+    마지막 정상 스냅샷을 바로 돌려주고 갱신은 백그라운드에서만 하며, 아직 메모리에
+    스냅샷이 없으면 seed_loader(예: 디스크에 저장해 둔 스냅샷)로 채우거나
+    최대 max_wait초만 첫 적재를 기다립니다. 데이터 나이는 data_age()로 확인합니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        loader: Callable[[], List[Dict[str, Any]]],
+        ttl: float = 300.0,
+        min_interval: float = 30.0,
+        update_field: Optional[str] = None,
+        index_builder: Optional[Callable[[List[Dict[str, Any]]], Any]] = None,
+        key_field: Optional[str] = None,
+        index_updater: Optional[Callable[[Any, List[Dict[str, Any]], List[Hashable]], Any]] = None,
+        stale_while_revalidate: bool = False,
+        max_wait: float = 2.0,
+        seed_loader: Optional[Callable[[], Optional[Tuple[float, List[Dict[str, Any]]]]]] = None,
+        max_seed_age: float = 3600.0,
+    ):
+        """
+        Args:
+            name: 스냅샷 이름 (스레드 이름 등에 사용)
+            loader: 전체 행 목록을 반환하는 함수
+            ttl: 갱신 주기 (초)
+            min_interval: 최소 갱신 간격 (초)
+            update_field: 행별 업데이트 시각 필드명 (없으면 단순 TTL)
+            index_builder: 행 목록으로 검색 인덱스를 만드는 함수
+            key_field: 행 식별 필드명 (있으면 증분 갱신)
+            index_updater: (기존 인덱스, 바뀐 행, 사라진 키)로 인덱스를 고치는 함수
+                (없으면 바뀐 행이 있을 때 index_builder로 다시 만듦)
+            stale_while_revalidate: 조회 시 적재를 기다리지 않고 마지막 스냅샷 제공
+            max_wait: stale_while_revalidate 모드에서 스냅샷이 없을 때 첫 적재를 기다릴 최대 시간 (초)
+            seed_loader: (저장 시각, 행 목록)을 반환하는 초기 스냅샷 함수 (없으면 None 반환)
+            max_seed_age: 이보다 오래된 초기 스냅샷은 사용하지 않음 (초)
+        """
+        self.name = name
+        self.loader = loader
+        self.ttl = ttl
+        self.min_interval = min(min_interval, ttl)
+        self.update_field = update_field
+        self.index_builder = index_builder
+        self.key_field = key_field
+        self.index_updater = index_updater
+        self.stale_while_revalidate = stale_while_revalidate
+        self.max_wait = max_wait
+        self.seed_loader = seed_loader
+        self.max_seed_age = max_seed_age
+
+        self._rows: Optional[List[Dict[str, Any]]] = None
+        self._by_key: Dict[Hashable, Dict[str, Any]] = {}
+        self._index: Any = None
+        self._version = 0
+        self._loaded_at: float = 0.0
+        self._next_refresh_at: float = 0.0
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._attempted = threading.Event()
+        self._seed_lock = threading.Lock()
+        self._seed_tried = False
+
+    @property
+    def loaded_at(self) -> float:
+        """마지막으로 적재에 성공한 시각 (epoch 초, 미적재 시 0)"""
+        return self._loaded_at
+
+    @property
+    def row_count(self) -> int:
+        """현재 스냅샷 행 수"""
+        return len(self._rows or [])
+
+    def data_age(self) -> Optional[float]:
+        """
+        현재 스냅샷 데이터의 나이 (초)
+
+        Returns:
+            마지막 적재(또는 초기 스냅샷 저장) 이후 경과 시간 (스냅샷이 없으면 None)
+        """
+        if not self._loaded_at:
+            return None
+        return max(0.0, time.time() - self._loaded_at)
+
+    @property
+    def version(self) -> int:
+        """변경이 반영될 때마다 1씩 증가하는 스냅샷 버전"""
+        return self._version
+
+    def get_rows(self) -> List[Dict[str, Any]]:
+        """
+        현재 스냅샷 행 목록 반환
+
+        아직 적재되지 않았거나 백그라운드 갱신이 멈춘 상태에서 만료된 경우에만
+        호출 스레드에서 동기적으로 적재합니다.
+
+        Returns:
+            스냅샷 행 목록 (적재 실패 시 빈 목록)
+        """
+        if self.stale_while_revalidate:
+            return self._get_rows_nonblocking()
+
+        if self._rows is None or (
+            not self._is_refresher_alive() and time.time() >= self._next_refresh_at
+        ):
+            with self._lock:
+                if self._rows is None or time.time() >= self._next_refresh_at:
+                    self._refresh_locked()
+        self.start()
+        return self._rows or []
+
+    def _get_rows_nonblocking(self) -> List[Dict[str, Any]]:
+        if not self._seed_tried and self.seed_loader is not None:
+            # 갱신 잠금과 분리해 백그라운드 적재 중에도 조회가 막히지 않도록 함
+            with self._seed_lock:
+                if not self._seed_tried:
+                    self._seed_tried = True
+                    if self._rows is None:
+                        self._seed_locked()
+        # 만료된 갱신은 백그라운드 스레드가 처리 (스레드가 없으면 시작하자마자 갱신)
+        self.start()
+        if self._rows is None:
+            self._attempted.wait(self.max_wait)
+        return self._rows or []
+
+    def _seed_locked(self) -> None:
+        try:
+            seed = self.seed_loader()
+        except Exception as e:
+            metrics.record_error(f"{self.name}_snapshot_seed", e)
+            return
+        if not seed or not seed[1]:
+            return
+        saved_at, rows = seed
+        if time.time() - saved_at > self.max_seed_age:
+            return
+        index = self._build_index(rows)
+        if self.key_field:
+            self._by_key = self._key_rows(rows)
+        self._rows = rows
+        self._index = index
+        self._loaded_at = saved_at
+        self._version += 1
+        # 초기 스냅샷은 바로 백그라운드에서 새로 받아옴
+        self._next_refresh_at = 0.0
+
+    def get_index(self) -> Any:
+        """
+        현재 스냅샷에 대해 만들어 둔 검색 인덱스 반환
+
+        Returns:
+            index_builder의 결과 (index_builder가 없으면 None)
+        """
+        self.get_rows()
+        return self._index
+
+    def refresh(self) -> bool:
+        """
+        즉시 갱신
+
+        Returns:
+            갱신 성공 여부
+        """
+        with self._lock:
+            return self._refresh_locked()
+
+    def start(self) -> None:
+        """백그라운드 갱신 스레드 시작 (이미 실행 중이면 무시)"""
+        if self._is_refresher_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"{self.name}-snapshot-refresher",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """백그라운드 갱신 스레드 종료"""
+        self._stop.set()
+
+    def _is_refresher_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            delay = max(0.0, self._next_refresh_at - time.time())
+            if self._stop.wait(delay):
+                break
+            # 주기 갱신은 도구 호출보다 낮은 우선순위로 외부 API 예산을 씀
+            with background_priority():
+                self.refresh()
+
+    def _refresh_locked(self) -> bool:
+        now = time.time()
+        try:
+            rows = self.loader()
+        except Exception as e:
+            metrics.record_error(f"{self.name}_snapshot", e)
+            # 실패 시 기존 스냅샷을 유지하고 최소 간격 후 재시도
+            self._next_refresh_at = now + self.min_interval
+            if self._rows is None and not self.stale_while_revalidate:
+                self._rows = []
+                self._index = self._build_index([])
+            # 첫 적재가 실패하면 기다리던 조회는 빈 결과로 바로 돌려보냄
+            self._attempted.set()
+            return False
+
+        if self.key_field and self._rows is not None:
+            self._apply_delta(rows)
+        else:
+            # 인덱스를 먼저 만든 뒤 교체해 조회 중에 빈 인덱스가 보이지 않도록 함
+            index = self._build_index(rows)
+            if self.key_field:
+                self._by_key = self._key_rows(rows)
+            self._rows = rows
+            self._index = index
+            self._version += 1
+        self._loaded_at = now
+        self._next_refresh_at = self._compute_next_refresh(self._rows, now)
+        self._attempted.set()
+        return True
+
+    def _key_rows(self, rows: List[Dict[str, Any]]) -> Dict[Hashable, Dict[str, Any]]:
+        by_key: Dict[Hashable, Dict[str, Any]] = {}
+        for row in rows:
+            by_key.setdefault(row.get(self.key_field), row)
+        return by_key
+
+    def _is_same(self, old: Dict[str, Any], new: Dict[str, Any]) -> bool:
+        if self.update_field:
+            return old.get(self.update_field) == new.get(self.update_field)
+        return old == new
+
+    def _apply_delta(self, rows: List[Dict[str, Any]]) -> None:
+        """새 행 목록과 기존 스냅샷을 비교해 바뀐 행만 반영"""
+        previous = self._by_key
+        by_key: Dict[Hashable, Dict[str, Any]] = {}
+        merged: List[Dict[str, Any]] = []
+        changed: List[Dict[str, Any]] = []
+        for row in rows:
+            key = row.get(self.key_field)
+            if key in by_key:
+                continue
+            old = previous.get(key)
+            if old is not None and self._is_same(old, row):
+                row = old
+            else:
+                changed.append(row)
+            by_key[key] = row
+            merged.append(row)
+        removed = [key for key in previous if key not in by_key]
+
+        if not changed and not removed:
+            return
+
+        if self.index_updater is not None and self._index is not None:
+            index = self.index_updater(self._index, changed, removed)
+        else:
+            index = self._build_index(merged)
+        self._rows = merged
+        self._by_key = by_key
+        self._index = index
+        self._version += 1
+        metrics.registry.counter(
+            SNAPSHOT_CHANGED_ROWS, "증분 갱신으로 반영한 행 수"
+        ).inc(len(changed) + len(removed), snapshot=self.name)
+
+    def _build_index(self, rows: List[Dict[str, Any]]) -> Any:
+        if self.index_builder is None:
+            return None
+        return self.index_builder(rows)
+
+    def _compute_next_refresh(self, rows: List[Dict[str, Any]], now: float) -> float:
+        """최신 업데이트 시각 + TTL 시점에 맞춰 다음 갱신 시각 계산"""
+        if not self.update_field:
+            return now + self.ttl
+
+        latest = None
+        for row in rows:
+            updated = parse_update_time(row.get(self.update_field))
+            if updated is not None and (latest is None or updated > latest):
+                latest = updated
+
+        if latest is None:
+            return now + self.ttl
+
+        # 원천 갱신 예상 시점으로 맞추되 [min_interval, ttl] 범위로 제한
+        expected = latest + self.ttl
+        return min(max(expected, now + self.min_interval), now + self.ttl)
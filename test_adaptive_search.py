@@ -0,0 +1,133 @@
+"""
+적응형 주변 주차장 검색 테스트 (네트워크 불필요)
+- 1페이지로 충분하면 추가 요청 없음
+- 결과가 부족하면 밀도로 추정한 반경으로 한 번에 확장
+- 좋은 결과(공공데이터 매칭)가 부족하면 남은 페이지를 동시에 요청
+- 공공데이터가 없는 지역은 좋은 결과를 요구하지 않음
+- SEARCH_RADII가 비어 있으면 기본 반경, 빈 반경 목록은 생성 시 거부
+"""
+
+import asyncio
+import os
+
+from src.search import AdaptiveParkingSearch
+from src.search.adaptive_search import DEFAULT_RADII, default_search_settings
+
+CENTER = (37.5663, 126.9779)
+
+
+def make_documents(distances, good_every=0, region="서울 중구"):
+    documents = []
+    for i, distance in enumerate(distances):
+        name = f"공영{i}" if good_every and i % good_every == 0 else f"민영{i}"
+        documents.append({"id": str(i), "place_name": name, "address_name": region,
+                          "x": str(CENTER[1]), "y": str(CENTER[0]), "distance": str(distance)})
+    return documents
+
+
+class FakeKakao:
+    """반경/페이지 규칙을 흉내 내는 카카오 검색 (거리순)"""
+
+    def __init__(self, documents):
+        self.documents = sorted(documents, key=lambda d: int(d["distance"]))
+        self.calls = []
+
+    async def search_place(self, query, radius=None, page=1, size=15, **kwargs):
+        self.calls.append((radius, page))
+        found = [d for d in self.documents if int(d["distance"]) <= radius]
+        pageable = min(len(found), 45 * size)
+        start = (page - 1) * size
+        return {"status": "success", "data": {
+            "documents": found[start:min(start + size, pageable)],
+            "meta": {"total_count": len(found), "pageable_count": pageable,
+                     "is_end": start + size >= pageable},
+        }}
+
+
+def is_public(document):
+    if not document["address_name"].startswith("서울"):
+        return None
+    return document["place_name"].startswith("공영")
+
+
+def test_single_page_is_enough():
+    kakao = FakeKakao(make_documents(range(10, 400, 10)))
+    engine = AdaptiveParkingSearch(kakao, target=10)
+    documents = asyncio.run(engine.search(*CENTER))
+    assert kakao.calls == [(500, 1)]
+    assert [d["id"] for d in documents] == [str(i) for i in range(10)]
+    print(f"[OK] 1페이지로 종료: 요청 {len(kakao.calls)}회")
+
+
+def test_expands_radius_by_density():
+    # 500m 안 2건 → 10건을 채우려면 약 1118m 이상 필요 → 1000을 건너뛰고 2000
+    kakao = FakeKakao(make_documents([100, 300] + list(range(1200, 1900, 60))))
+    engine = AdaptiveParkingSearch(kakao, radii=(500, 1000, 2000, 5000), target=10)
+    documents = asyncio.run(engine.search(*CENTER))
+    assert kakao.calls == [(500, 1), (2000, 1)]
+    assert len(documents) == 10
+    assert [int(d["distance"]) for d in documents] == sorted(int(d["distance"]) for d in documents)
+    print(f"[OK] 반경 확장: {[r for r, _ in kakao.calls]}")
+
+
+def test_fetches_more_pages_for_good_matches():
+    # 가까운 15건은 모두 민영, 공영은 15건마다 1건 → 3페이지까지 받아야 3건
+    documents = make_documents(range(1, 46))
+    for document in documents[15::7]:
+        document["place_name"] = "공영" + document["place_name"]
+    kakao = FakeKakao(documents)
+    engine = AdaptiveParkingSearch(kakao, radii=(500,), target=10, min_good=3, is_good=is_public)
+    result = asyncio.run(engine.search(*CENTER))
+    assert sorted(kakao.calls) == [(500, 1), (500, 2), (500, 3)]
+    assert len(result) == 10
+    assert sum(1 for d in result if is_public(d)) == 3
+    assert [int(d["distance"]) for d in result] == sorted(int(d["distance"]) for d in result)
+    print(f"[OK] 좋은 결과 3건 확보: 페이지 요청 {len(kakao.calls)}회")
+
+
+def test_stops_at_page_limit():
+    # 500m 안에 100건이 넘으면 max_pages 이후로는 넓혀도 더 가까운 결과가 없으므로 종료
+    kakao = FakeKakao(make_documents([5] * 100))
+    engine = AdaptiveParkingSearch(kakao, target=10, min_good=3, max_pages=2, is_good=is_public)
+    result = asyncio.run(engine.search(*CENTER))
+    assert sorted(kakao.calls) == [(500, 1), (500, 2)]
+    assert len(result) == 10
+    print("[OK] 페이지 한도에서 종료")
+
+
+def test_no_public_data_region():
+    kakao = FakeKakao(make_documents(range(10, 200, 10), region="부산 해운대구"))
+    engine = AdaptiveParkingSearch(kakao, target=10, min_good=3, is_good=is_public)
+    result = asyncio.run(engine.search(*CENTER))
+    assert kakao.calls == [(500, 1)]
+    assert len(result) == 10
+    print("[OK] 공공데이터 없는 지역은 1페이지로 종료")
+
+
+def test_empty_radii():
+    original = os.environ.get("SEARCH_RADII")
+    try:
+        for value in ("", " , "):
+            os.environ["SEARCH_RADII"] = value
+            assert default_search_settings()["radii"] == DEFAULT_RADII
+    finally:
+        if original is None:
+            os.environ.pop("SEARCH_RADII", None)
+        else:
+            os.environ["SEARCH_RADII"] = original
+    try:
+        AdaptiveParkingSearch(FakeKakao([]), radii=())
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("빈 반경 목록이 통과함")
+    print("[OK] 빈 SEARCH_RADII는 기본 반경, 빈 radii는 ValueError")
+
+
+if __name__ == "__main__":
+    test_single_page_is_enough()
+    test_expands_radius_by_density()
+    test_fetches_more_pages_for_good_matches()
+    test_stops_at_page_limit()
+    test_no_public_data_region()
+    test_empty_radii()
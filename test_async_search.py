@@ -0,0 +1,94 @@
+"""
+search_nearby_parking 비동기 경로 테스트 (네트워크 불필요)
+- 주차장별 조회가 동시에 실행되는지 (동시 실행 수 제한 포함)
+- 결과 순서가 카카오 검색 순서와 같은지
+"""
+
+import asyncio
+import threading
+import time
+
+import src.server as server
+from src.matching import LotMatcher
+from src.snapshot import SnapshotStore
+
+DOCUMENTS = [
+    {"place_name": f"테스트{i} 주차장", "address_name": "경기 성남시 분당구", "x": "127.1", "y": "37.4"}
+    for i in range(6)
+]
+
+
+class FakeAsyncKakao:
+    async def address_to_coordinates(self, address):
+        return {"status": "success", "data": {"documents": [{"x": "127.1", "y": "37.4"}]}}
+
+    async def search_place(self, query, **kwargs):
+        return {"status": "success", "data": {"documents": DOCUMENTS, "meta": {"is_end": True}}}
+
+
+def test_search_nearby_parking_fans_out():
+    state = {"active": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def slow_lookup(parking_name, address, lat=None, lng=None, public_code=None):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.1)
+        with lock:
+            state["active"] -= 1
+        return {"status": "unavailable"}
+
+    original = (server._async_kakao_client, server._get_realtime_info_gyeonggi, server._REALTIME_CONCURRENCY,
+                server._has_public_match, server.get_tile_cache)
+    server._async_kakao_client = lambda: FakeAsyncKakao()
+    server._get_realtime_info_gyeonggi = slow_lookup
+    server._REALTIME_CONCURRENCY = 3
+    server._has_public_match = lambda document: None
+    server.get_tile_cache = lambda: None
+    try:
+        start = time.perf_counter()
+        result = asyncio.run(server.search_nearby_parking("경기 성남시 분당구"))
+        elapsed = time.perf_counter() - start
+    finally:
+        (server._async_kakao_client, server._get_realtime_info_gyeonggi, server._REALTIME_CONCURRENCY,
+         server._has_public_match, server.get_tile_cache) = original
+
+    assert result["count"] == 6
+    assert [p["name"] for p in result["parkings"]] == [d["place_name"] for d in DOCUMENTS]
+    assert state["peak"] == 3
+    assert elapsed < 0.5
+    print(f"[OK] 6건 조회 {elapsed:.2f}초 (최대 동시 {state['peak']}건)")
+
+
+def test_build_parking_entry_from_snapshot():
+    master_rows = [{"PKLT_CD": "171721", "PKLT_NM": "세종로 공영주차장(시)", "ADDR": "종로구 세종로 80-1",
+                    "LAT": "37.5735", "LOT": "126.9769", "TPKCT": "100"}]
+    occupancy_rows = [{"PKLT_CD": "171721", "NOW_PRK_VHCL_CNT": "40",
+                       "NOW_PRK_VHCL_UPDT_TM": "2025-12-10 10:24:30"}]
+    original = server._seoul_master, server._seoul_snapshot
+    server._seoul_master = SnapshotStore(
+        "test_master", lambda: master_rows,
+        index_builder=lambda r: LotMatcher(r, "PKLT_NM", ("ADDR",), "LAT", "LOT")
+    )
+    server._seoul_snapshot = SnapshotStore(
+        "test", lambda: occupancy_rows, index_builder=lambda r: {row["PKLT_CD"]: row for row in r}
+    )
+    try:
+        entry = server._build_parking_entry(
+            {"place_name": "세종로공영주차장", "address_name": "서울 종로구 세종로 80-1",
+             "x": "126.9770", "y": "37.5736"}
+        )
+    finally:
+        server._seoul_master.stop()
+        server._seoul_snapshot.stop()
+        server._seoul_master, server._seoul_snapshot = original
+
+    assert entry["available_spots"] == 60
+    assert entry["update_time"] == "2025-12-10 10:24:30"
+    print(f"[OK] 서울 실시간 정보: {entry['available_spots']}/{entry['total_spots']}")
+
+
+if __name__ == "__main__":
+    test_search_nearby_parking_fans_out()
+    test_build_parking_entry_from_snapshot()
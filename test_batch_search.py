@@ -0,0 +1,69 @@
+"""
+search_nearby_parking_batch 테스트 (네트워크 불필요)
+- 같은 주소는 한 번만 좌표 변환, 같은 좌표는 한 번만 검색
+- 주소별 결과가 입력 순서대로 반환
+"""
+
+import asyncio
+
+import src.server as server
+
+COORDINATES = {
+    "서울시 중구 세종대로 110": ("126.9779", "37.5663"),
+    "서울특별시청": ("126.9779", "37.5663"),
+    "잠실종합운동장": ("127.0736", "37.5151"),
+}
+
+
+class FakeAsyncKakao:
+    def __init__(self):
+        self.geocodes = []
+        self.searches = []
+
+    async def address_to_coordinates(self, address):
+        self.geocodes.append(address)
+        point = COORDINATES.get(address.strip())
+        documents = [{"x": point[0], "y": point[1]}] if point else []
+        return {"status": "success", "data": {"documents": documents}}
+
+    async def search_place(self, query, x=None, y=None, radius=None, page=1, **kwargs):
+        self.searches.append((y, x, radius))
+        return {"status": "success", "data": {"documents": [
+            {"place_name": f"주차장@{y}", "address_name": "부산 해운대구", "x": x, "y": y}
+        ], "meta": {"is_end": True, "pageable_count": 1}}}
+
+
+def test_batch_deduplicates_upstream_calls():
+    kakao = FakeAsyncKakao()
+    original = server._async_kakao_client, server.get_tile_cache
+    server._async_kakao_client = lambda: kakao
+    server.get_tile_cache = lambda: None
+    try:
+        result = asyncio.run(server.search_nearby_parking_batch([
+            "서울시 중구 세종대로 110",
+            "서울시 중구 세종대로 110 ",
+            "서울특별시청",
+            "잠실종합운동장",
+            "없는 주소",
+        ]))
+    finally:
+        server._async_kakao_client, server.get_tile_cache = original
+
+    assert result["count"] == 5
+    assert len(kakao.geocodes) == 4
+    # 결과가 적어 반경은 넓혀 가지만 같은 좌표는 한 번만 검색
+    assert len({(lat, lng) for lat, lng, _ in kakao.searches}) == 2
+    assert [r["count"] for r in result["results"]] == [1, 1, 1, 1, 0]
+    assert result["results"][3]["parkings"][0]["name"] == "주차장@37.5151"
+    print(f"[OK] 주소 5개 → 좌표 변환 {len(kakao.geocodes)}회, 주변 검색 좌표 2곳 (페이지 요청 {len(kakao.searches)}회)")
+
+
+def test_batch_rejects_too_many_addresses():
+    result = asyncio.run(server.search_nearby_parking_batch(["a"] * (server._BATCH_MAX_ADDRESSES + 1)))
+    assert result["success"] is False
+    print(f"[OK] 최대 주소 수 초과: {result['error']}")
+
+
+if __name__ == "__main__":
+    test_batch_deduplicates_upstream_calls()
+    test_batch_rejects_too_many_addresses()
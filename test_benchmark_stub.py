@@ -0,0 +1,58 @@
+"""
+오프라인 벤치마크 스텁 서버 테스트 (네트워크 불필요)
+- 실제 클라이언트가 스텁 서버에서 서울/경기 전체 페이지와 카카오 검색을 받아오는지
+- 백분위수 계산
+"""
+
+from benchmarks.bench_search import percentile
+from benchmarks.stub_server import ReplayDataset, StubServer
+from src.api_clients import GyeonggiDataClient, KakaoLocalClient, SeoulDataClient
+from src.cache import GeocodeCache
+
+
+class StubClients:
+    """BASE_URL을 스텁 서버로 바꾼 클라이언트 묶음"""
+
+    def __init__(self, url):
+        self.kakao = KakaoLocalClient(api_key="bench", geocode_cache=GeocodeCache(path=None))
+        self.seoul = SeoulDataClient(api_key="bench")
+        self.gyeonggi = GyeonggiDataClient(api_key="bench")
+        for client in (self.kakao, self.seoul, self.gyeonggi):
+            client.BASE_URL = url
+
+
+def test_stub_replays_all_apis():
+    dataset = ReplayDataset(seoul_rows=1200, gyeonggi_rows=300, private_density=5)
+    stub = StubServer(dataset).start()
+    try:
+        clients = StubClients(stub.url)
+
+        seoul = clients.seoul.get_all_realtime_parking_info()
+        assert len(seoul["data"]["GetParkingInfo"]["row"]) == 1200
+
+        gyeonggi = clients.gyeonggi.get_all_parking_places(page_size=100)
+        assert len(gyeonggi["data"]["ParkingPlace"][1]["row"]) == 300
+
+        geocode = clients.kakao.address_to_coordinates("서울 벤치구 벤치로 1")
+        doc = geocode["data"]["documents"][0]
+        nearby = clients.kakao.search_parking_nearby(float(doc["y"]), float(doc["x"]), 2000)
+        assert nearby["data"]["meta"]["total_count"] >= len(nearby["data"]["documents"])
+
+        counts = stub.snapshot_counts()
+        assert counts["seoul.get_parking_info"] == 2
+        assert counts["gyeonggi.parking_place"] == 3
+        print(f"[OK] 스텁 요청 수: {dict(counts)}")
+    finally:
+        stub.stop()
+
+
+def test_percentile():
+    values = [float(i) for i in range(1, 101)]
+    assert percentile(values, 50) == 50.5
+    assert abs(percentile(values, 99) - 99.01) < 1e-9
+    print("[OK] 백분위수 계산")
+
+
+if __name__ == "__main__":
+    test_stub_replays_all_apis()
+    test_percentile()
@@ -0,0 +1,194 @@
+"""
+주차장 카탈로그 테스트 (네트워크 불필요)
+- 타일 격자 수집: 카카오 id 중복 제거, 빈 타일 기록, 페이지 한도를 넘는 타일 분할
+- 실패한 타일은 세기만 하고 나머지 수집을 계속, 다음 실행에서 이어서 수집
+- 공공데이터 연결
+- 카탈로그를 타일 캐시에 올리면 카카오 API 없이 검색
+"""
+
+import asyncio
+import time
+
+from src.api_clients.rate_limit import RateLimitError
+from src.cache import TileCache
+from src.cache.tile_cache import geohash_bounds, geohash_encode
+from src.catalog import ParkingCatalog, crawl, fetch_tile, join_public
+from src.search import AdaptiveParkingSearch
+
+GANGNAM = (37.4979, 127.0276)
+
+
+class FakeKakaoCategory:
+    """rect 범위 안 문서를 돌려주는 카카오 카테고리 검색 (동기 클라이언트)"""
+
+    def __init__(self, documents, max_page=45):
+        self.documents = documents
+        self.max_page = max_page
+        self.calls = []
+
+    def search_category(self, category_group_code, rect=None, page=1, size=15, **kwargs):
+        self.calls.append((rect, page))
+        west, south, east, north = (float(v) for v in rect.split(","))
+        # 카카오 rect는 경계를 포함하므로 이웃 타일과 겹치는 문서가 생길 수 있음
+        found = [d for d in self.documents
+                 if south <= float(d["y"]) <= north and west <= float(d["x"]) <= east]
+        pageable = min(len(found), self.max_page * size)
+        start = (page - 1) * size
+        return {"status": "success", "data": {
+            "documents": found[start:start + size],
+            "meta": {"total_count": len(found), "pageable_count": pageable,
+                     "is_end": start + size >= pageable},
+        }}
+
+
+def make_documents(center, count, step=0.0004):
+    side = int(count ** 0.5)
+    documents = []
+    for i in range(count):
+        lat = center[0] + (i // side - side / 2) * step
+        lng = center[1] + (i % side - side / 2) * step
+        documents.append({
+            "id": str(1000 + i),
+            "place_name": f"주차장 {i}",
+            "address_name": "서울 강남구 역삼동",
+            "x": f"{lng:.6f}",
+            "y": f"{lat:.6f}",
+        })
+    return documents
+
+
+def test_crawl_dedupes_and_records_empty_tiles():
+    documents = make_documents(GANGNAM, 100)
+    client = FakeKakaoCategory(documents)
+    catalog = ParkingCatalog()
+    tile = geohash_encode(*GANGNAM, 6)
+    south, west, north, east = geohash_bounds(tile)
+    # 가운데 타일 주변 3x3 타일 범위
+    bounds = (2 * south - north + 1e-6, 2 * west - east + 1e-6, 2 * north - south - 1e-6, 2 * east - west - 1e-6)
+
+    result = crawl(catalog, client, bounds, precision=6, qps=0)
+    stats = catalog.stats()
+    assert result["tiles"] == stats["tiles"] == 9
+    assert stats["places"] == result["places"] == len(documents)
+
+    tiles, oldest = catalog.load_tiles()
+    assert len(tiles) == 9 and oldest > 0
+    ids = [d["id"] for docs in tiles.values() for d in docs]
+    assert len(ids) == len(set(ids)) == len(documents)
+    assert any(not docs for docs in tiles.values())
+
+    # 최근에 수집한 타일은 건너뜀
+    calls = len(client.calls)
+    again = crawl(catalog, client, bounds, precision=6, qps=0, max_age=3600)
+    assert again["skipped"] == 9 and len(client.calls) == calls
+    print(f"[OK] 타일 9개, 주차장 {stats['places']}건 (중복 없음), 빈 타일 기록, 재수집 생략")
+
+
+class FailingKakaoCategory(FakeKakaoCategory):
+    """failing 타일 범위 요청에 호출 한도 오류를 내는 카카오 카테고리 검색"""
+
+    def __init__(self, documents, failing):
+        super().__init__(documents)
+        self.failing = set(failing)
+
+    def search_category(self, category_group_code, rect=None, **kwargs):
+        if rect in self.failing:
+            raise RateLimitError("한도 초과")
+        return super().search_category(category_group_code, rect=rect, **kwargs)
+
+
+def test_crawl_continues_after_failed_tile():
+    documents = make_documents(GANGNAM, 100)
+    tile = geohash_encode(*GANGNAM, 6)
+    south, west, north, east = geohash_bounds(tile)
+    bounds = (2 * south - north + 1e-6, 2 * west - east + 1e-6, 2 * north - south - 1e-6, 2 * east - west - 1e-6)
+    client = FailingKakaoCategory(documents, [TileCache.rect(tile)])
+    catalog = ParkingCatalog()
+
+    result = crawl(catalog, client, bounds, precision=6, qps=0, max_workers=2)
+    assert result["failed"] == 1 and result["tiles"] == 8
+    assert catalog.crawled_at(tile) == 0
+
+    # 다음 실행은 실패한 타일만 다시 수집
+    client.failing.clear()
+    client.calls.clear()
+    again = crawl(catalog, client, bounds, precision=6, qps=0, max_age=3600)
+    assert again == {"tiles": 1, "skipped": 8, "failed": 0, "places": again["places"]}
+    assert {rect for rect, _ in client.calls} == {TileCache.rect(tile)}
+    assert catalog.stats()["tiles"] == 9
+    print("[OK] 실패한 타일 1개: 나머지 8개 수집, 다음 실행에서 그 타일만 이어서 수집")
+
+
+def test_fetch_tile_splits_truncated_tile():
+    documents = make_documents(GANGNAM, 400, step=0.0002)
+    client = FakeKakaoCategory(documents, max_page=2)
+    tile = geohash_encode(*GANGNAM, 6)
+    south, west, north, east = geohash_bounds(tile)
+    inside = [d for d in documents if south <= float(d["y"]) < north and west <= float(d["x"]) < east]
+
+    found = fetch_tile(client, tile)
+    found_ids = {d["id"] for d in found}
+    assert {d["id"] for d in inside} <= found_ids
+    child_rects = {TileCache.rect(tile + char) for char in "0123456789bcdefghjkmnpqrstuvwxyz"}
+    assert child_rects <= {rect for rect, _ in client.calls}
+    print(f"[OK] 페이지 한도 초과 타일 분할: 타일 안 {len(inside)}건 모두 수집 (요청 {len(client.calls)}회)")
+
+
+def test_join_public():
+    documents = make_documents(GANGNAM, 4)
+    joined = join_public(documents, lambda d: ("seoul", "P" + d["id"]) if d["id"] != "1001" else None)
+    assert [d["public_code"] for d in joined] == ["P1000", None, "P1002", "P1003"]
+    assert joined[0]["public_region"] == "seoul" and joined[1]["public_region"] is None
+    assert "public_code" not in documents[0]
+
+    catalog = ParkingCatalog()
+    catalog.save_tile(geohash_encode(*GANGNAM, 6), joined)
+    assert catalog.stats()["matched"] == 3
+    print("[OK] 공공데이터 연결 3/4건 저장")
+
+
+class CountingKakao:
+    """호출만 세는 카카오 클라이언트 (카탈로그가 덮은 지역에서는 호출되면 안 됨)"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def search_category(self, *args, **kwargs):
+        self.calls += 1
+        return {"status": "success", "data": {"documents": [], "meta": {"is_end": True}}}
+
+    async def search_place(self, *args, **kwargs):
+        self.calls += 1
+        return {"status": "success", "data": {"documents": [], "meta": {"is_end": True}}}
+
+
+def test_preloaded_catalog_serves_without_api():
+    documents = make_documents(GANGNAM, 100)
+    catalog = ParkingCatalog()
+    tile = geohash_encode(*GANGNAM, 6)
+    south, west, north, east = geohash_bounds(tile)
+    bounds = (2 * south - north + 1e-6, 2 * west - east + 1e-6, 2 * north - south - 1e-6, 2 * east - west - 1e-6)
+    crawl(catalog, FakeKakaoCategory(documents), bounds, precision=6, qps=0)
+    tiles, oldest = catalog.load_tiles()
+
+    cache = TileCache(precision=6, max_tiles=1)
+    cache.preload(tiles, expires_at=oldest + 3600)
+    client = CountingKakao()
+    search = AdaptiveParkingSearch(client, radii=(300,), target=5, tile_cache=cache)
+    found = asyncio.run(search.search(*GANGNAM))
+    assert len(found) == 5 and client.calls == 0
+    assert cache.stats()["catalog_tiles"] == 9
+
+    # 만료된 카탈로그는 사용하지 않음
+    cache.preload(tiles, expires_at=time.time() - 1)
+    asyncio.run(search.search(*GANGNAM))
+    assert client.calls > 0
+    print(f"[OK] 카탈로그 타일로 검색 {len(found)}건 (카카오 호출 0회), 만료 후 API 사용")
+
+
+if __name__ == "__main__":
+    test_crawl_dedupes_and_records_empty_tiles()
+    test_crawl_continues_after_failed_tile()
+    test_fetch_tile_splits_truncated_tile()
+    test_join_public()
+    test_preloaded_catalog_serves_without_api()
@@ -0,0 +1,262 @@
+"""
+외부 API 회로 차단기 테스트 (네트워크 불필요)
+- 연속 실패 후 회로가 열리면 원천 API를 호출하지 않고 바로 실패
+- 열린 뒤 reset_timeout이 지나면 시험 요청 하나만 통과, 성공하면 닫힘 / 실패하면 다시 열림
+- 4xx, 호출 한도 초과는 원천 API 장애로 세지 않음
+- 카카오 회로가 열리면 만료된 타일로 주변 검색 응답
+- 대신 쓸 타일도 없으면 MCP 도구는 예외 대신 retry_after가 있는 실패 결과로 응답
+"""
+
+import asyncio
+import time
+
+import requests
+
+import src.server as server
+from src.api_clients import AsyncKakaoLocalClient, GyeonggiDataClient, KakaoLocalClient, circuit_breaker, rate_limit
+from src.api_clients.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+from src.api_clients.rate_limit import RateLimitError, UpstreamLimiter
+from src.cache import GeocodeCache, TileCache
+from src.search import AdaptiveParkingSearch
+
+GANGNAM = (37.4979, 127.0276)
+
+
+def test_opens_after_consecutive_failures():
+    breaker = CircuitBreaker("test", failure_threshold=3, reset_timeout=0.1)
+    for _ in range(2):
+        breaker.before_call()
+        breaker.on_failure(ConnectionError("down"))
+    # 성공이 끼면 연속 실패 수 초기화
+    breaker.before_call()
+    breaker.on_success()
+    for _ in range(3):
+        breaker.before_call()
+        breaker.on_failure(TimeoutError("timeout"))
+    assert breaker.state == OPEN
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        try:
+            breaker.before_call()
+        except CircuitOpenError:
+            pass
+    per_call = (time.perf_counter() - start) / 1000
+    assert per_call < 0.001
+    print(f"[OK] 연속 실패 3회 후 열림, 거부 1건 {per_call * 1e6:.1f}µs")
+
+
+def test_half_open_probe():
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=0.05)
+    breaker.before_call()
+    breaker.on_failure(ConnectionError("down"))
+    time.sleep(0.06)
+    assert breaker.state == HALF_OPEN
+
+    # 시험 요청은 하나만 통과
+    breaker.before_call()
+    try:
+        breaker.before_call()
+    except CircuitOpenError:
+        pass
+    else:
+        raise AssertionError("시험 요청이 두 건 통과함")
+    breaker.on_failure(TimeoutError("still down"))
+    assert breaker.state == OPEN
+
+    time.sleep(0.06)
+    breaker.before_call()
+    breaker.on_success()
+    assert breaker.state == CLOSED
+    breaker.before_call()
+    print("[OK] 반열림 시험 요청: 실패하면 다시 열림, 성공하면 닫힘")
+
+
+def test_client_errors_do_not_open():
+    breaker = CircuitBreaker("test", failure_threshold=2)
+    for _ in range(5):
+        breaker.before_call()
+        breaker.on_failure(ValueError("클라이언트 에러 (400)"))
+    assert breaker.state == CLOSED
+    print("[OK] 4xx/응답 형식 오류는 장애로 세지 않음")
+
+
+class DeadSession:
+    """매번 잠시 기다렸다가 타임아웃 나는 세션"""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.calls = 0
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        time.sleep(self.delay)
+        raise requests.exceptions.ConnectTimeout("timed out")
+
+
+def test_dead_upstream_fails_fast():
+    session = DeadSession()
+    client = GyeonggiDataClient(api_key="test", session=session)
+    originals = circuit_breaker._breakers.get("gyeonggi"), rate_limit._limiters.get("gyeonggi")
+    circuit_breaker._breakers["gyeonggi"] = CircuitBreaker("gyeonggi", failure_threshold=3, reset_timeout=60)
+    rate_limit._limiters["gyeonggi"] = UpstreamLimiter("gyeonggi")
+    try:
+        for page in range(3):
+            try:
+                client._make_request("/ParkingPlace", {"pIndex": page})
+            except TimeoutError:
+                pass
+        start = time.perf_counter()
+        try:
+            client._make_request("/ParkingPlace", {"pIndex": 9})
+        except CircuitOpenError as e:
+            assert isinstance(e, ConnectionError)
+        else:
+            raise AssertionError("회로가 열리지 않음")
+        elapsed = time.perf_counter() - start
+        assert session.calls == 3 and elapsed < 0.01, elapsed
+    finally:
+        for registry, original in zip((circuit_breaker._breakers, rate_limit._limiters), originals):
+            if original is None:
+                registry.pop("gyeonggi", None)
+            else:
+                registry["gyeonggi"] = original
+    print(f"[OK] 경기 API 장애: 타임아웃 3회 후 {elapsed * 1e6:.0f}µs 만에 실패 (원천 API 미호출)")
+
+
+def test_rate_limit_does_not_trip_breaker():
+    breaker = CircuitBreaker("test", failure_threshold=1)
+
+    @circuit_breaker.circuit_breaker("test")
+    def limited():
+        raise RateLimitError("한도 초과")
+
+    original = circuit_breaker._breakers.get("test")
+    circuit_breaker._breakers["test"] = breaker
+    try:
+        for _ in range(3):
+            try:
+                limited()
+            except RateLimitError:
+                pass
+    finally:
+        circuit_breaker._breakers.pop("test", None)
+        if original is not None:
+            circuit_breaker._breakers["test"] = original
+    assert breaker.state == CLOSED
+    print("[OK] 호출 한도 초과는 회로를 열지 않음")
+
+
+class OpenCircuitKakao:
+    """rect 범위 안 문서를 돌려주다가 open이면 회로 열림(또는 error) 예외를 내는 카카오 카테고리 검색"""
+
+    def __init__(self, documents):
+        self.documents = documents
+        self.open = False
+        self.error = CircuitOpenError("kakao", 30)
+
+    async def search_place(self, query, **kwargs):
+        if self.open:
+            raise self.error
+        raise AssertionError("타일이 모두 캐시에 있어 거리순 검색을 하지 않아야 함")
+
+    async def search_category(self, category_group_code, rect=None, page=1, size=15, **kwargs):
+        if self.open:
+            raise self.error
+        west, south, east, north = (float(v) for v in rect.split(","))
+        found = [d for d in self.documents
+                 if south <= float(d["y"]) < north and west <= float(d["x"]) < east]
+        start = (page - 1) * size
+        return {"status": "success", "data": {
+            "documents": found[start:start + size],
+            "meta": {"total_count": len(found), "pageable_count": len(found),
+                     "is_end": start + size >= len(found)},
+        }}
+
+
+def make_grid_documents(center, count=400, step=0.0004):
+    side = int(count ** 0.5)
+    return [
+        {"id": str(i), "place_name": f"주차장{i}", "address_name": "서울 강남구",
+         "x": f"{center[1] + (i % side - side / 2) * step:.6f}",
+         "y": f"{center[0] + (i // side - side / 2) * step:.6f}"}
+        for i in range(count)
+    ]
+
+
+def test_open_kakao_circuit_serves_stale_tiles():
+    kakao = OpenCircuitKakao(make_grid_documents(GANGNAM))
+    cache = TileCache(precision=6, ttl=0.05, max_radius=1000)
+    engine = AdaptiveParkingSearch(kakao, radii=(500,), target=10, tile_cache=cache)
+    for tile in cache.covering_tiles(*GANGNAM, 500):
+        page = asyncio.run(kakao.search_category("PK6", rect=TileCache.rect(tile), size=1000))
+        cache.set(tile, page["data"]["documents"])
+    fresh = asyncio.run(engine.search(*GANGNAM))
+
+    time.sleep(0.06)
+    kakao.open = True
+    stale = asyncio.run(engine.search(*GANGNAM))
+    assert [d["id"] for d in stale] == [d["id"] for d in fresh]
+
+    # 한 번도 받은 적 없는 지역은 대체할 타일이 없으므로 그대로 실패
+    try:
+        asyncio.run(engine.search(GANGNAM[0] + 0.05, GANGNAM[1]))
+    except CircuitOpenError:
+        pass
+    else:
+        raise AssertionError("캐시에 없는 지역이 성공함")
+
+    # 카카오 호출 한도에 걸려도 같은 방식으로 대체
+    kakao.error = RateLimitError("한도 초과", retry_after=1.0)
+    limited = asyncio.run(engine.search(*GANGNAM))
+    assert [d["id"] for d in limited] == [d["id"] for d in fresh]
+    print(f"[OK] 카카오 회로 열림/호출 한도: 만료된 타일로 {len(stale)}건 응답")
+
+
+class UnreachableSession:
+    """회로가 열려 있으므로 호출되면 안 되는 세션"""
+
+    def get(self, url, **kwargs):
+        raise AssertionError(f"회로가 열렸는데 카카오를 호출함: {url}")
+
+
+def test_open_kakao_circuit_tool_result():
+    geocode_cache = GeocodeCache(path=None)
+    geocode_cache.set("서울 강남구 테헤란로 1", {
+        "status": "success", "data": {"documents": [{"y": str(GANGNAM[0]), "x": str(GANGNAM[1])}]}})
+    client = KakaoLocalClient(api_key="test", geocode_cache=geocode_cache, session=UnreachableSession())
+    breaker = CircuitBreaker("kakao", failure_threshold=1, reset_timeout=60)
+    breaker.on_failure(TimeoutError())
+    original_breaker = circuit_breaker._breakers.get("kakao")
+    original = server._async_kakao_client, server._has_public_match, server.get_tile_cache
+    circuit_breaker._breakers["kakao"] = breaker
+    server._async_kakao_client = lambda: AsyncKakaoLocalClient(client)
+    server._has_public_match = lambda document: None
+    server.get_tile_cache = lambda: TileCache(max_radius=1000)
+    try:
+        # 좌표는 캐시에 있고 주변 검색이 회로에 막힘 / 좌표 변환부터 회로에 막힘
+        for address in ("서울 강남구 테헤란로 1", "서울 강남구 테헤란로 2"):
+            result = asyncio.run(server.search_nearby_parking(address))
+            assert result["success"] is False and result["count"] == 0, result
+            assert 0 < result["retry_after"] <= 60
+
+        batch = asyncio.run(server.search_nearby_parking_batch(["서울 강남구 테헤란로 1", "서울 강남구 테헤란로 2"]))
+        assert [r["success"] for r in batch["results"]] == [False, False]
+        assert all(0 < r["retry_after"] <= 60 for r in batch["results"])
+    finally:
+        server._async_kakao_client, server._has_public_match, server.get_tile_cache = original
+        if original_breaker is None:
+            circuit_breaker._breakers.pop("kakao", None)
+        else:
+            circuit_breaker._breakers["kakao"] = original_breaker
+    print(f"[OK] 카카오 회로 열림 + 타일 없음: 도구는 실패 결과 (retry_after {result['retry_after']}초)")
+
+
+if __name__ == "__main__":
+    test_opens_after_consecutive_failures()
+    test_half_open_probe()
+    test_client_errors_do_not_open()
+    test_dead_upstream_fails_fast()
+    test_rate_limit_does_not_trip_breaker()
+    test_open_kakao_circuit_serves_stale_tiles()
+    test_open_kakao_circuit_tool_result()
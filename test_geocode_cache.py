@@ -0,0 +1,99 @@
+"""
+주소 → 좌표 변환 캐시 테스트 (네트워크 불필요)
+- 같은 주소 재조회 시 API 미호출
+- SQLite 캐시가 새 인스턴스(재시작)에서도 유지
+- TTL 만료 / LRU 크기 제한
+- 결과 없는 주소는 짧게만 캐시, 디스크 정리는 N건 저장마다
+"""
+
+import os
+import tempfile
+import time
+
+from src.api_clients import KakaoLocalClient
+from src.cache import GeocodeCache
+
+RESPONSE = {"status": "success", "data": {"documents": [{"x": "126.9779", "y": "37.5663"}]}}
+EMPTY_RESPONSE = {"status": "success", "data": {"documents": [], "meta": {"total_count": 0}}}
+
+
+class FakeKakaoClient(KakaoLocalClient):
+    """요청 횟수만 세는 클라이언트"""
+
+    def __init__(self, cache):
+        super().__init__(api_key="test", geocode_cache=cache)
+        self.requests = 0
+
+    def _make_request(self, endpoint, params, timeout=10):
+        self.requests += 1
+        return RESPONSE
+
+
+def test_repeat_address_skips_network():
+    client = FakeKakaoClient(GeocodeCache(path=None))
+
+    client.address_to_coordinates("서울시 중구 세종대로 110")
+    client.address_to_coordinates("  서울시  중구 세종대로 110 ")
+    assert client.requests == 1
+    assert client.geocode_cache.stats()["hits"] == 1
+    print(f"[OK] 캐시 통계: {client.geocode_cache.stats()}")
+
+
+def test_disk_cache_survives_restart():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "geocode.sqlite3")
+        GeocodeCache(path=path).set("서울시청", RESPONSE)
+
+        restarted = GeocodeCache(path=path)
+        assert restarted.get("서울시청") == RESPONSE
+        print("[OK] 재시작 후 디스크 캐시 유지")
+
+
+def test_ttl_and_size_bounds():
+    expired = GeocodeCache(path=None, ttl=0)
+    expired.set("서울시청", RESPONSE)
+    assert expired.get("서울시청") is None
+
+    small = GeocodeCache(path=None, max_memory_entries=2)
+    for address in ("a", "b", "c"):
+        small.set(address, RESPONSE)
+    assert small.get("a") is None
+    assert small.get("c") == RESPONSE
+    print("[OK] TTL 만료 및 LRU 크기 제한")
+
+
+def test_unresolved_address_expires_quickly():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "geocode.sqlite3")
+        cache = GeocodeCache(path=path, negative_ttl=60)
+        cache.set("없는 주소 123", EMPTY_RESPONSE)
+        assert cache.get("없는 주소 123") == EMPTY_RESPONSE
+
+        # 재시작 후에는 다시 조회, 만료되면 다시 조회
+        assert GeocodeCache(path=path).get("없는 주소 123") is None
+        expired = GeocodeCache(path=None, negative_ttl=0)
+        expired.set("없는 주소 123", EMPTY_RESPONSE)
+        assert expired.get("없는 주소 123") is None
+        print("[OK] 결과 없는 주소는 negative_ttl 동안만 메모리에 캐시")
+
+
+def test_disk_prune_runs_every_interval():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "geocode.sqlite3")
+        cache = GeocodeCache(path=path, max_disk_entries=5, prune_interval=4)
+        for i in range(7):
+            cache.set(f"주소 {i}", RESPONSE)
+        count = cache._conn.execute("SELECT COUNT(*) FROM geocode").fetchone()[0]
+        # 저장할 때마다 정리하지 않으므로 다음 정리(8번째 저장)까지 잠시 한도를 넘을 수 있음
+        assert count == 7, count
+        cache._prune_disk(time.time())
+        assert cache._conn.execute("SELECT COUNT(*) FROM geocode").fetchone()[0] == 5
+        print(f"[OK] 디스크 정리 주기: 저장 4건마다 (정리 전 {count}건)")
+
+
+if __name__ == "__main__":
+    test_repeat_address_skips_network()
+    test_disk_cache_survives_restart()
+    test_ttl_and_size_bounds()
+    test_unresolved_address_expires_quickly()
+    test_disk_prune_runs_every_interval()
@@ -0,0 +1,67 @@
+"""
+경기 ParkingPlace 전체 페이지 조회 테스트 (네트워크 불필요)
+- head.list_total_count 기준으로 모든 pIndex 페이지 조회
+- 결과 행 순서가 원본과 동일한지 확인
+- 백그라운드 갱신이면 작업 스레드에서 받는 페이지도 백그라운드 우선순위로 요청
+"""
+
+from src.api_clients import GyeonggiDataClient
+from src.api_clients.rate_limit import BACKGROUND, background_priority, current_priority
+
+
+class FakeGyeonggiClient(GyeonggiDataClient):
+    """요청 페이지를 기록하고 가짜 행을 반환하는 클라이언트"""
+
+    def __init__(self, total: int):
+        super().__init__(api_key="test")
+        self.total = total
+        self.pages = []
+        self.priorities = []
+
+    def get_realtime_parking_info(self, page=1, size=100):
+        self.pages.append(page)
+        self.priorities.append(current_priority())
+        start = (page - 1) * size + 1
+        end = min(page * size, self.total)
+        return {
+            "status": "success",
+            "data": {
+                "ParkingPlace": [
+                    {"head": [{"list_total_count": self.total}, {"RESULT": {"CODE": "INFO-000"}}]},
+                    {"row": [{"PARKPLC_NM": f"주차장{i}"} for i in range(start, end + 1)]},
+                ]
+            }
+        }
+
+
+def test_get_all_parking_places():
+    client = FakeGyeonggiClient(total=2345)
+    response = client.get_all_parking_places(page_size=1000, max_workers=2)
+
+    rows = response["data"]["ParkingPlace"][1]["row"]
+    assert len(rows) == 2345
+    assert rows[0]["PARKPLC_NM"] == "주차장1"
+    assert rows[-1]["PARKPLC_NM"] == "주차장2345"
+    assert sorted(client.pages) == [1, 2, 3]
+    print(f"[OK] {len(client.pages)}개 페이지, {len(rows)}건 병합")
+
+
+def test_pages_keep_background_priority():
+    client = FakeGyeonggiClient(total=2345)
+    with background_priority():
+        client.get_all_parking_places(page_size=1000, max_workers=2)
+
+    assert len(client.priorities) == 3
+    assert all(priority == BACKGROUND for priority in client.priorities), client.priorities
+    print(f"[OK] 백그라운드 갱신: {len(client.priorities)}개 페이지 모두 {BACKGROUND}")
+
+
+def test_parse_parking_place_empty():
+    assert GyeonggiDataClient._parse_parking_place({}) == (0, [])
+    print("[OK] 빈 응답 처리")
+
+
+if __name__ == "__main__":
+    test_get_all_parking_places()
+    test_pages_keep_background_priority()
+    test_parse_parking_place_empty()
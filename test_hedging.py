@@ -0,0 +1,151 @@
+"""
+카카오 헤지 요청 테스트 (네트워크 불필요)
+- 헤지 시점: 표본이 적으면 초기값, 쌓이면 최근 응답 시간의 p95
+- 첫 요청이 멈추면 헤지 요청의 응답을 바로 사용
+- 헤지 비율은 요청 대비 max_rate를 넘지 않음
+- 둘 다 실패하면 첫 요청의 예외
+"""
+
+import json
+import threading
+import time
+
+import requests
+
+from src.api_clients import KakaoLocalClient, rate_limit
+from src.api_clients.hedging import HedgePolicy, hedged_call
+from src.api_clients.rate_limit import UpstreamLimiter
+from src.cache import GeocodeCache
+
+
+class StallingSession:
+    """지정한 순번의 요청만 오래 걸리는 세션"""
+
+    def __init__(self, stall_calls=(1,), stall_seconds=1.0, delay=0.0):
+        self.stall_calls = set(stall_calls)
+        self.stall_seconds = stall_seconds
+        self.delay = delay
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def get(self, url, **kwargs):
+        with self.lock:
+            self.calls += 1
+            call = self.calls
+        time.sleep(self.stall_seconds if call in self.stall_calls else self.delay)
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps({"documents": [], "meta": {"call": call}}).encode()
+        response.url = url
+        return response
+
+
+def make_client(session, policy):
+    return KakaoLocalClient(api_key="test", geocode_cache=GeocodeCache(path=None), session=session, hedge=policy)
+
+
+def with_test_limiter(func):
+    def wrapper():
+        original = rate_limit._limiters.get("kakao")
+        rate_limit._limiters["kakao"] = UpstreamLimiter("kakao", qps=1000, burst=100)
+        try:
+            func()
+        finally:
+            if original is None:
+                rate_limit._limiters.pop("kakao", None)
+            else:
+                rate_limit._limiters["kakao"] = original
+    wrapper.__name__ = func.__name__
+    return wrapper
+
+
+def test_hedge_delay_follows_p95():
+    policy = HedgePolicy(min_samples=20, initial_delay=0.8, min_delay=0.01)
+    assert policy.delay() == 0.8
+    for i in range(100):
+        policy.observe(0.02 if i < 95 else 3.0)
+    # 느린 5%는 헤지 시점에 들어가지 않음
+    assert policy.delay() == 0.02
+    for _ in range(5):
+        policy.observe(3.0)
+    assert policy.delay() == 3.0
+    fast = HedgePolicy(min_samples=5, min_delay=0.05)
+    for _ in range(10):
+        fast.observe(0.001)
+    assert fast.delay() == 0.05
+    print("[OK] 헤지 시점: 초기 0.8초 → 최근 200건의 p95 (하한 0.05초)")
+
+
+def test_hedge_budget():
+    policy = HedgePolicy(max_rate=0.25, burst=1.0)
+    assert policy.try_spend()
+    assert not policy.try_spend()
+    for _ in range(3):
+        policy.on_request()
+    assert not policy.try_spend()
+    policy.on_request()
+    assert policy.try_spend()
+    print("[OK] 헤지 예산: 요청 4건마다 1건")
+
+
+@with_test_limiter
+def test_stalled_request_is_hedged():
+    session = StallingSession(stall_calls=(1,), stall_seconds=1.0)
+    client = make_client(session, HedgePolicy(initial_delay=0.05))
+    start = time.perf_counter()
+    result = client._make_request("/v2/local/search/category.json", {"x": 127.0, "y": 37.5})
+    elapsed = time.perf_counter() - start
+    assert result["data"]["meta"]["call"] == 2
+    assert session.calls == 2 and elapsed < 0.5, elapsed
+    print(f"[OK] 멈춘 첫 요청 대신 헤지 응답 사용 ({elapsed * 1000:.0f}ms, 첫 요청은 1000ms)")
+
+
+@with_test_limiter
+def test_hedge_rate_is_capped():
+    session = StallingSession(stall_calls=(), delay=0.03)
+    client = make_client(session, HedgePolicy(initial_delay=0.005, min_samples=1000, max_rate=0.1, burst=1.0))
+    for i in range(20):
+        client._make_request("/v2/local/search/category.json", {"page": i})
+    hedges = session.calls - 20
+    # 처음 예산 1건 + 요청 20건 x 0.1
+    assert 1 <= hedges <= 3, hedges
+    print(f"[OK] 모든 요청이 헤지 시점보다 느려도 헤지는 20건 중 {hedges}건")
+
+
+@with_test_limiter
+def test_fast_requests_are_not_hedged():
+    session = StallingSession(stall_calls=())
+    client = make_client(session, HedgePolicy(initial_delay=0.5))
+    for i in range(10):
+        client._make_request("/v2/local/search/category.json", {"page": i})
+    assert session.calls == 10
+    print("[OK] 빠른 응답은 헤지하지 않음")
+
+
+def test_both_failures_raise_primary_error():
+    calls = []
+
+    def failing():
+        calls.append(len(calls))
+        index = calls[-1]
+        time.sleep(0.1)
+        raise TimeoutError(f"attempt {index}")
+
+    try:
+        hedged_call(failing, HedgePolicy(initial_delay=0.01), "test")
+    except TimeoutError as e:
+        assert str(e) == "attempt 0"
+    else:
+        raise AssertionError("예외가 전달되지 않음")
+    assert len(calls) == 2
+    print("[OK] 첫 요청/헤지 모두 실패하면 첫 요청의 예외")
+
+
+if __name__ == "__main__":
+    test_hedge_delay_follows_p95()
+    test_hedge_budget()
+    test_stalled_request_is_hedged()
+    test_hedge_rate_is_capped()
+    test_fast_requests_are_not_hedged()
+    test_both_failures_raise_primary_error()
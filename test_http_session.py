@@ -0,0 +1,47 @@
+"""
+공용 HTTP 세션 테스트 (네트워크 불필요)
+- 세 클라이언트가 같은 커넥션 풀 세션을 공유
+- 풀 크기/재시도 설정 반영
+"""
+
+from src.api_clients import (
+    GyeonggiDataClient,
+    KakaoLocalClient,
+    SeoulDataClient,
+    create_session,
+    get_shared_session,
+)
+
+
+def test_clients_share_session():
+    shared = get_shared_session()
+    clients = [
+        KakaoLocalClient(api_key="test"),
+        SeoulDataClient(api_key="test"),
+        GyeonggiDataClient(api_key="test"),
+    ]
+    assert all(client.session is shared for client in clients)
+    print("[OK] 세 클라이언트가 같은 세션 사용")
+
+
+def test_create_session_pool_settings():
+    session = create_session(pool_connections=3, pool_maxsize=7, max_retries=1)
+    adapter = session.get_adapter("https://dapi.kakao.com")
+
+    assert adapter._pool_connections == 3
+    assert adapter._pool_maxsize == 7
+    assert adapter.max_retries.total == 1
+    print("[OK] 커넥션 풀 설정 반영")
+
+
+def test_injected_session():
+    session = create_session()
+    client = SeoulDataClient(api_key="test", session=session)
+    assert client.session is session
+    print("[OK] 세션 주입")
+
+
+if __name__ == "__main__":
+    test_clients_share_session()
+    test_create_session_pool_settings()
+    test_injected_session()
@@ -0,0 +1,91 @@
+"""
+HTTP 전송 테스트 (네트워크 불필요, 로컬 포트 사용)
+- streamable HTTP로 MCP initialize / tools/list / tools/call
+- /healthz, /metrics 경로
+- SSE는 워커 1개만 허용
+"""
+
+import json
+import socket
+import threading
+import time
+
+import pytest
+import requests
+import uvicorn
+
+from src import asgi
+
+HEADERS = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+
+
+@pytest.fixture(autouse=True)
+def no_catalog(monkeypatch):
+    # 카탈로그 파일 없이 (스냅샷 갱신 중 타일 예열 생략)
+    monkeypatch.setenv("CATALOG_PATH", "")
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def rpc(url, request_id, method, params):
+    response = requests.post(url, headers=HEADERS, timeout=10, json={
+        "jsonrpc": "2.0", "id": request_id, "method": method, "params": params,
+    })
+    assert response.status_code == 200, response.text
+    response.encoding = "utf-8"
+    # streamable HTTP는 SSE 형식("data: {...}")으로 응답
+    data = [line[len("data: "):] for line in response.text.splitlines() if line.startswith("data: ")]
+    return json.loads(data[-1] if data else response.text)
+
+
+def test_streamable_http_serves_tools():
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(asgi.create_app("http"), host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{port}"
+    try:
+        for _ in range(100):
+            if server.started:
+                break
+            time.sleep(0.05)
+
+        health = requests.get(f"{base}/healthz", timeout=5).json()
+        assert health["status"] == "ok" and "seoul" in health["snapshots"]
+        assert "parking_" in requests.get(f"{base}/metrics", timeout=5).text
+
+        init = rpc(f"{base}/mcp", 1, "initialize", {
+            "protocolVersion": "2025-03-26", "capabilities": {},
+            "clientInfo": {"name": "test", "version": "1"},
+        })
+        assert init["result"]["serverInfo"]["name"] == "Parking Info Server"
+
+        # 세션 없이(stateless) 다른 워커로 가도 되는 요청
+        tools = rpc(f"{base}/mcp", 2, "tools/list", {})
+        names = {tool["name"] for tool in tools["result"]["tools"]}
+        assert {"search_nearby_parking", "search_nearby_parking_batch"} <= names
+
+        called = rpc(f"{base}/mcp", 3, "tools/call", {"name": "mcp_health_check", "arguments": {"address": "서울"}})
+        assert "서울" in called["result"]["content"][0]["text"]
+        print(f"[OK] streamable HTTP: 도구 {len(names)}개, /healthz, /metrics")
+    finally:
+        server.should_exit = True
+        thread.join(5)
+
+
+def test_sse_requires_single_worker():
+    try:
+        asgi.serve("sse", workers=2)
+    except ValueError as e:
+        print(f"[OK] SSE 다중 워커 거부: {e}")
+    else:
+        raise AssertionError("SSE 다중 워커가 허용됨")
+
+
+if __name__ == "__main__":
+    test_streamable_http_serves_tools()
+    test_sse_requires_single_worker()
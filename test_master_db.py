@@ -0,0 +1,87 @@
+"""
+주차장 기본 정보 SQLite 미러 테스트 (네트워크 불필요)
+- 동기화 시 변동 필드 제외, 코드 중복 제거
+- 파일 DB가 새 인스턴스(재시작)에서도 유지
+- 변동 필드 분리
+- 변동 스냅샷 저장/조회
+"""
+
+import os
+import tempfile
+
+from src.master_db import MasterDB, SEOUL_VOLATILE_FIELDS, split_volatile
+
+SEOUL_ROWS = [
+    {"PKLT_CD": "171721", "PKLT_NM": "세종로 공영주차장(시)", "ADDR": "종로구 세종로 80-1",
+     "LAT": 37.5735, "LOT": 126.9769, "TPKCT": 1260.0, "BSC_PRK_CRG": 430,
+     "NOW_PRK_VHCL_CNT": 800, "NOW_PRK_VHCL_UPDT_TM": "2025-12-10 10:24:30", "PRK_STTS_NM": "운영중"},
+    # 같은 주차장의 시간대별 요금 행 (코드 중복)
+    {"PKLT_CD": "171721", "PKLT_NM": "세종로 공영주차장(시)", "ADDR": "종로구 세종로 80-1",
+     "LAT": 37.5735, "LOT": 126.9769, "TPKCT": 1260.0, "BSC_PRK_CRG": 430,
+     "NOW_PRK_VHCL_CNT": 800, "NOW_PRK_VHCL_UPDT_TM": "2025-12-10 10:24:30", "PRK_STTS_NM": "운영중"},
+    {"PKLT_CD": "1010089", "PKLT_NM": "종묘 공영주차장(시)", "ADDR": "종로구 훈정동 2-0",
+     "LAT": 37.5709, "LOT": 126.9941, "TPKCT": 1400.0, "BSC_PRK_CRG": 300,
+     "NOW_PRK_VHCL_CNT": 120, "NOW_PRK_VHCL_UPDT_TM": "2025-12-10 10:20:00", "PRK_STTS_NM": "운영중"},
+    {"PKLT_CD": "1033125", "PKLT_NM": "좌표없는 주차장", "ADDR": "강남구 어딘가",
+     "LAT": "", "LOT": "", "TPKCT": "", "NOW_PRK_VHCL_CNT": 0},
+]
+
+
+def test_sync_excludes_volatile_fields():
+    db = MasterDB()
+    count = db.sync("seoul", SEOUL_ROWS, exclude_fields=SEOUL_VOLATILE_FIELDS)
+    assert count == 3
+
+    rows = db.rows("seoul")
+    assert [r["PKLT_CD"] for r in rows] == ["171721", "1010089", "1033125"]
+    assert all("NOW_PRK_VHCL_CNT" not in r for r in rows)
+    assert db.get("seoul", "171721")["BSC_PRK_CRG"] == 430
+    assert db.get("gyeonggi", "171721") is None
+
+    # 재동기화는 지역 전체를 교체
+    db.sync("seoul", SEOUL_ROWS[2:3])
+    assert [r["PKLT_CD"] for r in db.rows("seoul")] == ["1010089"]
+    print(f"[OK] 동기화 {count}건, 변동 필드 제외")
+
+
+def test_persists_across_instances():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "sub", "master.sqlite3")
+        db = MasterDB(path)
+        db.sync("seoul", SEOUL_ROWS)
+        db.close()
+
+        reopened = MasterDB(path)
+        assert len(reopened.rows("seoul")) == 3
+        assert reopened.is_fresh("seoul", 60)
+        assert not reopened.is_fresh("seoul", 0)
+        assert not reopened.is_fresh("gyeonggi", 60)
+        reopened.close()
+    print("[OK] 재시작 후에도 기본 정보 유지")
+
+
+def test_split_volatile():
+    slim = split_volatile(SEOUL_ROWS)
+    assert len(slim) == 3
+    assert slim[0] == {"PKLT_CD": "171721", "NOW_PRK_VHCL_CNT": 800,
+                       "NOW_PRK_VHCL_UPDT_TM": "2025-12-10 10:24:30", "PRK_STTS_NM": "운영중"}
+    assert slim[2] == {"PKLT_CD": "1033125", "NOW_PRK_VHCL_CNT": 0}
+    print("[OK] 변동 필드 분리")
+
+
+def test_snapshot_roundtrip():
+    db = MasterDB()
+    assert db.load_snapshot("seoul_occupancy") is None
+    slim = split_volatile(SEOUL_ROWS)
+    db.save_snapshot("seoul_occupancy", slim)
+    saved_at, rows = db.load_snapshot("seoul_occupancy")
+    assert rows == slim
+    assert saved_at > 0
+    print(f"[OK] 변동 스냅샷 {len(rows)}건 저장/조회")
+
+
+if __name__ == "__main__":
+    test_sync_excludes_volatile_fields()
+    test_persists_across_instances()
+    test_split_volatile()
+    test_snapshot_roundtrip()
@@ -0,0 +1,111 @@
+"""
+서버 지표 테스트 (네트워크 불필요)
+- 외부 API 호출/오류/타임아웃 카운터와 응답 시간 히스토그램
+- 단계별 시간 측정, Prometheus 텍스트 출력
+- 삼킨 예외가 오류 카운터로 기록되는지
+- 레이블 값 이스케이프, /metrics 서버 기본 바인딩 주소
+"""
+
+from src import metrics
+from src.api_clients import SeoulDataClient
+from src.metrics import MetricsRegistry, instrument_upstream
+
+
+class TimeoutSeoulClient(SeoulDataClient):
+    def __init__(self):
+        super().__init__(api_key="test")
+
+    @instrument_upstream("seoul_test")
+    def _make_request(self, endpoint, params, timeout=10):
+        raise TimeoutError("API 요청 타임아웃 (>10초)")
+
+
+def test_upstream_counters():
+    client = TimeoutSeoulClient()
+    try:
+        client.get_realtime_parking_info()
+    except TimeoutError:
+        pass
+
+    registry = metrics.registry
+    assert registry.counter(metrics.UPSTREAM_REQUESTS).get(upstream="seoul_test") == 1
+    assert registry.counter(metrics.UPSTREAM_ERRORS).get(upstream="seoul_test", kind="timeout") == 1
+    print("[OK] 외부 API 호출/타임아웃 카운터")
+
+
+def test_stage_histogram_and_prometheus():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("stage_seconds", "단계별 시간")
+    for value in (0.002, 0.02, 0.2, 20.0):
+        histogram.observe(value, stage="geocode")
+    registry.counter("errors_total", "오류").inc(component="seoul_realtime", error="KeyError")
+    registry.register_collector("cache", "캐시", lambda: {"hit_ratio": 0.75})
+
+    text = registry.render_prometheus()
+    assert 'stage_seconds_bucket{stage="geocode",le="0.005"} 1' in text
+    assert 'stage_seconds_bucket{stage="geocode",le="+Inf"} 4' in text
+    assert 'stage_seconds_count{stage="geocode"} 4' in text
+    assert 'errors_total{component="seoul_realtime",error="KeyError"} 1' in text
+    assert 'cache{kind="hit_ratio"} 0.75' in text
+
+    summary = registry.snapshot()["stage_seconds"][0]
+    assert summary["count"] == 4 and summary["p50"] == 0.025
+    print("[OK] 히스토그램 / Prometheus 출력")
+
+
+def test_label_values_are_escaped():
+    registry = MetricsRegistry()
+    registry.counter("errors_total", "오류").inc(error='bad "quote" \\ line\nbreak')
+    text = registry.render_prometheus()
+    assert 'errors_total{error="bad \\"quote\\" \\\\ line\\nbreak"} 1' in text
+    assert len(text.strip().splitlines()) == 3
+    print("[OK] 레이블 값 이스케이프")
+
+
+def test_metrics_server_binds_localhost():
+    server = metrics.start_metrics_server(port=_free_port())
+    try:
+        assert server.server_address[0] == "127.0.0.1"
+    finally:
+        server.shutdown()
+        server.server_close()
+        metrics._metrics_server = None
+    print("[OK] /metrics 서버 기본 바인딩 127.0.0.1")
+
+
+def _free_port():
+    import socket
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_swallowed_errors_are_counted():
+    import src.server as server
+
+    before = metrics.registry.counter(metrics.ERRORS).get(component="seoul_realtime", error="RuntimeError")
+
+    class BrokenSnapshot:
+        def get_index(self):
+            raise RuntimeError("boom")
+
+    original = server._seoul_snapshot
+    server._seoul_snapshot = BrokenSnapshot()
+    try:
+        result = server._get_realtime_info_seoul("세종로", "")
+    finally:
+        server._seoul_snapshot = original
+
+    assert result["status"] == "unavailable"
+    after = metrics.registry.counter(metrics.ERRORS).get(component="seoul_realtime", error="RuntimeError")
+    assert after == before + 1
+    print("[OK] 삼킨 예외 카운트")
+
+
+if __name__ == "__main__":
+    test_upstream_counters()
+    test_stage_histogram_and_prometheus()
+    test_label_values_are_escaped()
+    test_metrics_server_binds_localhost()
+    test_swallowed_errors_are_counted()
@@ -0,0 +1,68 @@
+"""
+주차장 이름/주소 역색인 테스트 (네트워크 불필요)
+- 공백/접미사 표기가 달라도 같은 주차장 매칭
+- 주소 포함 여부로 매칭
+- 관련 없는 이름은 매칭하지 않음
+"""
+
+import time
+
+from src.matching import NameIndex
+from src.matching.name_index import normalize_address, normalize_name
+
+ROWS = [
+    {"PKLT_NM": "세종로 공영주차장(시)", "ADDR": "종로구 세종로 80-1"},
+    {"PKLT_NM": "종묘주차장 공영(시)", "ADDR": "종로구 훈정동 2-0"},
+    {"PKLT_NM": "서울역 서부 공영주차장", "ADDR": "중구 만리동1가 62-0"},
+    {"PKLT_NM": "잠실운동장 공영주차장", "ADDR": "송파구 잠실동 10-0"},
+]
+
+
+def test_normalize():
+    assert normalize_name("세종로 공영주차장(시)") == "세종로시"
+    assert normalize_address("서울 종로구 세종로 80-1") == "종로구세종로801"
+    print("[OK] 정규화")
+
+
+def test_best_match_by_name():
+    index = NameIndex(ROWS, "PKLT_NM", ("ADDR",))
+
+    assert index.best_match("세종로공영주차장", "") is ROWS[0]
+    assert index.best_match("잠실운동장 주차장", "") is ROWS[3]
+    assert index.best_match("롯데월드타워 주차장", "") is None
+    print("[OK] 이름 매칭")
+
+
+def test_best_match_by_address():
+    index = NameIndex(ROWS, "PKLT_NM", ("ADDR",))
+
+    assert index.best_match("만리동 주차장", "서울 중구 만리동1가 62") is ROWS[2]
+    print("[OK] 주소 매칭")
+
+
+def test_search_ranking():
+    index = NameIndex(ROWS, "PKLT_NM", ("ADDR",))
+
+    results = index.search("서울역 서부 주차장")
+    assert results and results[0][1] is ROWS[2]
+    print(f"[OK] 순위 검색: {[row['PKLT_NM'] for _, row in results]}")
+
+
+def test_lookup_speed():
+    rows = [{"PKLT_NM": f"테스트{i}번 공영주차장", "ADDR": f"강남구 역삼동 {i}"} for i in range(5000)]
+    index = NameIndex(rows, "PKLT_NM", ("ADDR",))
+
+    start = time.perf_counter()
+    for _ in range(100):
+        index.best_match("테스트4321번 주차장", "강남구 역삼동 4321")
+    elapsed = (time.perf_counter() - start) / 100
+    assert index.best_match("테스트4321번 주차장", "") is rows[4321]
+    print(f"[OK] 5000건 중 조회 평균 {elapsed * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    test_normalize()
+    test_best_match_by_name()
+    test_best_match_by_address()
+    test_search_ranking()
+    test_lookup_speed()
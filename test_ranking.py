@@ -0,0 +1,174 @@
+"""
+후보 순위 계산 테스트 (네트워크 불필요)
+- 열 배열 거리 계산이 haversine과 일치
+- 반경 필터/정렬, 가용률·요금 점수 순위
+- NumPy 유무와 관계없이 같은 결과 (NumPy 경로는 설치되어 있을 때만)
+- 기본 가중치로 서버 결과가 가용률/요금을 반영해 정렬
+"""
+
+import random
+import time
+
+import pytest
+
+import src.server as server
+from src.matching import ranking
+from src.matching.ranking import CandidateSet
+from src.matching.spatial_index import haversine
+
+GANGNAM = (37.4979, 127.0276)
+
+
+def make_documents(count, seed=7):
+    rng = random.Random(seed)
+    documents = []
+    for i in range(count):
+        documents.append({
+            "id": str(i),
+            "place_name": f"주차장{i}",
+            "x": f"{GANGNAM[1] + rng.uniform(-0.03, 0.03):.6f}",
+            "y": f"{GANGNAM[0] + rng.uniform(-0.03, 0.03):.6f}",
+        })
+    documents.append({"id": "no-coord", "place_name": "좌표 없음", "x": "", "y": None})
+    return documents
+
+
+def test_distances_match_haversine():
+    documents = make_documents(200)
+    distances = list(CandidateSet(documents).distances(*GANGNAM))
+    for document, distance in zip(documents[:-1], distances):
+        expected = haversine(GANGNAM[0], GANGNAM[1], float(document["y"]), float(document["x"]))
+        assert abs(distance - expected) < 1e-6
+    assert distances[-1] == float("inf")
+    print(f"[OK] 거리 {len(documents)}건 haversine 일치 (NumPy {'사용' if ranking.HAS_NUMPY else '없음'})")
+
+
+def test_within_documents_sorted_and_deduped():
+    documents = make_documents(300)
+    first = CandidateSet(documents[:200])
+    second = CandidateSet(documents[150:])
+    found = CandidateSet.concat([first, second]).within_documents(*GANGNAM, 1500)
+    ids = [d["id"] for d in found]
+    assert len(ids) == len(set(ids))
+    assert [int(d["distance"]) for d in found] == sorted(int(d["distance"]) for d in found)
+    expected = {d["id"] for d in documents[:-1]
+                if haversine(GANGNAM[0], GANGNAM[1], float(d["y"]), float(d["x"])) <= 1500}
+    assert set(ids) == expected
+    print(f"[OK] 반경 1.5km 안 {len(found)}건 (중복 없음, 가까운 순)")
+
+
+def test_rank_by_availability_and_fee():
+    documents = [
+        {"id": "near-full", "x": "127.0276", "y": "37.4984"},
+        {"id": "far-empty", "x": "127.0276", "y": "37.5009"},
+        {"id": "near-pricey", "x": "127.0276", "y": "37.4985"},
+    ]
+    candidates = CandidateSet(
+        documents,
+        capacity=[100, 100, None],
+        available=[0, 90, None],
+        fee=[500, 500, 3000],
+    )
+    by_distance = candidates.rank(*GANGNAM)
+    assert [documents[i]["id"] for i in by_distance] == ["near-full", "near-pricey", "far-empty"]
+
+    by_availability = candidates.rank(*GANGNAM, availability_weight=1.0)
+    assert documents[by_availability[0]]["id"] == "far-empty"
+
+    by_fee = candidates.rank(*GANGNAM, fee_weight=1.0)
+    assert documents[by_fee[-1]]["id"] == "near-pricey"
+    assert candidates.rank(*GANGNAM, limit=1, fee_weight=1.0) == by_fee[:1]
+    print("[OK] 가용률/요금 가중치에 따른 순위 변경")
+
+
+def test_pure_python_fallback_matches():
+    documents = make_documents(500)
+    capacity = [random.Random(i).randint(10, 200) for i in range(len(documents))]
+    available = [c // (i % 5 + 1) for i, c in enumerate(capacity)]
+    fee = [None if i % 7 == 0 else 500 + 100 * (i % 10) for i in range(len(documents))]
+    weights = {"availability_weight": 0.5, "fee_weight": 0.2}
+
+    with_numpy = CandidateSet(documents, capacity, available, fee)
+    expected_within = [i for _, i in with_numpy.within(*GANGNAM, 2000)]
+    expected_rank = with_numpy.rank(*GANGNAM, limit=20, **weights)
+
+    saved = ranking.HAS_NUMPY
+    ranking.HAS_NUMPY = False
+    try:
+        fallback = CandidateSet(documents, capacity, available, fee)
+        assert [i for _, i in fallback.within(*GANGNAM, 2000)] == expected_within
+        assert fallback.rank(*GANGNAM, limit=20, **weights) == expected_rank
+    finally:
+        ranking.HAS_NUMPY = saved
+    print("[OK] 순수 Python 구현과 결과 일치")
+
+
+@pytest.mark.skipif(not ranking.HAS_NUMPY, reason="NumPy 미설치")
+def test_numpy_path():
+    import numpy as np
+
+    documents = make_documents(400)
+    capacity = [50 + i % 30 for i in range(len(documents))]
+    available = [i % 40 for i in range(len(documents))]
+    fee = [None if i % 5 == 0 else 300 * (i % 8) for i in range(len(documents))]
+    weights = {"availability_weight": 0.7, "fee_weight": 0.3}
+
+    candidates = CandidateSet.concat([
+        CandidateSet(documents[:250], capacity[:250], available[:250], fee[:250]),
+        CandidateSet(documents[250:], capacity[250:], available[250:], fee[250:]),
+    ])
+    assert isinstance(candidates.lat, np.ndarray) and isinstance(candidates.fee, np.ndarray)
+    assert np.isinf(candidates.distances(*GANGNAM)[-1])
+
+    scores = candidates.scores(*GANGNAM, **weights).tolist()
+    full = candidates.rank(*GANGNAM, **weights)
+    assert full == sorted(range(len(scores)), key=scores.__getitem__)
+    # argpartition으로 고른 상위 limit건도 전체 정렬의 앞부분과 같음
+    for limit in (0, 1, 10, len(documents)):
+        assert candidates.rank(*GANGNAM, limit=limit, **weights) == full[:limit]
+
+    saved = ranking.HAS_NUMPY
+    ranking.HAS_NUMPY = False
+    try:
+        fallback = CandidateSet(documents, capacity, available, fee)
+        expected = fallback.scores(*GANGNAM, **weights)
+    finally:
+        ranking.HAS_NUMPY = saved
+    assert all(abs(a - b) < 1e-9 for a, b in zip(scores, expected) if b != float("inf"))
+    print(f"[OK] NumPy 경로: 후보 {len(candidates)}건 점수/순위가 순수 Python과 일치")
+
+
+def test_default_weights_rank_results():
+    documents = [
+        {"id": "near-full", "x": "127.0276", "y": "37.4984"},
+        {"id": "bit-farther-empty", "x": "127.0276", "y": "37.4994"},
+    ]
+    entries = [
+        {"name": "near-full", "total_spots": 100, "available_spots": 0},
+        {"name": "bit-farther-empty", "total_spots": 100, "available_spots": 100},
+    ]
+    # 약 110m 더 멀지만 빈자리가 다 남은 주차장이 앞으로
+    ranked = server._rank_entries(*GANGNAM, documents, entries)
+    assert [entry["name"] for entry in ranked] == ["bit-farther-empty", "near-full"]
+    print("[OK] 기본 가중치: 조금 멀어도 빈자리가 많은 주차장을 먼저")
+
+
+def test_rank_thousands_of_candidates():
+    candidates = CandidateSet(make_documents(5000))
+    start = time.perf_counter()
+    for _ in range(20):
+        top = candidates.rank(*GANGNAM, limit=10, availability_weight=0.5)
+    elapsed = (time.perf_counter() - start) / 20
+    assert len(top) == 10
+    print(f"[OK] 후보 {len(candidates)}건 순위 계산 {elapsed * 1000:.2f}ms/회")
+
+
+if __name__ == "__main__":
+    test_distances_match_haversine()
+    test_within_documents_sorted_and_deduped()
+    test_rank_by_availability_and_fee()
+    test_pure_python_fallback_matches()
+    if ranking.HAS_NUMPY:
+        test_numpy_path()
+    test_default_weights_rank_results()
+    test_rank_thousands_of_candidates()
@@ -0,0 +1,293 @@
+"""
+외부 API 속도 제한 / 일일 할당량 테스트 (네트워크 불필요)
+- 토큰 버킷: 순간 허용량 이후에는 QPS에 맞춰 대기, 대기 한도를 넘으면 거부
+- 백그라운드 호출은 예비 토큰을 남기고, 기다리는 도구 호출에 양보
+- 일일 할당량은 파일에 누적되어 재시작 후에도 유지, 백그라운드는 예비분 전에 멈춤
+- 일일 할당량은 요청마다가 아니라 블록 단위로 파일에 예약 (워커 여러 개가 나눠 써도 한도 유지)
+- 원천 API 429 응답은 RateLimitError로 바꾸고 Retry-After 동안 요청 중단
+- 기본 카카오 한도로 콜드 주변 검색 여러 건이 통과, 한도에 걸리면 실패 결과로 응답
+"""
+
+import asyncio
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+
+import requests
+
+import src.server as server
+from src.api_clients import AsyncKakaoLocalClient, KakaoLocalClient, rate_limit
+from src.api_clients.rate_limit import (
+    BACKGROUND,
+    INTERACTIVE,
+    DailyQuota,
+    RateLimitError,
+    UpstreamLimiter,
+    background_priority,
+    current_priority,
+)
+from src.cache import GeocodeCache, TileCache
+
+
+def test_token_bucket_burst_then_rate():
+    limiter = UpstreamLimiter("test", qps=20, burst=2, max_wait=1.0)
+    start = time.perf_counter()
+    for _ in range(4):
+        limiter.acquire(INTERACTIVE)
+    elapsed = time.perf_counter() - start
+    # 2건은 바로, 나머지 2건은 1/20초 간격
+    assert 0.08 <= elapsed < 0.5, elapsed
+
+    strict = UpstreamLimiter("test", qps=1, burst=1, max_wait=0.05)
+    strict.acquire(INTERACTIVE)
+    try:
+        strict.acquire(INTERACTIVE)
+    except RateLimitError as e:
+        assert e.retry_after > 0.5
+    else:
+        raise AssertionError("대기 한도를 넘었는데 통과함")
+    print(f"[OK] 순간 허용량 2건 + 초당 20건 (4건 {elapsed * 1000:.0f}ms), 대기 한도 초과 거부")
+
+
+def test_background_keeps_reserve_for_interactive():
+    limiter = UpstreamLimiter("test", qps=0.5, burst=5, reserve=0.4, max_wait=0.01, background_max_wait=0.01)
+    taken = 0
+    try:
+        while True:
+            limiter.acquire(BACKGROUND)
+            taken += 1
+    except RateLimitError:
+        pass
+    # 버킷 5개 중 2개(40%)는 도구 호출용으로 남음
+    assert taken == 3
+    limiter.acquire(INTERACTIVE)
+    limiter.acquire(INTERACTIVE)
+    print(f"[OK] 백그라운드 {taken}건 후 멈추고 예비 토큰은 도구 호출이 사용")
+
+
+def test_interactive_goes_before_waiting_background():
+    limiter = UpstreamLimiter("test", qps=10, burst=1, reserve=0.0, max_wait=2.0, background_max_wait=2.0)
+    limiter.acquire(INTERACTIVE)
+    order = []
+
+    def call(priority):
+        limiter.acquire(priority)
+        order.append(priority)
+
+    background = threading.Thread(target=call, args=(BACKGROUND,))
+    background.start()
+    time.sleep(0.02)
+    interactive = threading.Thread(target=call, args=(INTERACTIVE,))
+    interactive.start()
+    background.join(3)
+    interactive.join(3)
+    assert order == [INTERACTIVE, BACKGROUND], order
+    print("[OK] 먼저 기다리던 백그라운드 호출보다 도구 호출이 먼저 토큰 사용")
+
+
+def test_priority_context():
+    assert current_priority() == INTERACTIVE
+    with background_priority():
+        assert current_priority() == BACKGROUND
+    assert current_priority() == INTERACTIVE
+    print("[OK] background_priority() 블록 안에서만 백그라운드 우선순위")
+
+
+def test_daily_quota_persists():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "quota.sqlite3")
+        quota = DailyQuota(path)
+        limiter = UpstreamLimiter("seoul", daily_limit=10, reserve=0.2, quota=quota)
+        background = 0
+        try:
+            while True:
+                limiter.acquire(BACKGROUND)
+                background += 1
+        except RateLimitError as e:
+            assert "일일 호출 한도" in str(e)
+        # 10건 중 2건(20%)은 도구 호출용
+        assert background == 8
+        limiter.acquire(INTERACTIVE)
+        quota.close()
+
+        # 재시작(다른 워커)도 같은 파일에서 오늘 사용량을 이어서 셈
+        reopened = DailyQuota(path)
+        assert reopened.used("seoul") == 9
+        restarted = UpstreamLimiter("seoul", daily_limit=10, quota=reopened)
+        restarted.acquire(INTERACTIVE)
+        try:
+            restarted.acquire(INTERACTIVE)
+        except RateLimitError:
+            pass
+        else:
+            raise AssertionError("일일 한도를 넘었는데 통과함")
+        assert restarted.stats()["remaining_today"] == 0
+        reopened.close()
+    print(f"[OK] 일일 할당량: 백그라운드 {background}건에서 멈춤, 재시작 후에도 사용량 유지")
+
+
+def test_quota_reserves_blocks():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "quota.sqlite3")
+        workers = [DailyQuota(path, block=20) for _ in range(2)]
+        transactions = []
+        for quota in workers:
+            quota._conn.set_trace_callback(
+                lambda statement: transactions.append(statement) if statement == "BEGIN IMMEDIATE" else None
+            )
+
+        # 두 워커가 번갈아 한도 50까지 사용: 파일 쓰기는 블록마다 한 번, 합계는 한도를 넘지 않음
+        consumed = 0
+        active = list(workers)
+        while active:
+            for quota in list(active):
+                try:
+                    quota.consume("kakao", limit=50)
+                    consumed += 1
+                except RateLimitError:
+                    active.remove(quota)
+        assert consumed == 50 and len(transactions) <= 5, (consumed, transactions)
+        assert workers[0].used("kakao") == 50
+
+        # 쓰지 않은 예약분은 닫을 때 돌려줌
+        partial = DailyQuota(os.path.join(directory, "partial.sqlite3"), block=20)
+        for _ in range(3):
+            partial.consume("seoul")
+        partial.close()
+        reopened = DailyQuota(os.path.join(directory, "partial.sqlite3"))
+        assert reopened.used("seoul") == 3
+        for quota in workers + [reopened]:
+            quota.close()
+    print(f"[OK] 일일 할당량 블록 예약: 워커 2개 {consumed}건에 파일 쓰기 {len(transactions)}회")
+
+
+class RateLimitedSession:
+    """항상 429를 돌려주는 세션"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        response = requests.Response()
+        response.status_code = 429
+        response.headers["Retry-After"] = "0.3"
+        response._content = b"{}"
+        response.url = url
+        return response
+
+
+def test_kakao_429_pauses_limiter():
+    session = RateLimitedSession()
+    client = KakaoLocalClient(api_key="test", geocode_cache=GeocodeCache(path=None), session=session)
+    original = rate_limit._limiters.get("kakao")
+    rate_limit._limiters["kakao"] = UpstreamLimiter("kakao", qps=100, burst=10, max_wait=0.05)
+    try:
+        try:
+            client._make_request("/v2/local/search/category.json", {"x": 127.0})
+        except RateLimitError as e:
+            assert e.retry_after == 0.3
+        else:
+            raise AssertionError("429가 RateLimitError로 바뀌지 않음")
+
+        # Retry-After 동안은 원천 API를 다시 호출하지 않고 바로 거부
+        try:
+            client._make_request("/v2/local/search/category.json", {"x": 127.1})
+        except RateLimitError:
+            pass
+        assert session.calls == 1
+    finally:
+        if original is None:
+            rate_limit._limiters.pop("kakao", None)
+        else:
+            rate_limit._limiters["kakao"] = original
+    print("[OK] 카카오 429 → RateLimitError, Retry-After 동안 호출 중단")
+
+
+class KakaoStubSession:
+    """주소 변환과 거리순 키워드 검색에 응답하는 카카오 세션 (1.2~3km에만 주차장이 있는 지역)"""
+
+    CENTER = (35.1631, 129.1636)
+
+    def __init__(self):
+        self.calls = 0
+        self.lock = threading.Lock()
+        self.documents = []
+        for i in range(60):
+            distance = 1200 + 30 * i
+            angle = i * 0.7
+            self.documents.append({
+                "id": str(i), "place_name": f"해운대 주차장{i}", "address_name": "부산 해운대구",
+                "y": f"{self.CENTER[0] + distance * math.sin(angle) / 111320:.6f}",
+                "x": f"{self.CENTER[1] + distance * math.cos(angle) / 91290:.6f}",
+                "distance": str(distance),
+            })
+
+    def get(self, url, params=None, **kwargs):
+        with self.lock:
+            self.calls += 1
+        if url.endswith("/address.json"):
+            body = {"documents": [{"y": str(self.CENTER[0]), "x": str(self.CENTER[1])}]}
+        else:
+            size, page = int(params.get("size", 15)), int(params.get("page", 1))
+            found = [d for d in self.documents if int(d["distance"]) <= int(params.get("radius", 20000))]
+            start = (page - 1) * size
+            body = {"documents": found[start:start + size], "meta": {
+                "total_count": len(found), "pageable_count": len(found), "is_end": start + size >= len(found)}}
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps(body).encode()
+        response.url = url
+        return response
+
+
+def test_cold_searches_fit_default_kakao_limiter():
+    session = KakaoStubSession()
+    client = KakaoLocalClient(api_key="test", geocode_cache=GeocodeCache(path=None), session=session)
+    saved_env = {name: os.environ.pop(name, None) for name in ("KAKAO_QPS", "KAKAO_BURST", "RATE_LIMIT_MAX_WAIT")}
+    original_limiter = rate_limit._limiters.pop("kakao", None)
+    original = server._async_kakao_client, server._has_public_match, server.get_tile_cache
+    server._async_kakao_client = lambda: AsyncKakaoLocalClient(client)
+    server._has_public_match = lambda document: None
+    server.get_tile_cache = lambda: TileCache(max_radius=1000)
+    try:
+        limiter = rate_limit.get_limiter("kakao")
+
+        async def cold_searches():
+            return await asyncio.gather(*(server.search_nearby_parking(f"부산 해운대구 {i}") for i in range(3)))
+
+        results = asyncio.run(cold_searches())
+        assert all(result["success"] and result["count"] == 10 for result in results), results
+        per_search = session.calls / len(results)
+        assert per_search * 2 <= limiter.burst, per_search
+
+        # 한도에 걸리면 (대신 쓸 타일도 없으므로) 예외 대신 실패 결과
+        limiter.penalize(retry_after=30)
+        result = asyncio.run(server.search_nearby_parking("부산 해운대구 3"))
+        assert result["success"] is False and result["count"] == 0 and result["retry_after"] > 0
+    finally:
+        server._async_kakao_client, server._has_public_match, server.get_tile_cache = original
+        if original_limiter is None:
+            rate_limit._limiters.pop("kakao", None)
+        else:
+            rate_limit._limiters["kakao"] = original_limiter
+        for name, value in saved_env.items():
+            if value is not None:
+                os.environ[name] = value
+    print(f"[OK] 기본 카카오 한도(burst {limiter.burst:.0f}): 콜드 검색 3건 통과 (건당 {per_search:.0f}회), "
+          "한도 초과 시 실패 결과")
+
+
+if __name__ == "__main__":
+    test_token_bucket_burst_then_rate()
+    test_background_keeps_reserve_for_interactive()
+    test_interactive_goes_before_waiting_background()
+    test_priority_context()
+    test_daily_quota_persists()
+    test_quota_reserves_blocks()
+    test_kakao_429_pauses_limiter()
+    test_cold_searches_fit_default_kakao_limiter()
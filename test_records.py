@@ -0,0 +1,106 @@
+"""
+공공데이터 압축 레코드 테스트 (네트워크 불필요)
+- 원본 필드명 get() 호환, 숫자 변환, 문자열 intern
+- 매칭 색인/스냅샷 증분 갱신에 그대로 사용
+- 원본 행 dict보다 메모리가 작음
+"""
+
+import json
+import os
+import tracemalloc
+
+from src.matching import LotMatcher
+from src.records import GyeonggiLot, SeoulLot, SeoulOccupancy
+from src.snapshot import SnapshotStore
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks", "fixtures")
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return json.load(f)
+
+
+SEOUL_ROW = load_fixture("seoul_get_parking_info.json")["GetParkingInfo"]["row"][0]
+GYEONGGI_ROW = load_fixture("gyeonggi_parking_place.json")["ParkingPlace"][1]["row"][0]
+
+
+def test_record_fields_and_get():
+    lot = SeoulLot.from_row(SEOUL_ROW)
+    assert lot.code == "1010089" and lot.total == 1260 and lot.basic_fee == 430
+    assert lot.lat == 37.5735 and lot.lng == 126.9769
+    assert lot.get("PKLT_NM") == SEOUL_ROW["PKLT_NM"]
+    assert lot.get("TPKCT", 0) == 1260
+    assert lot.get("NOW_PRK_VHCL_CNT", "없음") == "없음"
+    assert "ADDR" in lot and "OPER_SE_NM" not in lot
+    assert not hasattr(lot, "__dict__")
+
+    place = GyeonggiLot.from_row(GYEONGGI_ROW)
+    assert place.total == 420 and place.lat == 37.385
+    assert place.get("LOCPLC_LOTNO_ADDR") == GYEONGGI_ROW["LOCPLC_LOTNO_ADDR"]
+    assert GyeonggiLot.from_row(dict(GYEONGGI_ROW, PARKNG_COMPRT_PLANE_CNT="")).total is None
+
+    occupancy = SeoulOccupancy.from_row(SEOUL_ROW)
+    assert occupancy.parked == 689 and occupancy.get("NOW_PRK_VHCL_UPDT_TM") == "2025-12-10 10:24:30"
+    assert SeoulOccupancy.from_row(occupancy.to_dict()) == occupancy
+    print(f"[OK] 레코드 필드 변환, get() 호환: {lot!r}"[:120])
+
+
+def test_strings_are_interned():
+    first = json.loads(json.dumps(SEOUL_ROW, ensure_ascii=False))
+    second = json.loads(json.dumps(SEOUL_ROW, ensure_ascii=False))
+    assert first["PRK_STTS_NM"] is not second["PRK_STTS_NM"]
+    a, b = SeoulOccupancy.from_rows([first, second])
+    assert a.status is b.status
+    print("[OK] 같은 상태명 문자열 공유")
+
+
+def test_records_work_with_matcher_and_snapshot():
+    rows = [dict(SEOUL_ROW, PKLT_CD=str(i), PKLT_NM=f"테스트{i}주차장", LAT=37.5 + i * 0.01) for i in range(5)]
+    lots = SeoulLot.from_rows(rows)
+    matcher = LotMatcher(lots, "PKLT_NM", ("ADDR",), "LAT", "LOT")
+    found = matcher.match("테스트3주차장", SEOUL_ROW["ADDR"], 37.53, 126.9769)
+    assert found is lots[3]
+
+    batches = [
+        SeoulOccupancy.from_rows(rows),
+        SeoulOccupancy.from_rows([dict(rows[0], NOW_PRK_VHCL_UPDT_TM="2025-12-10 10:30:00", NOW_PRK_VHCL_CNT=1)]
+                                 + rows[1:]),
+    ]
+    snapshot = SnapshotStore(
+        "records", lambda: batches.pop(0), ttl=0.0,
+        update_field="NOW_PRK_VHCL_UPDT_TM", key_field="PKLT_CD",
+        index_builder=lambda rows: {row.get("PKLT_CD"): row for row in rows},
+        index_updater=lambda index, changed, removed: {**index, **{r.get("PKLT_CD"): r for r in changed}},
+    )
+    assert snapshot.refresh()
+    version = snapshot.version
+    assert snapshot.refresh()
+    assert snapshot.version == version + 1
+    assert snapshot.get_index()["0"].parked == 1
+    print("[OK] 매칭 색인과 스냅샷 증분 갱신에 레코드 사용")
+
+
+def test_records_use_less_memory():
+    text = json.dumps([dict(SEOUL_ROW, PKLT_CD=str(i), PKLT_NM=f"공영주차장{i}") for i in range(2000)],
+                      ensure_ascii=False)
+
+    def traced(build):
+        tracemalloc.start()
+        try:
+            kept = build()
+            return kept, tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+    _, raw = traced(lambda: json.loads(text))
+    _, compact = traced(lambda: SeoulLot.from_rows(json.loads(text)))
+    assert compact < raw / 2
+    print(f"[OK] 2000행 {raw / 1e6:.1f}MB → {compact / 1e6:.1f}MB")
+
+
+if __name__ == "__main__":
+    test_record_fields_and_get()
+    test_strings_are_interned()
+    test_records_work_with_matcher_and_snapshot()
+    test_records_use_less_memory()
@@ -0,0 +1,69 @@
+"""
+서울 GetParkingInfo 전체 페이지 조회 테스트 (네트워크 불필요)
+- list_total_count 기준으로 1000건 단위 구간을 모두 조회
+- 결과 행 순서가 원본과 동일한지 확인
+- 백그라운드 갱신이면 작업 스레드에서 받는 페이지도 백그라운드 우선순위로 요청
+"""
+
+from src.api_clients import SeoulDataClient
+from src.api_clients.rate_limit import BACKGROUND, background_priority, current_priority
+
+
+class FakeSeoulClient(SeoulDataClient):
+    """요청 구간을 기록하고 가짜 행을 반환하는 클라이언트"""
+
+    def __init__(self, total: int):
+        super().__init__(api_key="test")
+        self.total = total
+        self.windows = []
+        self.priorities = []
+
+    def get_realtime_parking_info(self, start_index=1, end_index=1000):
+        self.windows.append((start_index, end_index))
+        self.priorities.append(current_priority())
+        end = min(end_index, self.total)
+        return {
+            "status": "success",
+            "data": {
+                "GetParkingInfo": {
+                    "list_total_count": self.total,
+                    "row": [{"PKLT_CD": str(i)} for i in range(start_index, end + 1)],
+                }
+            }
+        }
+
+
+def test_get_all_realtime_parking_info():
+    client = FakeSeoulClient(total=2500)
+    response = client.get_all_realtime_parking_info(max_workers=3)
+
+    rows = response["data"]["GetParkingInfo"]["row"]
+    assert len(rows) == 2500
+    assert [r["PKLT_CD"] for r in rows] == [str(i) for i in range(1, 2501)]
+    assert sorted(client.windows) == [(1, 1000), (1001, 2000), (2001, 2500)]
+    print(f"[OK] {len(client.windows)}개 구간, {len(rows)}건 병합")
+
+
+def test_get_all_realtime_parking_info_single_page():
+    client = FakeSeoulClient(total=10)
+    response = client.get_all_realtime_parking_info()
+
+    assert len(response["data"]["GetParkingInfo"]["row"]) == 10
+    assert client.windows == [(1, 1000)]
+    print("[OK] 단일 페이지는 추가 요청 없음")
+
+
+def test_pages_keep_background_priority():
+    client = FakeSeoulClient(total=3500)
+    with background_priority():
+        client.get_all_realtime_parking_info(max_workers=3)
+
+    assert len(client.priorities) == 4
+    assert all(priority == BACKGROUND for priority in client.priorities), client.priorities
+    print(f"[OK] 백그라운드 갱신: {len(client.priorities)}개 페이지 모두 {BACKGROUND}")
+
+
+if __name__ == "__main__":
+    test_get_all_realtime_parking_info()
+    test_get_all_realtime_parking_info_single_page()
+    test_pages_keep_background_priority()
@@ -0,0 +1,178 @@
+"""
+공유 실시간 스냅샷 파일 테스트 (네트워크 불필요)
+- 레코드 → 버전 파일 → mmap 표 왕복 (None 값 포함)
+- 새 버전이 나오면 읽기 쪽이 통째로 교체, 이전 표는 계속 읽을 수 있음
+- 다른 프로세스에서도 같은 파일을 읽음
+- 서버 실시간 조회가 공유 스냅샷으로 동작
+- reader가 기본 정보 DB 동기화 전에 떠도 빈 기본 정보를 오래 들고 있지 않음
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import src.server as server
+from src.matching import LotMatcher
+from src.records import SeoulOccupancy
+from src.shared_snapshot import SharedSnapshotReader, SharedTable, publish
+from src.snapshot import SnapshotStore
+
+
+def make_occupancy(count, parked=10, updated="2025-12-10 10:24:30"):
+    return SeoulOccupancy.from_rows([
+        {"PKLT_CD": str(1000 + i), "NOW_PRK_VHCL_CNT": parked + i, "NOW_PRK_VHCL_UPDT_TM": updated,
+         "PRK_STTS_YN": "1" if i % 2 else None, "PRK_STTS_NM": "현재~20분이내 연계데이터 존재"}
+        for i in range(count)
+    ])
+
+
+def test_publish_and_map_roundtrip():
+    with tempfile.TemporaryDirectory() as directory:
+        records = make_occupancy(50)
+        path = publish(directory, "seoul", records, SeoulOccupancy, version=7, written_at=1234.5)
+        table = SharedTable(path, SeoulOccupancy)
+        assert len(table) == 50 and table.version == 7 and table.written_at == 1234.5
+        assert table.records() == records
+        assert table.get("1003").parked == 13 and table.get("1003").status_code == "1"
+        assert table.get("1000").status_code is None
+        assert table.get("없음") is None and "1049" in table
+
+        empty = SharedTable(publish(directory, "empty", [], SeoulOccupancy, version=1), SeoulOccupancy)
+        assert len(empty) == 0 and not empty
+        del table, empty
+    print("[OK] 공유 스냅샷 파일 왕복 (None 값, 빈 표)")
+
+
+def test_key_lookup_uses_file_index():
+    with tempfile.TemporaryDirectory() as directory:
+        codes = ["990", "1000", "가나", "ㄱ", "10", "A-1", "1000"]
+        records = SeoulOccupancy.from_rows([
+            {"PKLT_CD": code, "NOW_PRK_VHCL_CNT": i} for i, code in enumerate(codes)
+        ] + [{"PKLT_CD": None, "NOW_PRK_VHCL_CNT": 99}])
+        table = SharedTable(publish(directory, "seoul", records, SeoulOccupancy, version=1), SeoulOccupancy)
+        # 워커마다 키 dict를 만들지 않음
+        assert not hasattr(table, "_keys")
+        for code in set(codes):
+            assert table.get(code).code == code
+        # 같은 키는 마지막 행 (dict로 만들던 이전 동작과 같음)
+        assert table.get("1000").parked == 6
+        assert table.get("없음") is None and table.get(1000) is None and None not in table
+        assert sorted(table) == sorted(set(codes)) and len(table) == 8
+        del table
+    print("[OK] 키 조회: 파일의 정렬된 키 색인 이진 탐색 (한글/중복/None 키)")
+
+
+def test_reader_swaps_versions():
+    with tempfile.TemporaryDirectory() as directory:
+        reader = SharedSnapshotReader("seoul", directory, SeoulOccupancy, check_interval=0.0)
+        assert reader.get_index() is None and reader.data_age() is None
+
+        publish(directory, "seoul", make_occupancy(5, parked=1), SeoulOccupancy, version=1)
+        first = reader.get_index()
+        assert first.get("1000").parked == 1 and reader.version == 1
+        assert reader.get_index() is first
+
+        for parked in (2, 3, 4, 5):
+            publish(directory, "seoul", make_occupancy(5, parked=parked), SeoulOccupancy, version=parked)
+        latest = reader.get_index()
+        assert latest is not first and latest.get("1000").parked == 5 and reader.version == 2
+        # 교체 전 표를 들고 있던 조회는 그대로 읽을 수 있음
+        assert first.get("1004").parked == 5
+        files = [name for name in os.listdir(directory) if name.endswith(".bin")]
+        assert len(files) <= 4
+        assert reader.row_count == 5 and reader.data_age() < 60
+        del first, latest, reader
+    print(f"[OK] 새 버전 교체, 이전 표 유지, 오래된 파일 정리 (남은 파일 {len(files)}개)")
+
+
+def test_other_process_reads_snapshot():
+    with tempfile.TemporaryDirectory() as directory:
+        publish(directory, "seoul", make_occupancy(20), SeoulOccupancy, version=3)
+        code = (
+            "from src.records import SeoulOccupancy\n"
+            "from src.shared_snapshot import SharedSnapshotReader\n"
+            f"reader = SharedSnapshotReader('seoul', {directory!r}, SeoulOccupancy)\n"
+            "print(reader.get_index().get('1019').parked)\n"
+        )
+        root = os.path.dirname(os.path.abspath(__file__))
+        result = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, timeout=60)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "29"
+    print("[OK] 다른 프로세스에서 같은 스냅샷 읽기")
+
+
+def test_server_realtime_from_shared_snapshot():
+    master_rows = [{"PKLT_CD": "171721", "PKLT_NM": "세종로 공영주차장(시)", "ADDR": "종로구 세종로 80-1",
+                    "LAT": "37.5735", "LOT": "126.9769", "TPKCT": "100"}]
+    with tempfile.TemporaryDirectory() as directory:
+        publish(directory, "seoul", SeoulOccupancy.from_rows([
+            {"PKLT_CD": "171721", "NOW_PRK_VHCL_CNT": "40", "NOW_PRK_VHCL_UPDT_TM": "2025-12-10 10:24:30"}
+        ]), SeoulOccupancy, version=1)
+
+        original = server._seoul_master, server._seoul_snapshot
+        server._seoul_master = SnapshotStore(
+            "test_master", lambda: master_rows,
+            index_builder=lambda r: LotMatcher(r, "PKLT_NM", ("ADDR",), "LAT", "LOT")
+        )
+        server._seoul_snapshot = SharedSnapshotReader("seoul", directory, SeoulOccupancy)
+        try:
+            entry = server._build_parking_entry(
+                {"place_name": "세종로공영주차장", "address_name": "서울 종로구 세종로 80-1",
+                 "x": "126.9770", "y": "37.5736"}
+            )
+        finally:
+            server._seoul_master.stop()
+            server._seoul_master, server._seoul_snapshot = original
+
+    assert entry["available_spots"] == 60
+    assert entry["data_age_seconds"] is not None
+    print(f"[OK] 공유 스냅샷으로 서울 실시간 정보: {entry['available_spots']}/{entry['total_spots']}")
+
+
+class LateSyncedMasterDB:
+    """갱신 프로세스가 아직 동기화하지 않은 기본 정보 DB"""
+
+    def __init__(self):
+        self.tables = {"seoul": [], "gyeonggi": []}
+
+    def rows(self, region):
+        return list(self.tables[region])
+
+
+def test_reader_cold_start_retries_empty_master():
+    db = LateSyncedMasterDB()
+    original = server._SNAPSHOT_ROLE, server._master_db
+    server._SNAPSHOT_ROLE = "reader"
+    server._master_db = lambda: db
+    master = SnapshotStore("test_master", lambda: server._master_rows("seoul"), ttl=3600, min_interval=0.05)
+    try:
+        assert master.refresh() is False and master.get_rows() == []
+        # reload TTL이 아니라 최소 간격 뒤에 다시 시도
+        assert master._next_refresh_at - time.time() < 1
+        try:
+            server._load_gyeonggi_rows()
+        except LookupError:
+            pass
+        else:
+            raise AssertionError("동기화 전 경기 기본 정보가 빈 스냅샷으로 적재됨")
+
+        # 갱신 프로세스가 DB를 채우면 reload TTL(3600초)을 기다리지 않고 다음 시도에서 적재
+        db.tables["seoul"] = [{"PKLT_CD": "171721", "PKLT_NM": "세종로 공영주차장(시)"}]
+        db.tables["gyeonggi"] = [{"PARKPLC_NM": "수원시청", "REFINE_WGS84_LAT": "37.26"}]
+        assert master.refresh() is True and len(master.get_rows()) == 1
+        assert len(server._load_gyeonggi_rows()) == 1
+    finally:
+        master.stop()
+        server._SNAPSHOT_ROLE, server._master_db = original
+    print("[OK] reader 콜드 스타트: 빈 기본 정보 DB는 실패로 보고 최소 간격 후 재시도")
+
+
+if __name__ == "__main__":
+    test_publish_and_map_roundtrip()
+    test_key_lookup_uses_file_index()
+    test_reader_swaps_versions()
+    test_other_process_reads_snapshot()
+    test_server_realtime_from_shared_snapshot()
+    test_reader_cold_start_retries_empty_master()
@@ -0,0 +1,85 @@
+"""
+동일 요청 병합(single-flight) 테스트 (네트워크 불필요)
+- 동시에 들어온 같은 요청은 실제 호출 1회로 병합
+- 다른 파라미터는 병합하지 않음
+- 실패도 대기 중인 호출에 그대로 전달
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.api_clients.singleflight import SingleFlight, coalesce_requests
+
+
+class SlowClient:
+    BASE_URL = "http://stub"
+    api_key = "test"
+
+    def __init__(self):
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    @coalesce_requests("test")
+    def _make_request(self, endpoint, params, timeout=10):
+        with self.lock:
+            self.calls += 1
+        time.sleep(0.1)
+        return {"status": "success", "data": {"endpoint": endpoint, "params": dict(params)}}
+
+
+def test_concurrent_identical_requests_coalesce():
+    client = SlowClient()
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        results = list(executor.map(
+            lambda _: client._make_request("/keyword.json", {"x": 127.0, "y": 37.5}), range(10)
+        ))
+
+    assert client.calls == 1
+    assert all(result is results[0] for result in results)
+    print(f"[OK] 동시 요청 10건 → 실제 호출 {client.calls}회")
+
+
+def test_different_params_not_coalesced():
+    client = SlowClient()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda i: client._make_request("/keyword.json", {"page": i}), range(4)))
+
+    assert client.calls == 4
+    print("[OK] 다른 파라미터는 개별 호출")
+
+
+def test_error_is_shared():
+    group = SingleFlight()
+    started = threading.Event()
+
+    def failing():
+        started.set()
+        time.sleep(0.1)
+        raise TimeoutError("timeout")
+
+    errors = []
+
+    def run():
+        try:
+            group.do("key", failing)
+        except TimeoutError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=run)
+    leader.start()
+    started.wait()
+    follower = threading.Thread(target=run)
+    follower.start()
+    leader.join()
+    follower.join()
+
+    assert len(errors) == 2 and errors[0] is errors[1]
+    assert group.in_flight() == 0
+    print("[OK] 실패 결과 공유 후 해제")
+
+
+if __name__ == "__main__":
+    test_concurrent_identical_requests_coalesce()
+    test_different_params_not_coalesced()
+    test_error_is_shared()
@@ -0,0 +1,183 @@
+"""
+스냅샷 저장소 테스트 (네트워크 불필요)
+- 최초 1회 적재 후 메모리에서 제공
+- 적재 실패 시 기존 스냅샷 유지
+- 업데이트 시각 기준 다음 갱신 시점 계산
+- 주차장 코드 + 업데이트 시각 기준 증분 갱신
+- stale-while-revalidate: 느린 원천 API를 기다리지 않고 마지막 스냅샷 제공
+"""
+
+import threading
+import time
+
+from src.snapshot import SnapshotStore, parse_update_time
+
+
+def test_snapshot_loads_once():
+    """여러 번 조회해도 loader는 한 번만 호출"""
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return [{"PKLT_NM": "세종로 공영주차장"}]
+
+    store = SnapshotStore("test", loader, ttl=60)
+    try:
+        for _ in range(10):
+            rows = store.get_rows()
+        assert rows == [{"PKLT_NM": "세종로 공영주차장"}]
+        assert len(calls) == 1
+        print(f"[OK] loader 호출 횟수: {len(calls)}")
+    finally:
+        store.stop()
+
+
+def test_snapshot_keeps_rows_on_failure():
+    """갱신 실패 시 마지막 정상 스냅샷 유지"""
+    state = {"fail": False}
+
+    def loader():
+        if state["fail"]:
+            raise ConnectionError("down")
+        return [{"PKLT_NM": "A"}]
+
+    store = SnapshotStore("test", loader, ttl=60)
+    try:
+        store.get_rows()
+        state["fail"] = True
+        assert store.refresh() is False
+        assert store.get_rows() == [{"PKLT_NM": "A"}]
+        print("[OK] 실패 시 기존 스냅샷 유지")
+    finally:
+        store.stop()
+
+
+def test_snapshot_aligns_to_update_time():
+    """최신 NOW_PRK_VHCL_UPDT_TM + TTL 시점에 갱신 예약"""
+    store = SnapshotStore("test", lambda: [], ttl=300, min_interval=10,
+                          update_field="NOW_PRK_VHCL_UPDT_TM")
+    now = time.time()
+    latest = now - 100
+    stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(latest + 9 * 3600))
+    rows = [{"NOW_PRK_VHCL_UPDT_TM": stamp}]
+
+    assert abs(parse_update_time(stamp) - int(latest)) < 1
+    next_at = store._compute_next_refresh(rows, now)
+    assert abs(next_at - (int(latest) + 300)) < 1
+    print(f"[OK] 다음 갱신까지 {next_at - now:.0f}초")
+
+
+def test_snapshot_delta_refresh():
+    """바뀐 행만 반영하고, 바뀌지 않은 행은 기존 객체 재사용"""
+    state = {"rows": [
+        {"PKLT_CD": "A", "NOW_PRK_VHCL_CNT": 1, "NOW_PRK_VHCL_UPDT_TM": "2025-12-10 10:00:00"},
+        {"PKLT_CD": "B", "NOW_PRK_VHCL_CNT": 2, "NOW_PRK_VHCL_UPDT_TM": "2025-12-10 10:00:00"},
+        {"PKLT_CD": "C", "NOW_PRK_VHCL_CNT": 3, "NOW_PRK_VHCL_UPDT_TM": "2025-12-10 10:00:00"},
+    ]}
+    builds, updates = [], []
+
+    def build(rows):
+        builds.append(len(rows))
+        return {row["PKLT_CD"]: row for row in rows}
+
+    def update(index, changed, removed):
+        updates.append(([row["PKLT_CD"] for row in changed], removed))
+        for row in changed:
+            index[row["PKLT_CD"]] = row
+        for key in removed:
+            index.pop(key, None)
+        return index
+
+    store = SnapshotStore("test", lambda: [dict(r) for r in state["rows"]], ttl=60,
+                          update_field="NOW_PRK_VHCL_UPDT_TM", index_builder=build,
+                          key_field="PKLT_CD", index_updater=update)
+    try:
+        store.get_rows()
+        first = store.get_index()
+        version = store.version
+
+        # 변화 없음: 인덱스/버전 그대로
+        assert store.refresh()
+        assert store.version == version and updates == []
+
+        # B 갱신, C 삭제, D 추가
+        state["rows"] = [
+            state["rows"][0],
+            {"PKLT_CD": "B", "NOW_PRK_VHCL_CNT": 5, "NOW_PRK_VHCL_UPDT_TM": "2025-12-10 10:05:00"},
+            {"PKLT_CD": "D", "NOW_PRK_VHCL_CNT": 0, "NOW_PRK_VHCL_UPDT_TM": "2025-12-10 10:05:00"},
+        ]
+        assert store.refresh()
+        index = store.get_index()
+        assert builds == [3]
+        assert updates == [(["B", "D"], ["C"])]
+        assert index["A"] is first["A"]
+        assert index["B"]["NOW_PRK_VHCL_CNT"] == 5
+        assert "C" not in index
+        assert [r["PKLT_CD"] for r in store.get_rows()] == ["A", "B", "D"]
+        assert store.version == version + 1
+        print(f"[OK] 증분 갱신: 버전 {version} → {store.version}, 변경 {updates[0]}")
+    finally:
+        store.stop()
+
+
+def test_snapshot_stale_while_revalidate():
+    """초기 스냅샷을 바로 제공하고 갱신은 백그라운드에서 처리"""
+    release = threading.Event()
+
+    def slow_loader():
+        release.wait(5)
+        return [{"PKLT_CD": "A", "NOW_PRK_VHCL_CNT": 9}]
+
+    saved_at = time.time() - 120
+    store = SnapshotStore("test", slow_loader, ttl=60, stale_while_revalidate=True, max_wait=0.1,
+                          seed_loader=lambda: (saved_at, [{"PKLT_CD": "A", "NOW_PRK_VHCL_CNT": 1}]))
+    try:
+        start = time.perf_counter()
+        rows = store.get_rows()
+        elapsed = time.perf_counter() - start
+        assert rows == [{"PKLT_CD": "A", "NOW_PRK_VHCL_CNT": 1}]
+        assert elapsed < 0.1
+        assert 119 <= store.data_age() < 130
+
+        release.set()
+        for _ in range(100):
+            if store.get_rows()[0]["NOW_PRK_VHCL_CNT"] == 9:
+                break
+            time.sleep(0.01)
+        assert store.get_rows() == [{"PKLT_CD": "A", "NOW_PRK_VHCL_CNT": 9}]
+        assert store.data_age() < 5
+        print(f"[OK] 초기 스냅샷 즉시 제공 ({elapsed * 1000:.1f}ms), 백그라운드 갱신 반영")
+    finally:
+        store.stop()
+
+
+def test_snapshot_stale_while_revalidate_bounded_wait():
+    """스냅샷이 없으면 max_wait까지만 기다리고 빈 결과 반환"""
+    release = threading.Event()
+
+    def slow_loader():
+        release.wait(5)
+        return [{"PKLT_CD": "A"}]
+
+    store = SnapshotStore("test", slow_loader, ttl=60, stale_while_revalidate=True, max_wait=0.2,
+                          seed_loader=lambda: (time.time() - 7200, [{"PKLT_CD": "old"}]), max_seed_age=3600)
+    try:
+        start = time.perf_counter()
+        assert store.get_rows() == []
+        assert store.get_index() is None
+        elapsed = time.perf_counter() - start
+        assert elapsed < 1.0
+        assert store.data_age() is None
+        release.set()
+        print(f"[OK] 스냅샷 없음: {elapsed:.2f}초 대기 후 빈 결과 (오래된 초기 스냅샷 무시)")
+    finally:
+        store.stop()
+
+
+if __name__ == "__main__":
+    test_snapshot_loads_once()
+    test_snapshot_keeps_rows_on_failure()
+    test_snapshot_aligns_to_update_time()
+    test_snapshot_delta_refresh()
+    test_snapshot_stale_while_revalidate()
+    test_snapshot_stale_while_revalidate_bounded_wait()
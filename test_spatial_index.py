@@ -0,0 +1,49 @@
+"""
+주차장 좌표 격자 색인 / 좌표 매칭 테스트 (네트워크 불필요)
+- 반경 검색 결과가 거리순이고 반경 밖은 제외
+- 좌표가 가까운 주차장 우선 매칭, 좌표가 없으면 이름 매칭
+"""
+
+from src.matching import GridIndex, LotMatcher, haversine
+
+ROWS = [
+    {"PKLT_NM": "세종로 공영주차장(시)", "ADDR": "종로구 세종로 80-1", "LAT": "37.5735", "LOT": "126.9769"},
+    {"PKLT_NM": "종묘주차장 공영(시)", "ADDR": "종로구 훈정동 2-0", "LAT": "37.5714", "LOT": "126.9941"},
+    {"PKLT_NM": "좌표없는 주차장", "ADDR": "종로구 어딘가", "LAT": "", "LOT": "0"},
+]
+
+
+def test_haversine():
+    # 서울시청 ↔ 광화문 약 1km
+    distance = haversine(37.5663, 126.9779, 37.5759, 126.9768)
+    assert 1000 < distance < 1150
+    print(f"[OK] 거리 계산: {distance:.0f}m")
+
+
+def test_grid_within_and_nearest():
+    index = GridIndex(ROWS, "LAT", "LOT", cell_size_m=100)
+    assert len(index) == 2
+
+    found = index.within(37.5736, 126.9770, 2000)
+    assert [row["PKLT_NM"] for _, row in found] == ["세종로 공영주차장(시)", "종묘주차장 공영(시)"]
+    assert index.nearest(37.5736, 126.9770, 50)[1] is ROWS[0]
+    assert index.nearest(37.60, 127.05, 500) is None
+    print("[OK] 반경/최근접 검색")
+
+
+def test_lot_matcher_prefers_coordinates():
+    matcher = LotMatcher(ROWS, "PKLT_NM", ("ADDR",), "LAT", "LOT")
+
+    # 이름 표기가 달라도 같은 위치의 공영주차장 매칭
+    assert matcher.match("세종로주차장", "", 37.5736, 126.9770) is ROWS[0]
+    # 근처에 이름이 전혀 다른 주차장만 있으면 매칭하지 않음
+    assert matcher.match("광화문 빌딩 주차장", "", 37.5745, 126.9770) is None
+    # 좌표가 없으면 이름 매칭
+    assert matcher.match("종묘 주차장") is ROWS[1]
+    print("[OK] 좌표 우선 매칭")
+
+
+if __name__ == "__main__":
+    test_haversine()
+    test_grid_within_and_nearest()
+    test_lot_matcher_prefers_coordinates()
@@ -0,0 +1,216 @@
+"""
+지도 타일 캐시 테스트 (네트워크 불필요)
+- geohash 인코딩/경계
+- 반경을 덮는 타일 계산
+- 같은 동네의 조금씩 다른 좌표가 타일 캐시를 공유 (두 번째 검색은 API 미호출)
+- 캐시가 빈 지역, 빠진 타일이 많은 경우, 페이지 한도를 넘는 타일은 거리순 검색으로 대체
+- 카탈로그가 없어도 반복 검색으로 타일 캐시가 채워짐 (응답을 기다리게 하지 않는 백그라운드 작업)
+"""
+
+import asyncio
+
+from src.cache import TileCache
+from src.cache.tile_cache import geohash_bounds, geohash_encode
+from src.matching import haversine
+from src.search import AdaptiveParkingSearch, wait_for_tile_warming
+
+GANGNAM = (37.4979, 127.0276)
+
+
+def test_geohash():
+    assert geohash_encode(57.64911, 10.40744, 11) == "u4pruydqqvj"
+    south, west, north, east = geohash_bounds(geohash_encode(*GANGNAM, 6))
+    assert south <= GANGNAM[0] <= north and west <= GANGNAM[1] <= east
+    print(f"[OK] geohash {geohash_encode(*GANGNAM, 6)}: {north - south:.4f}° x {east - west:.4f}°")
+
+
+def test_covering_tiles_cover_circle():
+    cache = TileCache(precision=6)
+    tiles = set(cache.covering_tiles(*GANGNAM, 800))
+    for i in range(36):
+        for fraction in (0.3, 0.99):
+            lat = GANGNAM[0] + fraction * 800 / 111320 * (1 if i % 2 else -1) * (i % 9) / 8
+            lng = GANGNAM[1] + fraction * 800 / 88200 * (1 if i % 3 else -1) * (i % 7) / 6
+            if haversine(GANGNAM[0], GANGNAM[1], lat, lng) <= 800:
+                assert geohash_encode(lat, lng, 6) in tiles
+    print(f"[OK] 반경 800m → 타일 {len(tiles)}개")
+
+
+class FakeKakaoCategory:
+    """rect 범위 안 문서를 돌려주는 카카오 카테고리 검색 (+ 거리순 키워드 검색)"""
+
+    def __init__(self, documents):
+        self.documents = documents
+        self.calls = []
+        self.keyword_calls = 0
+
+    async def search_category(self, category_group_code, rect=None, page=1, size=15, **kwargs):
+        self.calls.append((rect, page))
+        west, south, east, north = (float(v) for v in rect.split(","))
+        found = [d for d in self.documents
+                 if south <= float(d["y"]) < north and west <= float(d["x"]) < east]
+        return self._page(found, page, size)
+
+    async def search_place(self, query, x=None, y=None, radius=None, page=1, size=15, **kwargs):
+        self.keyword_calls += 1
+        distances = [(haversine(y, x, float(d["y"]), float(d["x"])), d) for d in self.documents]
+        found = [dict(d, distance=str(int(m))) for m, d in sorted(distances, key=lambda p: p[0]) if m <= radius]
+        return self._page(found, page, size)
+
+    @staticmethod
+    def _page(found, page, size):
+        pageable = min(len(found), 45 * size)
+        start = (page - 1) * size
+        return {"status": "success", "data": {
+            "documents": found[start:start + size],
+            "meta": {"total_count": len(found), "pageable_count": pageable,
+                     "is_end": start + size >= pageable},
+        }}
+
+
+def make_grid_documents(center, count=400, step=0.0004):
+    documents = []
+    side = int(count ** 0.5)
+    for i in range(count):
+        lat = center[0] + (i // side - side / 2) * step
+        lng = center[1] + (i % side - side / 2) * step
+        documents.append({"id": str(i), "place_name": f"주차장{i}", "address_name": "서울 강남구",
+                          "x": f"{lng:.6f}", "y": f"{lat:.6f}"})
+    return documents
+
+
+def warm_tiles(cache, kakao, tiles):
+    """이전 검색으로 받아 둔 것처럼 타일을 캐시에 채움 (카카오 호출 수에는 넣지 않음)"""
+    for tile in tiles:
+        rect_documents = asyncio.run(kakao.search_category("PK6", rect=TileCache.rect(tile), size=10000))
+        cache.set(tile, rect_documents["data"]["documents"])
+    kakao.calls.clear()
+
+
+def search_and_warm(engine, lat, lng):
+    """검색 후 백그라운드 타일 채우기까지 같은 이벤트 루프에서 기다림"""
+    async def run():
+        result = await engine.search(lat, lng)
+        await wait_for_tile_warming()
+        return result
+    return asyncio.run(run())
+
+
+def test_cold_search_uses_radius_search():
+    kakao = FakeKakaoCategory(make_grid_documents(GANGNAM))
+    cache = TileCache(precision=6, max_radius=1000)
+    engine = AdaptiveParkingSearch(kakao, radii=(500, 1000), target=10, tile_cache=cache)
+
+    result = search_and_warm(engine, *GANGNAM)
+    assert len(result) == 10 and kakao.keyword_calls == 1
+    # 응답은 거리순 검색으로 하고, 한도 안에서 가까운 타일만 받아 둠
+    assert len({rect for rect, _ in kakao.calls}) <= engine.max_tile_fetches
+    print(f"[OK] 캐시가 빈 지역: 거리순 검색 {kakao.keyword_calls}회 + 타일 {cache.stats()['tiles']}개 미리 받음")
+
+
+def test_cold_area_warms_without_catalog():
+    kakao = FakeKakaoCategory(make_grid_documents(GANGNAM, step=0.0015))
+    cache = TileCache(precision=6, max_radius=1000)
+    engine = AdaptiveParkingSearch(kakao, radii=(500, 1000), target=10, tile_cache=cache)
+    tiles = cache.covering_tiles(*GANGNAM, 500)
+
+    # 카탈로그 없이 같은 동네를 반복 검색하면 검색마다 타일이 채워짐
+    for i in range(10):
+        result = search_and_warm(engine, GANGNAM[0] + 0.0002 * (i % 3), GANGNAM[1] - 0.0002 * (i % 2))
+        assert len(result) == 10
+    calls, keyword_calls = len(kakao.calls), kakao.keyword_calls
+    assert keyword_calls < 10 and cache.lookup(tiles)[1] == []
+
+    # 다 채워진 뒤에는 카카오 호출 없이 타일로 응답
+    search_and_warm(engine, *GANGNAM)
+    stats = cache.stats()
+    assert len(kakao.calls) == calls and kakao.keyword_calls == keyword_calls
+    assert stats["hits"] > 0 and stats["hit_ratio"] > 0.5
+    print(f"[OK] 카탈로그 없이 반복 검색: 거리순 검색 {keyword_calls}회 후 타일 적중률 {stats['hit_ratio']:.0%}")
+
+
+def test_nearby_queries_share_tiles():
+    kakao = FakeKakaoCategory(make_grid_documents(GANGNAM, step=0.0015))
+    cache = TileCache(precision=6, max_radius=1000)
+    engine = AdaptiveParkingSearch(kakao, radii=(500, 1000), target=10, tile_cache=cache)
+    tiles = cache.covering_tiles(*GANGNAM, 1000)
+    center = geohash_encode(*GANGNAM, 6)
+    warm_tiles(cache, kakao, [tile for tile in tiles if tile != center])
+
+    # 빠진 타일(가운데)만 받아 채움
+    first = asyncio.run(engine.search(*GANGNAM))
+    assert {rect for rect, _ in kakao.calls} == {TileCache.rect(center)}
+    assert len(kakao.calls) <= engine.max_tile_pages and kakao.keyword_calls == 0
+    first_calls = len(kakao.calls)
+    assert len(first) == 10
+    assert all(int(d["distance"]) <= 500 for d in first)
+    assert [int(d["distance"]) for d in first] == sorted(int(d["distance"]) for d in first)
+
+    # 약 50~150m 떨어진 다른 사용자들의 검색
+    for d_lat, d_lng in ((0.0005, 0.0003), (-0.0009, 0.0004), (0.0002, -0.0012)):
+        result = asyncio.run(engine.search(GANGNAM[0] + d_lat, GANGNAM[1] + d_lng))
+        assert len(result) == 10
+
+    stats = cache.stats()
+    assert len(kakao.calls) == first_calls and kakao.keyword_calls == 0
+    assert stats["hit_ratio"] > 0.6
+    print(f"[OK] 첫 검색 타일 요청 {first_calls}회, 이후 0회, 적중률 {stats['hit_ratio']:.0%}")
+
+
+def test_tile_fetches_are_capped():
+    kakao = FakeKakaoCategory(make_grid_documents(GANGNAM, step=0.0015))
+    cache = TileCache(precision=6, max_radius=1000)
+    engine = AdaptiveParkingSearch(kakao, radii=(500,), target=10, tile_cache=cache, max_tile_fetches=1)
+    tiles = cache.covering_tiles(*GANGNAM, 500)
+    warm_tiles(cache, kakao, tiles[:1])
+
+    # 빠진 타일이 검색당 한도보다 많으면 거리순 검색으로 응답하고, 한도만큼만 타일을 받아 둠
+    result = search_and_warm(engine, *GANGNAM)
+    assert len(result) == 10 and kakao.keyword_calls == 1
+    assert len({rect for rect, _ in kakao.calls}) == 1
+    print(f"[OK] 빠진 타일 {len(tiles) - 1}개 > 한도 1개: 거리순 검색")
+
+
+def test_truncated_tile_falls_back_to_radius_search():
+    # 가운데 타일 하나에 주차장이 수백 개 (타일당 3페이지로 다 받을 수 없음)
+    kakao = FakeKakaoCategory(make_grid_documents(GANGNAM, count=900, step=0.0002))
+    cache = TileCache(precision=6, max_radius=1000)
+    engine = AdaptiveParkingSearch(kakao, radii=(500,), target=10, tile_cache=cache)
+    tiles = cache.covering_tiles(*GANGNAM, 500)
+    center = geohash_encode(*GANGNAM, 6)
+    warm_tiles(cache, kakao, [tile for tile in tiles if tile != center])
+
+    result = asyncio.run(engine.search(*GANGNAM))
+    assert len(result) == 10 and [int(d["distance"]) for d in result] == sorted(int(d["distance"]) for d in result)
+    # 첫 페이지로 한도를 넘는 걸 확인하고 남은 페이지는 받지 않음
+    assert len(kakao.calls) == 1 and kakao.keyword_calls == 1
+    assert cache.has_truncated([center])
+
+    # 다음 검색은 타일을 다시 받지 않고 바로 거리순 검색
+    asyncio.run(engine.search(GANGNAM[0] + 0.0003, GANGNAM[1]))
+    assert len(kakao.calls) == 1 and kakao.keyword_calls == 2
+    print("[OK] 페이지 한도를 넘는 타일: 거리순 검색으로 대체, 다음 검색부터 타일 요청 생략")
+
+
+def test_tile_ttl_and_size():
+    cache = TileCache(ttl=0.0, max_tiles=2)
+    cache.set("wydm9q", [])
+    assert cache.lookup(["wydm9q"]) == ({}, ["wydm9q"])
+
+    cache = TileCache(max_tiles=2)
+    for tile in ("wydm9q", "wydm9r", "wydm9x"):
+        cache.set(tile, [])
+    cached, missing = cache.lookup(["wydm9q", "wydm9r", "wydm9x"])
+    assert missing == ["wydm9q"]
+    print("[OK] 타일 TTL 만료 / LRU 크기 제한")
+
+
+if __name__ == "__main__":
+    test_geohash()
+    test_covering_tiles_cover_circle()
+    test_cold_search_uses_radius_search()
+    test_cold_area_warms_without_catalog()
+    test_nearby_queries_share_tiles()
+    test_tile_fetches_are_capped()
+    test_truncated_tile_falls_back_to_radius_search()
+    test_tile_ttl_and_size()